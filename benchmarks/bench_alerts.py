@@ -0,0 +1,97 @@
+"""
+Benchmark de las alertas por umbral.
+Compara el coste diario de detectar las alertas que empiezan a cumplirse
+con AlertMonitor.tick() frente a revisar todos los items tras cada
+update_quality() (recordando qué pares ya se cumplían el día anterior). Las
+alertas a futuro (`within`) se evalúan en el escaneo simulando una copia del
+item, como haría un script que no conoce las curvas.
+
+Uso (desde la raíz del repositorio):
+    python -m benchmarks.bench_alerts [items] [dias]
+"""
+
+import random
+import sys
+import time
+
+from src.alerts import AlertMonitor, Threshold
+from src.fuzz import generate_inventory
+from src.gilded_rose import GildedRose, Item, UpdaterFactory
+
+
+ALERTS = [
+    Threshold("backstage_5_dias", "sell_in", at_most=5, prefix="Backstage passes"),
+    Threshold("calidad_0_en_3_dias", "quality", at_most=0, within=3),
+    Threshold("calidad_maxima", "quality", at_least=50),
+]
+
+
+def scan(items, active):
+    """Revisa todos los items; retorna los pares que empiezan a cumplirse"""
+    triggered = []
+    for alert in ALERTS:
+        for item in items:
+            if not alert.applies_to(item):
+                continue
+            state = item
+            if alert.within:
+                state = Item(item.name, item.sell_in, item.quality)
+                updater = UpdaterFactory.get_updater(state)
+                for _ in range(alert.within):
+                    updater.update(state)
+            value = getattr(state, alert.field)
+            holds = ((alert.at_most is None or value <= alert.at_most)
+                     and (alert.at_least is None or value >= alert.at_least))
+            key = (alert.name, id(item))
+            if holds and key not in active:
+                active.add(key)
+                triggered.append((alert, item))
+            elif not holds:
+                active.discard(key)
+    return triggered
+
+
+def run(rows, days, check):
+    """Tiempo total de `check` (sin contar update_quality) y alertas disparadas"""
+    items = [Item(*row) for row in rows]
+    gilded_rose = GildedRose(items)
+    start = time.perf_counter()
+    check = check(items)
+    setup = time.perf_counter() - start
+    elapsed = 0.0
+    triggered = 0
+    for _ in range(days):
+        gilded_rose.update_quality()
+        start = time.perf_counter()
+        triggered += len(check())
+        elapsed += time.perf_counter() - start
+    return setup, elapsed, triggered
+
+
+def main():
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    days = int(sys.argv[2]) if len(sys.argv) > 2 else 60
+    rows = generate_inventory(random.Random(42), size)
+
+    def scanner(items):
+        active = set()
+        scan(items, active)
+        return lambda: scan(items, active)
+
+    def monitor(items):
+        return AlertMonitor(items, ALERTS).tick
+
+    scan_setup, scan_time, scan_count = run(rows, days, scanner)
+    index_setup, index_time, index_count = run(rows, days, monitor)
+
+    print(f"{size} items, {days} dias, {len(ALERTS)} alertas")
+    print(f"{'Metodo':<18} {'Preparar (s)':>13} {'Por dia (ms)':>13} {'Alertas':>8}")
+    print(f"{'-'*55}")
+    print(f"{'Escaneo completo':<18} {scan_setup:>13.3f} "
+          f"{scan_time / days * 1000:>13.3f} {scan_count:>8}")
+    print(f"{'AlertMonitor':<18} {index_setup:>13.3f} "
+          f"{index_time / days * 1000:>13.3f} {index_count:>8}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+"""
+Benchmark de throughput con 1 a N hilos escritores mientras un hilo de fondo
+ejecuta update_quality() sin pausa. Compara ConcurrentInventory (cola de
+mutaciones) con el mismo dict de items por id protegido por un único lock
+global, donde los escritores esperan a que termine cada tick. Se informan
+las mutaciones aplicadas por segundo (no las encoladas) y los ticks por
+segundo.
+
+Uso (desde la raíz del repositorio):
+    python -m benchmarks.bench_concurrent [max_escritores] [segundos] [items]
+"""
+
+import sys
+import threading
+import time
+
+from src.concurrent_inventory import ConcurrentInventory
+from src.gilded_rose import Item, UpdaterFactory
+
+
+class LockedGildedRose:
+    """Referencia: mismo dict por id que ConcurrentInventory con un lock global"""
+
+    def __init__(self, items):
+        self.items = {id(item): item for item in items}
+        self.lock = threading.Lock()
+        self.applied = 0
+
+    def add(self, item):
+        with self.lock:
+            self.items[id(item)] = item
+            self.applied += 1
+
+    def remove(self, item):
+        with self.lock:
+            if self.items.pop(id(item), None) is not None:
+                self.applied += 1
+
+    def update_quality(self):
+        with self.lock:
+            get_updater = UpdaterFactory.get_updater
+            for item in self.items.values():
+                get_updater(item).update(item)
+
+
+def run(inventory, writers, seconds):
+    """Retorna (mutaciones aplicadas por segundo, ticks por segundo).
+
+    Solo cuentan las mutaciones ya aplicadas al terminar la medición, no
+    las que siguen en la cola."""
+    stop = threading.Event()
+    ticks = [0]
+
+    def writer(index):
+        pending = []
+        while not stop.is_set():
+            item = Item("Writer %s" % index, 30, 20)
+            inventory.add(item)
+            pending.append(item)
+            if len(pending) > 50:
+                inventory.remove(pending.pop(0))
+
+    def ticker():
+        while not stop.is_set():
+            inventory.update_quality()
+            ticks[0] += 1
+
+    threads = [threading.Thread(target=writer, args=(i,)) for i in range(writers)]
+    threads.append(threading.Thread(target=ticker))
+    applied = inventory.applied
+    for thread in threads:
+        thread.start()
+    time.sleep(seconds)
+    stop.set()
+    applied = inventory.applied - applied
+    done = ticks[0]
+    for thread in threads:
+        thread.join()
+    return applied / seconds, done / seconds
+
+
+def main():
+    max_writers = int(sys.argv[1]) if len(sys.argv) > 1 else 8
+    seconds = float(sys.argv[2]) if len(sys.argv) > 2 else 1.0
+    size = int(sys.argv[3]) if len(sys.argv) > 3 else 5000
+
+    def base_items():
+        return [Item("+5 Dexterity Vest", 10 ** 6, 50) for _ in range(size)]
+
+    print(f"{size} items base, {seconds:.1f} s por medicion")
+    print(f"{'Escritores':>10} {'Lock global mut/s':>18} {'ticks/s':>8} "
+          f"{'Cola mut/s':>12} {'ticks/s':>8}")
+    print(f"{'-'*60}")
+    writers = 1
+    while writers <= max_writers:
+        locked_ops, locked_ticks = run(LockedGildedRose(base_items()), writers, seconds)
+        queued_ops, queued_ticks = run(ConcurrentInventory(base_items()), writers, seconds)
+        print(f"{writers:>10} {locked_ops:>18.0f} {locked_ticks:>8.1f} "
+              f"{queued_ops:>12.0f} {queued_ticks:>8.1f}")
+        writers *= 2
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+"""
+Generador de carga local para el modo daemon.
+Arranca `python -m src.daemon` en modo tubería, carga un inventario y envía
+una mezcla de ticks, consultas y mutaciones. Muestra la latencia de las
+peticiones (p50/p99) y los ticks por segundo, junto al coste de arrancar un
+proceso nuevo por día como referencia.
+
+Uso (desde la raíz del repositorio):
+    python -m benchmarks.bench_daemon [items] [peticiones]
+"""
+
+import json
+import random
+import subprocess
+import sys
+import time
+
+
+NAMES = [
+    "+5 Dexterity Vest",
+    "Aged Brie",
+    "Elixir of the Mongoose",
+    "Sulfuras, Hand of Ragnaros",
+    "Backstage passes to a TAFKAL80ETC concert",
+    "Conjured Mana Cake",
+]
+
+
+def percentile(samples, fraction):
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+
+class DaemonClient:
+    """Cliente mínimo que habla con el daemon por su stdin/stdout"""
+
+    def __init__(self):
+        self.process = subprocess.Popen(
+            [sys.executable, "-m", "src.daemon"],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            text=True,
+            bufsize=1,
+        )
+
+    def request(self, command):
+        self.process.stdin.write(json.dumps(command) + "\n")
+        return json.loads(self.process.stdout.readline())
+
+    def close(self):
+        self.request({"op": "shutdown"})
+        self.process.wait()
+
+
+def main():
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    requests = int(sys.argv[2]) if len(sys.argv) > 2 else 1000
+    rng = random.Random(42)
+
+    client = DaemonClient()
+    rows = [[rng.choice(NAMES), rng.randint(-5, 20), rng.randint(0, 50)] for _ in range(size)]
+    client.request({"op": "add", "items": rows})
+
+    latencies = {"tick": [], "query": [], "set": []}
+    for _ in range(requests):
+        op = rng.choice(("tick", "query", "set"))
+        if op == "tick":
+            command = {"op": "tick"}
+        elif op == "query":
+            command = {"op": "query", "name": rng.choice(NAMES)}
+        else:
+            command = {"op": "set", "index": rng.randrange(size), "quality": rng.randint(0, 50)}
+        start = time.perf_counter()
+        client.request(command)
+        latencies[op].append(time.perf_counter() - start)
+    client.close()
+
+    print(f"Inventario: {size} items, {requests} peticiones")
+    print(f"{'Operacion':<10} {'n':>6} {'p50 (ms)':>10} {'p99 (ms)':>10}")
+    print(f"{'-'*40}")
+    for op, samples in latencies.items():
+        if samples:
+            print(f"{op:<10} {len(samples):>6} "
+                  f"{percentile(samples, 0.5) * 1000:>10.3f} "
+                  f"{percentile(samples, 0.99) * 1000:>10.3f}")
+
+    ticks = latencies["tick"]
+    if ticks:
+        print(f"\nTicks por segundo (daemon): {len(ticks) / sum(ticks):.1f}")
+
+    start = time.perf_counter()
+    subprocess.run([sys.executable, "-m", "src.texttest_fixture", "1"],
+                   stdout=subprocess.DEVNULL, check=True)
+    print(f"Proceso nuevo por dia (texttest_fixture): "
+          f"{(time.perf_counter() - start) * 1000:.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
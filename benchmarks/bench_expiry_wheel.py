@@ -0,0 +1,60 @@
+"""
+Benchmark del motor con caducidades absolutas.
+Compara el tiempo de update_quality() de GildedRose, que visita todos los
+items cada día, con el de ExpiryWheel, que solo visita los items cuyo ritmo
+cambia ese día. Al final comprueba que ambos terminan en el mismo estado y
+cuenta cuántos items caducaron cada día sin escanear el inventario.
+
+Uso (desde la raíz del repositorio):
+    python -m benchmarks.bench_expiry_wheel [items] [dias]
+"""
+
+import random
+import sys
+import time
+
+from src.expiry_wheel import ExpiryWheel
+from src.fuzz import generate_inventory
+from src.gilded_rose import GildedRose, Item
+
+
+def run(engine, days, expired=None):
+    start = time.perf_counter()
+    for _ in range(days):
+        engine.update_quality()
+        if expired is not None:
+            expired.append(len(engine.newly_expired()))
+    return time.perf_counter() - start
+
+
+def main():
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    days = int(sys.argv[2]) if len(sys.argv) > 2 else 100
+    rows = generate_inventory(random.Random(42), size)
+
+    gilded_rose = GildedRose([Item(*row) for row in rows])
+    start = time.perf_counter()
+    wheel = ExpiryWheel(Item(*row) for row in rows)
+    setup = time.perf_counter() - start
+
+    reference_time = run(gilded_rose, days)
+    expired = []
+    wheel_time = run(wheel, days, expired)
+
+    same = all(
+        (a.sell_in, a.quality) == (b.sell_in, b.quality)
+        for a, b in zip(gilded_rose.items, wheel.items)
+    )
+    print(f"{size} items, {days} dias")
+    print(f"{'Motor':<12} {'Preparar (s)':>13} {'Por dia (ms)':>13}")
+    print(f"{'-'*40}")
+    print(f"{'GildedRose':<12} {'-':>13} {reference_time / days * 1000:>13.3f}")
+    print(f"{'ExpiryWheel':<12} {setup:>13.3f} {wheel_time / days * 1000:>13.3f}")
+    print(f"Speedup: {reference_time / wheel_time:.2f}x  "
+          f"Tramos recalculados: {wheel.rebased}  "
+          f"Caducados (max/dia): {max(expired)}  "
+          f"Mismo estado: {'si' if same else 'NO'}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+"""
+Benchmark del golden master comprimido frente al texto plano del fixture.
+Para un inventario grande y muchos días compara el tamaño en disco y el
+tiempo de generar y de verificar: texto completo (un archivo con todos los
+días, comparado regenerándolo entero) frente a bloques gzip con índice de
+hashes, generados con 1 y N procesos. También mide cuánto tarda la
+verificación en detenerse ante un motor que falla en el día 10.
+
+Uso (desde la raíz del repositorio):
+    python -m benchmarks.bench_golden_master [items] [dias] [procesos]
+"""
+
+import os
+import random
+import sys
+import tempfile
+import time
+
+from src.fuzz import generate_inventory
+from src.gilded_rose import GildedRose, Item
+from src.golden_master import HEADER, record, render_day, verify
+
+
+class BrokenOnDayTen(GildedRose):
+    """Motor con un error a partir del día 10, para medir la parada temprana"""
+
+    def __init__(self, items):
+        super().__init__(items)
+        self.day = 0
+
+    def update_quality(self):
+        super().update_quality()
+        self.day += 1
+        if self.day == 10:
+            self.items[0].quality += 1
+
+
+def fresh_items(rows):
+    return [Item(*row) for row in rows]
+
+
+def write_plain(path, rows, days):
+    items = fresh_items(rows)
+    gilded_rose = GildedRose(items)
+    with open(path, "w", encoding="utf-8") as out:
+        out.write(HEADER)
+        for day in range(days):
+            out.write(render_day(day, items))
+            gilded_rose.update_quality()
+
+
+def verify_plain(path, rows, days):
+    """Comparación tradicional: regenerar todo el texto y compararlo"""
+    items = fresh_items(rows)
+    gilded_rose = GildedRose(items)
+    with open(path, encoding="utf-8") as handle:
+        expected = handle.read()
+    parts = [HEADER]
+    for day in range(days):
+        parts.append(render_day(day, items))
+        gilded_rose.update_quality()
+    return "".join(parts) == expected
+
+
+def directory_size(path):
+    return sum(os.path.getsize(os.path.join(path, name)) for name in os.listdir(path))
+
+
+def timed(function, *args, **kwargs):
+    start = time.perf_counter()
+    result = function(*args, **kwargs)
+    return time.perf_counter() - start, result
+
+
+def main():
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    days = int(sys.argv[2]) if len(sys.argv) > 2 else 365
+    jobs = int(sys.argv[3]) if len(sys.argv) > 3 else os.cpu_count() or 1
+    rows = generate_inventory(random.Random(42), size)
+
+    with tempfile.TemporaryDirectory() as directory:
+        plain = os.path.join(directory, "plain.txt")
+        write_time, _ = timed(write_plain, plain, rows, days)
+        plain_verify_time, plain_ok = timed(verify_plain, plain, rows, days)
+        chunked = os.path.join(directory, "golden")
+        record_time, _ = timed(record, chunked, fresh_items(rows), days)
+        parallel = os.path.join(directory, "golden-parallel")
+        parallel_time, _ = timed(record, parallel, fresh_items(rows), days, jobs=jobs)
+        verify_time, mismatch = timed(verify, chunked)
+        broken_time, broken = timed(verify, chunked, BrokenOnDayTen)
+
+        print(f"{size} items, {days} dias, {jobs} procesos")
+        print(f"{'Formato':<22} {'MB':>8} {'Generar (s)':>12} {'Verificar (s)':>14}")
+        print(f"{'-'*59}")
+        print(f"{'Texto plano':<22} {os.path.getsize(plain) / 2 ** 20:>8.2f} "
+              f"{write_time:>12.3f} {plain_verify_time:>14.3f}")
+        print(f"{'Bloques gzip':<22} {directory_size(chunked) / 2 ** 20:>8.2f} "
+              f"{record_time:>12.3f} {verify_time:>14.3f}")
+        print(f"{'Bloques gzip paralelo':<22} {directory_size(parallel) / 2 ** 20:>8.2f} "
+              f"{parallel_time:>12.3f} {'-':>14}")
+        print(f"Coinciden: texto plano {plain_ok}, golden master {mismatch is None}")
+        print(f"Motor con error en el dia 10: detectado en el dia {broken.day} "
+              f"en {broken_time:.3f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""
+Benchmark de la ingesta con nombres internados y códigos de categoría.
+Simula un inventario cargado desde JSON (cada fila trae su propia copia del
+nombre) y compara memoria de los nombres y tiempo de update_quality() entre
+GildedRose y el inventario ingerido, junto con la tasa de aciertos de la
+caché de clasificación.
+
+Uso (desde la raíz del repositorio):
+    python -m benchmarks.bench_ingestion [items] [dias]
+"""
+
+import json
+import random
+import sys
+import time
+import tracemalloc
+
+from src.fuzz import generate_inventory
+from src.gilded_rose import GildedRose, Item
+from src.ingestion import Ingestor
+
+
+def load(payload, ingest):
+    # Memoria retenida tras descartar las filas decodificadas: sin internar,
+    # cada item conserva su propia copia del nombre
+    tracemalloc.start()
+    rows = json.loads(payload)
+    if ingest:
+        ingestor = Ingestor()
+        inventory = ingestor.ingest_rows(rows)
+    else:
+        ingestor = None
+        inventory = GildedRose([Item(*row) for row in rows])
+    del rows
+    memory = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return inventory, ingestor, memory
+
+
+def time_days(inventory, days):
+    start = time.perf_counter()
+    for _ in range(days):
+        inventory.update_quality()
+    return time.perf_counter() - start
+
+
+def main():
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    days = int(sys.argv[2]) if len(sys.argv) > 2 else 10
+    payload = json.dumps(generate_inventory(random.Random(42), size))
+
+    reference, _, reference_memory = load(payload, ingest=False)
+    ingested, ingestor, ingested_memory = load(payload, ingest=True)
+    reference_time = time_days(reference, days)
+    ingested_time = time_days(ingested, days)
+
+    print(f"{size} items, {days} dias")
+    print(f"{'Inventario':<14} {'Memoria (MB)':>13} {'Tiempo (s)':>11}")
+    print(f"{'-'*40}")
+    print(f"{'GildedRose':<14} {reference_memory / 2 ** 20:>13.2f} {reference_time:>11.4f}")
+    print(f"{'Ingerido':<14} {ingested_memory / 2 ** 20:>13.2f} {ingested_time:>11.4f}")
+    print(f"Cache de clasificacion: {ingestor.cache_info()}")
+
+
+if __name__ == "__main__":
+    main()
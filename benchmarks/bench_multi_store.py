@@ -0,0 +1,62 @@
+"""
+Benchmark del MultiStore frente a un GildedRose por tienda.
+Para distintos números de tiendas compara el tiempo de un día recorriendo
+instancias separadas con el de una sola pasada del MultiStore, y muestra el
+coste por item para comprobar que escala linealmente.
+
+Uso (desde la raíz del repositorio):
+    python -m benchmarks.bench_multi_store [items_por_tienda] [dias]
+"""
+
+import random
+import sys
+import time
+
+from src.fuzz import generate_inventory
+from src.gilded_rose import GildedRose, Item
+from src.multi_store import MultiStore
+
+
+def build_rows(stores, size):
+    rng = random.Random(42)
+    return [generate_inventory(rng, size) for _ in range(stores)]
+
+
+def time_separate(rows_per_store, days):
+    instances = [GildedRose([Item(*row) for row in rows]) for rows in rows_per_store]
+    start = time.perf_counter()
+    for _ in range(days):
+        for gilded_rose in instances:
+            gilded_rose.update_quality()
+    return time.perf_counter() - start
+
+
+def time_multi_store(rows_per_store, days):
+    multi_store = MultiStore()
+    for index, rows in enumerate(rows_per_store):
+        multi_store.add_store(index, [Item(*row) for row in rows])
+    start = time.perf_counter()
+    for _ in range(days):
+        multi_store.update_quality()
+    return time.perf_counter() - start
+
+
+def main():
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+    days = int(sys.argv[2]) if len(sys.argv) > 2 else 30
+
+    print(f"{size} items por tienda, {days} dias")
+    print(f"{'Tiendas':>8} {'Separadas (s)':>14} {'MultiStore (s)':>15} "
+          f"{'ns/item-dia':>12} {'Speedup':>8}")
+    print(f"{'-'*61}")
+    for stores in (10, 100, 500, 1000):
+        rows_per_store = build_rows(stores, size)
+        separate = time_separate(rows_per_store, days)
+        batched = time_multi_store(rows_per_store, days)
+        per_item = batched / (stores * size * days) * 1e9
+        print(f"{stores:>8} {separate:>14.4f} {batched:>15.4f} "
+              f"{per_item:>12.1f} {separate / batched:>7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+"""
+Benchmark del log de operaciones con un par primario/réplica local.
+El primario (este proceso) aplica ticks y mutaciones sobre un
+LoggedGildedRose; la réplica, en otro proceso, sigue el archivo con
+Replica.poll(). Para cada política de fsync muestra el throughput del log,
+el retraso de la réplica y los bytes escritos frente a enviar la lista
+completa de items después de cada día. El retraso se mide para cada lote
+escrito, lo dispare una mutación o un tick: desde que empieza la operación
+que lo escribe (incluido el fsync) hasta que la réplica lo aplica.
+
+Uso (desde la raíz del repositorio):
+    python -m benchmarks.bench_oplog [items] [dias] [mutaciones_por_dia]
+"""
+
+import json
+import multiprocessing
+import os
+import random
+import sys
+import tempfile
+import time
+
+from src.fuzz import generate_inventory
+from src.gilded_rose import Item
+from src.oplog import LoggedGildedRose, OperationLog, Replica
+
+
+def percentile(samples, fraction):
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+
+def follow(path, connection):
+    """Proceso réplica: aplica el log hasta alcanzar el lsn final"""
+    replica = Replica(path)
+    progress = []
+    target = None
+    while target is None or replica.lsn < target:
+        if replica.poll():
+            progress.append((replica.lsn, time.monotonic()))
+        else:
+            time.sleep(0.0002)
+        if target is None and connection.poll():
+            target = connection.recv()
+    state = [[item.name, item.sell_in, item.quality] for item in replica.items]
+    connection.send((progress, state))
+    replica.close()
+
+
+def run(path, rows, days, mutations, policy):
+    rng = random.Random(3)
+    primary = LoggedGildedRose(
+        [Item(*row) for row in rows], OperationLog(path, fsync=policy, batch_size=64)
+    )
+    parent, child = multiprocessing.Pipe()
+    process = multiprocessing.Process(target=follow, args=(path, child))
+    process.start()
+
+    flushes = []
+    log = primary.log
+    start = time.perf_counter()
+
+    def timed(operation, *args):
+        # El instante se toma antes de la operación que escribe el lote
+        batches = log.batches
+        started = time.monotonic()
+        operation(*args)
+        if log.batches != batches:
+            flushes.append((log.flushed_lsn, started))
+
+    def mutate():
+        if rng.random() < 0.5:
+            primary.set(rng.randrange(len(primary.items)), quality=rng.randint(0, 50))
+        else:
+            name, sell_in, quality = generate_inventory(rng, 1)[0]
+            primary.add(name, sell_in, quality)
+            primary.remove(rng.randrange(len(primary.items)))
+
+    for _ in range(days):
+        for _ in range(mutations):
+            timed(mutate)
+        timed(primary.update_quality)
+    flushes.append((log.lsn, time.monotonic()))
+    primary.flush()
+    elapsed = time.perf_counter() - start
+
+    parent.send(log.lsn)
+    progress, state = parent.recv()
+    process.join()
+
+    lags = []
+    position = 0
+    for lsn, written in flushes:
+        while progress[position][0] < lsn:
+            position += 1
+        lags.append(progress[position][1] - written)
+    in_sync = state == [[item.name, item.sell_in, item.quality] for item in primary.items]
+    primary.close()
+    return log.lsn / elapsed, lags, log.bytes_written, in_sync
+
+
+def main():
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    days = int(sys.argv[2]) if len(sys.argv) > 2 else 200
+    mutations = int(sys.argv[3]) if len(sys.argv) > 3 else 50
+    rows = generate_inventory(random.Random(42), size)
+    full_copy = len(json.dumps(rows, separators=(",", ":")).encode("utf-8")) * days
+
+    print(f"{size} items, {days} dias, {mutations} mutaciones por dia")
+    print(f"Enviar la lista completa cada dia: {full_copy / 2 ** 20:.2f} MB")
+    print(f"{'fsync':<8} {'registros/s':>12} {'lag p50 (ms)':>13} "
+          f"{'lag max (ms)':>13} {'MB escritos':>12} {'sincronizada':>13}")
+    print(f"{'-'*76}")
+    with tempfile.TemporaryDirectory() as directory:
+        for policy in ("never", "batch", "always"):
+            path = os.path.join(directory, policy + ".oplog")
+            throughput, lags, written, in_sync = run(path, rows, days, mutations, policy)
+            print(f"{policy:<8} {throughput:>12.0f} {percentile(lags, 0.5) * 1000:>13.3f} "
+                  f"{max(lags) * 1000:>13.3f} {written / 2 ** 20:>12.2f} "
+                  f"{'si' if in_sync else 'NO':>13}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""
+Benchmark del planificador de liquidación.
+Compara el coste diario de mantener el ranking con SellOffPlanner.advance()
+y top(k) frente a recalcular la pérdida de cada item simulando una copia
+`horizon` días con GildedRose.
+
+Uso (desde la raíz del repositorio):
+    python -m benchmarks.bench_planner [items] [dias] [horizonte]
+"""
+
+import heapq
+import random
+import sys
+import time
+
+from src.fuzz import generate_inventory
+from src.gilded_rose import GildedRose, Item
+from src.planner import SellOffPlanner
+
+
+TOP_K = 20
+
+
+def brute_force_top(items, horizon, k):
+    losses = []
+    for index, item in enumerate(items):
+        copy = Item(item.name, item.sell_in, item.quality)
+        gilded_rose = GildedRose([copy])
+        for _ in range(horizon):
+            gilded_rose.update_quality()
+        losses.append((item.quality - copy.quality, -index))
+    return heapq.nlargest(k, losses)
+
+
+def main():
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    days = int(sys.argv[2]) if len(sys.argv) > 2 else 10
+    horizon = int(sys.argv[3]) if len(sys.argv) > 3 else 7
+    rows = generate_inventory(random.Random(42), size)
+
+    items = [Item(*row) for row in rows]
+    gilded_rose = GildedRose(items)
+    start = time.perf_counter()
+    for _ in range(days):
+        gilded_rose.update_quality()
+        brute_force_top(items, horizon, TOP_K)
+    brute_force = time.perf_counter() - start
+
+    items = [Item(*row) for row in rows]
+    gilded_rose = GildedRose(items)
+    start = time.perf_counter()
+    planner = SellOffPlanner(items, horizon=horizon)
+    build = time.perf_counter() - start
+    start = time.perf_counter()
+    for _ in range(days):
+        gilded_rose.update_quality()
+        planner.advance()
+        planner.top(TOP_K)
+    incremental = time.perf_counter() - start
+
+    print(f"{size} items, {days} dias, horizonte {horizon}, top {TOP_K}")
+    print(f"{'Estrategia':<28} {'Tiempo (s)':>11}")
+    print(f"{'-'*40}")
+    print(f"{'Recalcular cada dia':<28} {brute_force:>11.4f}")
+    print(f"{'SellOffPlanner (creacion)':<28} {build:>11.4f}")
+    print(f"{'SellOffPlanner (dias)':<28} {incremental:>11.4f}")
+    print(f"Items recalculados por dia: {(planner.recomputed - size) / days:.1f}")
+
+
+if __name__ == "__main__":
+    main()
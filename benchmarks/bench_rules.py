@@ -0,0 +1,53 @@
+"""
+Benchmark de las reglas cargadas desde archivo frente a los updaters
+escritos a mano. Instala rules/builtin.json (las mismas categorías que las
+clases ItemUpdater) y compara el tiempo de update_quality() sobre el mismo
+inventario con y sin las reglas.
+
+Uso (desde la raíz del repositorio):
+    python -m benchmarks.bench_rules [items] [dias]
+"""
+
+import random
+import sys
+import time
+
+from src.fuzz import generate_inventory
+from src.gilded_rose import GildedRose, Item
+from src.rules import RulesFile
+
+
+def time_days(rows, days):
+    gilded_rose = GildedRose([Item(*row) for row in rows])
+    start = time.perf_counter()
+    for _ in range(days):
+        gilded_rose.update_quality()
+    return time.perf_counter() - start, gilded_rose.items
+
+
+def main():
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 50000
+    days = int(sys.argv[2]) if len(sys.argv) > 2 else 30
+    rows = generate_inventory(random.Random(42), size)
+
+    hand_written, expected = time_days(rows, days)
+
+    rules = RulesFile("rules/builtin.json")
+    rules.install()
+    try:
+        compiled, actual = time_days(rows, days)
+    finally:
+        rules.uninstall()
+
+    same = [repr(item) for item in expected] == [repr(item) for item in actual]
+    per_item = 1e9 / (size * days)
+    print(f"{size} items, {days} dias (resultados identicos: {same})")
+    print(f"{'Motor':<22} {'Tiempo (s)':>11} {'ns/item-dia':>12}")
+    print(f"{'-'*47}")
+    print(f"{'Clases ItemUpdater':<22} {hand_written:>11.4f} {hand_written * per_item:>12.1f}")
+    print(f"{'rules/builtin.json':<22} {compiled:>11.4f} {compiled * per_item:>12.1f}")
+    print(f"Relacion reglas/clases: {compiled / hand_written:.2f}")
+
+
+if __name__ == "__main__":
+    main()
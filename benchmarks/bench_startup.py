@@ -0,0 +1,58 @@
+"""
+Benchmark de arranque de los puntos de entrada.
+Lanza cada CLI como proceso nuevo varias veces y muestra el tiempo medio
+de ejecución y el tiempo de import de sus módulos.
+
+Uso (desde la raíz del repositorio):
+    python -m benchmarks.bench_startup [repeticiones]
+"""
+
+import subprocess
+import sys
+import time
+
+
+ENTRY_POINTS = {
+    "main.py": [sys.executable, "main.py"],
+    "texttest_fixture": [sys.executable, "-m", "src.texttest_fixture", "30"],
+}
+
+
+def time_process(command, runs):
+    """Retorna el tiempo medio (ms) de lanzar el comando runs veces"""
+    start = time.perf_counter()
+    for _ in range(runs):
+        subprocess.run(command, stdout=subprocess.DEVNULL, check=True)
+    return (time.perf_counter() - start) * 1000 / runs
+
+
+def import_time(module):
+    """Retorna el tiempo de import acumulado (us) del módulo"""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import %s" % module],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    for line in result.stderr.splitlines():
+        if line.rstrip().endswith("| " + module):
+            return int(line.split("|")[1])
+    return None
+
+
+def main():
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+
+    print(f"{'Punto de entrada':<20} {'Proceso (ms)':>14}")
+    print(f"{'-'*36}")
+    for name, command in ENTRY_POINTS.items():
+        print(f"{name:<20} {time_process(command, runs):>14.2f}")
+
+    print(f"\n{'Modulo':<20} {'Import (us)':>14}")
+    print(f"{'-'*36}")
+    for module in ("src.gilded_rose", "src.texttest_fixture", "main"):
+        print(f"{module:<20} {import_time(module):>14}")
+
+
+if __name__ == "__main__":
+    main()
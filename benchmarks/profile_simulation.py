@@ -0,0 +1,92 @@
+"""
+Perfil de una simulación estilo main.py sobre un inventario grande.
+Genera el mismo inventario para cualquier motor, lo simula con las fases
+load, update y render (la salida se descarta) y exporta el perfil, para
+comparar motores sobre la misma carga. Con --memory (o --memory-budget) mide
+la memoria por fase en lugar del tiempo.
+
+Uso (desde la raíz del repositorio):
+    python -m benchmarks.profile_simulation --engine src.multi_store:MultiStore \\
+        --items 50000 --days 30 --output perfil.json
+    python -m benchmarks.profile_simulation --items 500000 --memory-budget 300MB
+"""
+
+import argparse
+import io
+import random
+import sys
+
+from main import print_inventory
+from src.fuzz import generate_inventory, load_engine
+from src.gilded_rose import Item
+from src.memory import MemoryBudgetExceeded, MemoryTracker, parse_size
+from src.profiling import SamplingProfiler
+
+
+def build_engine(spec, items):
+    """Crea el motor; MultiStore recibe los items como una sola tienda"""
+    engine_class = load_engine(spec)
+    if hasattr(engine_class, "add_store"):
+        engine = engine_class()
+        engine.add_store("principal", items)
+        return engine
+    return engine_class(items)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Perfil de una simulación grande")
+    parser.add_argument("--engine", default="src.gilded_rose:GildedRose")
+    parser.add_argument("--items", type=int, default=20000)
+    parser.add_argument("--days", type=int, default=30)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--interval", type=float, default=0.001)
+    parser.add_argument("--output", default="profile.collapsed")
+    parser.add_argument("--format", choices=("collapsed", "speedscope"))
+    parser.add_argument("--memory", action="store_true", help="medir memoria por fase")
+    parser.add_argument("--memory-budget", type=parse_size, help="p. ej. 300MB")
+    args = parser.parse_args(argv)
+
+    rows = generate_inventory(random.Random(args.seed), args.items)
+    if args.memory or args.memory_budget is not None:
+        tracker = MemoryTracker(budget=args.memory_budget)
+        try:
+            with tracker:
+                simulate(tracker, args, rows)
+        except MemoryBudgetExceeded as error:
+            print("Presupuesto de memoria excedido: %s" % error)
+            print(error.report)
+            return 1
+        print("Motor: %s  items: %s  dias: %s" % (args.engine, args.items, args.days))
+        print(tracker.report())
+        return 0
+
+    with SamplingProfiler(args.interval) as profiler:
+        simulate(profiler, args, rows)
+    profiler.write(args.output, args.format)
+    print("Motor: %s  items: %s  dias: %s" % (args.engine, args.items, args.days))
+    print(profiler.summary())
+    print("Perfil exportado en %s" % args.output)
+    return 0
+
+
+def simulate(recorder, args, rows):
+    """Simulación con fases load, update y render sobre `recorder`"""
+    sink = io.StringIO()
+    with recorder.phase("load"):
+        items = [Item(*row) for row in rows]
+        engine = build_engine(args.engine, items)
+    for day in range(args.days):
+        with recorder.phase("update"):
+            engine.update_quality()
+        with recorder.phase("render"):
+            stdout, sys.stdout = sys.stdout, sink
+            try:
+                print_inventory(engine.items, day)
+            finally:
+                sys.stdout = stdout
+            sink.seek(0)
+            sink.truncate()
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
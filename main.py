@@ -3,6 +3,9 @@ Main execution file for the Gilded Rose inventory system.
 Simulates the passage of days and shows how item quality and sell_in values change.
 """
 
+import sys
+
+from src.cli import recorder_from_argv
 from src.gilded_rose import GildedRose, Item
 
 
@@ -18,11 +21,46 @@ def print_inventory(items, day):
         print(f"{item.name:<50} {item.sell_in:>12} {item.quality:>10}")
 
 
-def main():
+def main(argv=None):
     """Main execution function"""
     
-    # Crear inventario con diferentes tipos de articulos
-    items = [
+    # --profile RUTA activa el perfil por muestreo de la simulación
+    # --memory / --memory-budget TAMAÑO miden la memoria por fase
+    argv = list(sys.argv[1:] if argv is None else argv)
+    recorder = recorder_from_argv(argv)
+    
+    with recorder.phase("load"):
+        items = load_items()
+        gilded_rose = GildedRose(items)
+    
+    # Número de días a simular
+    days = 11
+    
+    with recorder.phase("render"):
+        # Mostrar inventario inicial
+        print("\n" + "="*80)
+        print("INVENTARIO - OLLIVANDERS - SISTEMA GILDED ROSE")
+        print("="*80)
+        
+        # Mostrar estado inicial (día 0)
+        print_inventory(items, 0)
+    
+    # Simular el paso de los días
+    for day in range(1, days):
+        with recorder.phase("update"):
+            gilded_rose.update_quality()
+        with recorder.phase("render"):
+            print_inventory(items, day)
+    
+    with recorder.phase("render"):
+        print_legend()
+    
+    recorder.finish()
+
+
+def load_items():
+    """Crea el inventario con diferentes tipos de articulos"""
+    return [
         Item(name="+5 Dexterity Vest", sell_in=10, quality=20),
         Item(name="Aged Brie", sell_in=2, quality=0),
         Item(name="Elixir of the Mongoose", sell_in=5, quality=7),
@@ -33,27 +71,10 @@ def main():
         Item(name="Backstage passes to a TAFKAL80ETC concert", sell_in=5, quality=49),
         Item(name="Conjured Mana Cake", sell_in=3, quality=6),
     ]
-    
-    # Número de días a simular
-    days = 11
-    
-    # Crear instancia de GildedRose
-    gilded_rose = GildedRose(items)
-    
-    # Mostrar inventario inicial
-    print("\n" + "="*80)
-    print("INVENTARIO - OLLIVANDERS - SISTEMA GILDED ROSE")
-    print("="*80)
-    
-    # Mostrar estado inicial (día 0)
-    print_inventory(items, 0)
-    
-    # Simular el paso de los días
-    for day in range(1, days):
-        gilded_rose.update_quality()
-        print_inventory(items, day)
-    
-    # Resumen final
+
+
+def print_legend():
+    """Imprime el resumen final"""
     print(f"\n{'='*80}")
     print("LEYENDA:")
     print(f"{'-'*80}")
@@ -0,0 +1,198 @@
+"""
+Alertas por umbral con un índice invertido de días de cruce.
+Cada alerta es un predicado sobre sell_in o quality de un item, evaluado
+hoy o `within` días hacia delante ("calidad 0 dentro de 3 días"). En vez de
+revisar todos los items tras cada update_quality(), el monitor deriva la
+curva futura de cada item con su updater (planner.ValueCurve), calcula el
+día en que cada predicado pasa de falso a verdadero y lo agenda en un cubo
+por día. tick() solo visita el cubo del día: el coste es proporcional a las
+alertas disparadas, más las revisiones agendadas.
+
+Si un predicado no cruza en `lookahead` días, el par (item, alerta) se
+vuelve a revisar ese día; así un item estable (Sulfuras, un item ya
+caducado) cuesta una revisión cada `lookahead` días y no una por tick.
+
+Los items modificados fuera de update_quality() deben pasar por refresh().
+Sin refresh(), el cambio se detecta en la próxima visita agendada del item
+(cruce o revisión): el monitor recalcula su curva y reporta entonces las
+alertas que se cumplan.
+"""
+
+from src.planner import CURVE_CHUNK, ValueCurve
+
+
+_FIELDS = ("sell_in", "quality")
+
+
+class Threshold:
+    """Predicado de alerta sobre un campo de los items que coinciden.
+
+    Ejemplos:
+        Threshold("backstage_5_dias", "sell_in", at_most=5,
+                  prefix="Backstage passes")
+        Threshold("calidad_0_en_3_dias", "quality", at_most=0, within=3)
+    """
+
+    def __init__(self, name, field, at_most=None, at_least=None, within=0,
+                 match=None, prefix=None):
+        if field not in _FIELDS:
+            raise ValueError("campo desconocido: %r" % (field,))
+        if at_most is None and at_least is None:
+            raise ValueError("la alerta %r necesita at_most o at_least" % (name,))
+        if within < 0:
+            raise ValueError("within no puede ser negativo")
+        self.name = name
+        self.field = field
+        self.at_most = at_most
+        self.at_least = at_least
+        self.within = within
+        self.match = match
+        self.prefix = prefix
+
+    def applies_to(self, item):
+        """El item entra en esta alerta (por prefijo y/o match)"""
+        if self.prefix is not None and not item.name.startswith(self.prefix):
+            return False
+        return self.match is None or self.match(item)
+
+    def holds(self, curve, offset):
+        """El predicado se cumple el día `offset` de la curva"""
+        day = offset + self.within
+        if self.field == "quality":
+            value = curve.quality_at(day)
+        else:
+            value = curve.sell_in_at(day)
+        if self.at_most is not None and value > self.at_most:
+            return False
+        return self.at_least is None or value >= self.at_least
+
+    def __repr__(self):
+        return "Threshold(%r)" % (self.name,)
+
+
+class _Watch:
+    """Curva futura de un item vigilado"""
+
+    __slots__ = ("item", "curve", "start", "version")
+
+    def __init__(self, item, start, version):
+        self.item = item
+        self.curve = ValueCurve(item)
+        self.start = start
+        self.version = version
+
+
+class AlertMonitor:
+    """Dispara alertas por umbral consultando solo el cubo de cada día.
+
+    Uso:
+        monitor = AlertMonitor(items, [Threshold(...), ...])
+        gilded_rose.update_quality()
+        for alert, item in monitor.tick():
+            ...
+    """
+
+    def __init__(self, items=(), alerts=(), lookahead=None):
+        self.lookahead = lookahead or 2 * CURVE_CHUNK
+        self.day = 0
+        self.alerts = []
+        # Entradas de cubo visitadas (disparos y revisiones)
+        self.processed = 0
+        self._watches = {}
+        self._buckets = {}
+        self._version = 0
+        for alert in alerts:
+            self.add_alert(alert)
+        for item in items:
+            self.add(item)
+
+    def __len__(self):
+        return len(self._watches)
+
+    def add_alert(self, alert):
+        """Registra una alerta; retorna los items que ya la cumplen hoy"""
+        if any(existing.name == alert.name for existing in self.alerts):
+            raise ValueError("alerta duplicada: %r" % (alert.name,))
+        index = len(self.alerts)
+        self.alerts.append(alert)
+        active = []
+        for watch in self._watches.values():
+            if alert.applies_to(watch.item) and self._start_watching(watch, index):
+                active.append(watch.item)
+        return active
+
+    def add(self, item):
+        """Empieza a vigilar un item; retorna las alertas que ya cumple"""
+        self._version += 1
+        watch = _Watch(item, self.day, self._version)
+        self._watches[id(item)] = watch
+        return [
+            alert for index, alert in enumerate(self.alerts)
+            if alert.applies_to(item) and self._start_watching(watch, index)
+        ]
+
+    def remove(self, item):
+        """Deja de vigilar un item"""
+        self._watches.pop(id(item))
+
+    def refresh(self, item):
+        """Recalcula las curvas de un item modificado fuera de update_quality"""
+        self.remove(item)
+        return self.add(item)
+
+    def tick(self, days=1):
+        """Avanza `days` días tras update_quality(); retorna [(alerta, item), ...]
+        con las alertas que empezaron a cumplirse"""
+        triggered = []
+        for _ in range(days):
+            self.day += 1
+            for watch_id, index, version, fire in self._buckets.pop(self.day, ()):
+                self.processed += 1
+                watch = self._watches.get(watch_id)
+                if watch is None or watch.version != version:
+                    continue
+                if not self._matches_curve(watch):
+                    # Mutación sin refresh(): la curva ya no sirve
+                    for alert in self.refresh(watch.item):
+                        triggered.append((alert, watch.item))
+                    continue
+                if fire:
+                    triggered.append((self.alerts[index], watch.item))
+                self._schedule(watch, index, self._offset(watch))
+        return triggered
+
+    def _offset(self, watch):
+        offset = self.day - watch.start
+        if offset >= CURVE_CHUNK:
+            # Las curvas no crecen sin límite en ejecuciones largas
+            watch.curve.drop(offset)
+            watch.start += offset
+            offset = 0
+        return offset
+
+    def _matches_curve(self, watch):
+        offset = self._offset(watch)
+        curve = watch.curve
+        return (watch.item.quality == curve.quality_at(offset)
+                and watch.item.sell_in == curve.sell_in_at(offset))
+
+    def _start_watching(self, watch, index):
+        offset = self._offset(watch)
+        self._schedule(watch, index, offset)
+        return self.alerts[index].holds(watch.curve, offset)
+
+    def _schedule(self, watch, index, offset):
+        """Agenda el próximo día en que la alerta pasa de falsa a verdadera,
+        o una revisión al agotar lookahead"""
+        alert = self.alerts[index]
+        curve = watch.curve
+        previous = alert.holds(curve, offset)
+        fire = False
+        for day in range(offset + 1, offset + self.lookahead + 1):
+            current = alert.holds(curve, day)
+            if current and not previous:
+                fire = True
+                break
+            previous = current
+        entry = (id(watch.item), index, watch.version, fire)
+        self._buckets.setdefault(watch.start + day, []).append(entry)
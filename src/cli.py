@@ -0,0 +1,124 @@
+"""
+Utilidades compartidas por los puntos de entrada (main.py y texttest_fixture).
+Se mantienen mínimas para no encarecer el arranque: las opciones se leen a
+mano y los módulos de instrumentación solo se importan cuando se piden.
+"""
+
+import sys
+
+
+def pop_option(argv, name):
+    """Extrae '--name valor' o '--name=valor' de argv y retorna el valor"""
+    for index, arg in enumerate(argv):
+        if arg == name:
+            if index + 1 >= len(argv):
+                raise SystemExit("%s requiere un valor" % name)
+            value = argv[index + 1]
+            del argv[index:index + 2]
+            return value
+        if arg.startswith(name + "="):
+            del argv[index]
+            return arg[len(name) + 1:]
+    return None
+
+
+def pop_flag(argv, name):
+    """Extrae '--name' de argv y retorna si estaba"""
+    if name in argv:
+        argv.remove(name)
+        return True
+    return False
+
+
+class NullRecorder:
+    """Recorder sin instrumentación: las fases no cuestan nada"""
+
+    def phase(self, name):
+        return self
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+    def finish(self):
+        pass
+
+
+class _Phases:
+    """Fase compuesta: entra en la fase de cada recorder"""
+
+    def __init__(self, recorders, phases):
+        self._recorders = recorders
+        self._phases = phases
+
+    def __enter__(self):
+        for phase in self._phases:
+            phase.__enter__()
+        return self
+
+    def __exit__(self, *exc_info):
+        # Se sale de todas las fases aunque una falle (p. ej. --memory-budget
+        # excedido), y los demás recorders terminan antes de propagar el error
+        failed = None
+        for recorder, phase in reversed(list(zip(self._recorders, self._phases))):
+            try:
+                phase.__exit__(*exc_info)
+            except BaseException as error:
+                if failed is None:
+                    failed = (recorder, error)
+        if failed is None:
+            return False
+        for recorder in self._recorders:
+            if recorder is not failed[0]:
+                recorder.finish()
+        raise failed[1]
+
+
+class MultiRecorder:
+    """Combina varios recorders (p. ej. --profile y --memory)"""
+
+    def __init__(self, recorders):
+        self.recorders = recorders
+
+    def phase(self, name):
+        return _Phases(self.recorders, [recorder.phase(name) for recorder in self.recorders])
+
+    def finish(self):
+        for recorder in self.recorders:
+            recorder.finish()
+
+
+def recorder_from_argv(argv):
+    """Crea el recorder pedido en la línea de comandos.
+
+    --profile RUTA            perfil por muestreo (collapsed o speedscope)
+    --profile-format FORMATO  'collapsed' o 'speedscope' (por extensión si falta)
+    --memory                  memoria por fase y atribución por módulo
+    --memory-budget TAMAÑO    falla si la memoria trazada supera TAMAÑO (200MB)
+    """
+    profile_path = pop_option(argv, "--profile")
+    profile_format = pop_option(argv, "--profile-format")
+    memory = pop_flag(argv, "--memory")
+    memory_budget = pop_option(argv, "--memory-budget")
+
+    recorders = []
+    if profile_path is not None:
+        from src.profiling import ProfileRecorder
+
+        recorders.append(ProfileRecorder(profile_path, profile_format, report=sys.stderr))
+    if memory or memory_budget is not None:
+        from src.memory import MemoryRecorder, parse_size
+
+        try:
+            budget = parse_size(memory_budget) if memory_budget is not None else None
+        except ValueError as error:
+            raise SystemExit("--memory-budget: %s" % error)
+        recorders.append(MemoryRecorder(budget, report=sys.stderr))
+
+    if not recorders:
+        return NullRecorder()
+    if len(recorders) == 1:
+        return recorders[0]
+    return MultiRecorder(recorders)
@@ -0,0 +1,146 @@
+"""
+Inventario seguro para mutaciones concurrentes durante update_quality().
+
+Modelo: cola de mutaciones aplicada entre ticks.
+
+- Los hilos de la API no tocan la colección de items: add(), remove() y
+  set() encolan la operación en un deque (append es atómico) y retornan de
+  inmediato, sin tomar ningún lock, así que no compiten con el tick.
+- update_quality() toma el lock del tick, aplica las mutaciones pendientes
+  en orden de llegada y luego actualiza cada item exactamente una vez.
+  Ningún item se salta ni se actualiza dos veces, porque la colección no
+  cambia mientras se recorre.
+- La cola está acotada (max_pending). Si un escritor la encuentra llena,
+  intenta tomar el lock del tick sin bloquear y aplica él mismo las
+  mutaciones pendientes; si otro hilo ya las está aplicando (o hay un tick
+  en curso), cede la CPU hasta que la cola baje. Así la memoria no crece
+  sin límite y los escritores no forman un convoy sobre el lock.
+- El límite por defecto es pequeño a propósito: con el GIL, escritores que
+  nunca esperan se reparten la CPU con el hilo del tick y lo dejan sin
+  avanzar. Con una cola corta, durante un tick los escritores la llenan
+  enseguida y quedan en espera, y el tick drena como mucho max_pending
+  mutaciones (más las de los escritores que ya estaban encolando).
+- Cada tick incrementa `epoch`. snapshot() retorna una copia consistente
+  del inventario al final del último tick (o flush), construida una vez por
+  época.
+"""
+
+import collections
+import threading
+import time
+
+from src.gilded_rose import UpdaterFactory
+
+
+_ADD = 0
+_REMOVE = 1
+_SET = 2
+
+
+class ConcurrentInventory:
+    """Inventario con cola de mutaciones aplicada entre ticks"""
+
+    def __init__(self, items=(), max_pending=4096):
+        self.max_pending = max_pending
+        self._items = {id(item): item for item in items}
+        self._pending = collections.deque()
+        self._lock = threading.Lock()
+        self._snapshot = None
+        self.epoch = 0
+        self.applied = 0
+        self.ignored = 0
+
+    def add(self, item):
+        """Encola el alta de un item; se aplica antes del próximo tick"""
+        self._enqueue((_ADD, item, None))
+
+    def remove(self, item):
+        """Encola la baja de un item; se ignora si ya no está"""
+        self._enqueue((_REMOVE, item, None))
+
+    def set(self, item, **fields):
+        """Encola un cambio de sell_in y/o quality de un item"""
+        unknown = set(fields) - {"sell_in", "quality"}
+        if unknown:
+            raise ValueError("campos no modificables: %s" % sorted(unknown))
+        self._enqueue((_SET, item, fields))
+
+    def _enqueue(self, operation):
+        pending = self._pending
+        pending.append(operation)
+        if len(pending) >= self.max_pending:
+            self._relieve()
+
+    def _relieve(self):
+        # Solo un hilo drena la cola; el resto espera sin competir por el lock
+        lock = self._lock
+        while len(self._pending) >= self.max_pending:
+            if lock.acquire(blocking=False):
+                try:
+                    self._apply_pending()
+                finally:
+                    lock.release()
+            else:
+                time.sleep(0.0005)
+
+    @property
+    def pending(self):
+        return len(self._pending)
+
+    @property
+    def items(self):
+        """Lista de items tras aplicar las mutaciones pendientes"""
+        with self._lock:
+            self._apply_pending()
+            return list(self._items.values())
+
+    def __len__(self):
+        return len(self._items)
+
+    def flush(self):
+        """Aplica las mutaciones pendientes sin avanzar el día"""
+        with self._lock:
+            self._apply_pending()
+
+    def update_quality(self):
+        """Aplica las mutaciones pendientes y actualiza todos los items"""
+        with self._lock:
+            self._apply_pending()
+            get_updater = UpdaterFactory.get_updater
+            for item in self._items.values():
+                get_updater(item).update(item)
+            self.epoch += 1
+            self._snapshot = None
+
+    def snapshot(self):
+        """(epoch, [(name, sell_in, quality), ...]) consistente"""
+        with self._lock:
+            if self._snapshot is None:
+                self._snapshot = (self.epoch, [
+                    (item.name, item.sell_in, item.quality) for item in self._items.values()
+                ])
+            return self._snapshot
+
+    def _apply_pending(self):
+        # Solo se drena lo que había al empezar: escritores continuos no
+        # pueden retrasar el tick indefinidamente
+        pending = self._pending
+        items = self._items
+        changed = False
+        for _ in range(len(pending)):
+            operation, item, fields = pending.popleft()
+            key = id(item)
+            if operation == _ADD:
+                items[key] = item
+            elif key not in items:
+                self.ignored += 1
+                continue
+            elif operation == _REMOVE:
+                del items[key]
+            else:
+                for name, value in fields.items():
+                    setattr(item, name, value)
+            self.applied += 1
+            changed = True
+        if changed:
+            self._snapshot = None
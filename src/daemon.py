@@ -0,0 +1,233 @@
+"""
+Modo daemon del sistema Gilded Rose.
+Mantiene el inventario en memoria entre días y atiende ticks, consultas y
+mutaciones por una tubería (stdin/stdout) o un socket Unix local.
+
+Protocolo: una petición JSON por línea y una respuesta JSON por línea.
+Una petición puede ser un objeto (un comando) o una lista de comandos, que
+se aplican juntos como un lote y devuelven una lista de respuestas.
+
+    {"op": "add", "items": [["Aged Brie", 2, 0]]}
+    {"op": "tick", "days": 1}
+    {"op": "query", "name": "Aged Brie"}
+    {"op": "query", "category": "AgedBrieUpdater"}
+    {"op": "set", "index": 0, "quality": 10}
+    {"op": "remove", "index": 0}
+    {"op": "stats"}
+    {"op": "shutdown"}
+
+Los items se ingieren con un Ingestor: cada nombre se clasifica una vez en
+un código de categoría, y los ticks, las consultas por categoría y stats
+trabajan con los códigos sin volver a comparar nombres.
+
+Uso:
+    python -m src.daemon [--inventory inventario.json] [--socket /tmp/gr.sock]
+"""
+
+import argparse
+import json
+import sys
+
+from src.gilded_rose import Item
+from src.ingestion import Ingestor, intern_name
+
+
+class InventoryDaemon:
+    """Inventario residente que procesa comandos sobre un inventario ingerido"""
+
+    def __init__(self, items=None, ingestor=None):
+        self.ingestor = ingestor or Ingestor()
+        self.inventory = self.ingestor.ingest_items(list(items or []))
+        self.day = 0
+        self.running = True
+        self._handlers = {
+            "tick": self._tick,
+            "query": self._query,
+            "add": self._add,
+            "remove": self._remove,
+            "set": self._set,
+            "stats": self._stats,
+            "shutdown": self._shutdown,
+        }
+
+    @property
+    def items(self):
+        return self.inventory.items
+
+    def handle(self, request):
+        """Procesa un comando o un lote de comandos"""
+        if isinstance(request, list):
+            return [self.handle(command) for command in request]
+        try:
+            handler = self._handlers[request["op"]]
+        except (KeyError, TypeError):
+            return {"ok": False, "error": "comando desconocido: %r" % (request,)}
+        try:
+            return dict(handler(request), ok=True)
+        except (KeyError, IndexError, TypeError, ValueError) as error:
+            return {"ok": False, "error": "%s: %s" % (type(error).__name__, error)}
+
+    def handle_line(self, line):
+        """Procesa una línea JSON y retorna la respuesta serializada"""
+        try:
+            request = json.loads(line)
+        except ValueError as error:
+            response = {"ok": False, "error": "JSON inválido: %s" % error}
+        else:
+            response = self.handle(request)
+        return json.dumps(response, separators=(",", ":"))
+
+    def _tick(self, request):
+        days = int(request.get("days", 1))
+        if days < 0:
+            raise ValueError("days no puede ser negativo")
+        for _ in range(days):
+            self.inventory.update_quality()
+        self.day += days
+        return {"day": self.day}
+
+    def _query(self, request):
+        name = request.get("name")
+        code = self._category_code(request.get("category"))
+        return {
+            "day": self.day,
+            "items": [
+                [index, item.name, item.sell_in, item.quality]
+                for index, (item_code, item) in enumerate(zip(self.inventory.codes, self.items))
+                if (name is None or item.name == name) and (code is None or item_code == code)
+            ],
+        }
+
+    def _category_code(self, label):
+        if label is None:
+            return None
+        table = self.inventory.table
+        for code in range(len(table)):
+            if table.label(code) == label:
+                return code
+        # Ningún item cargado tiene esa categoría
+        return -1
+
+    def _add(self, request):
+        for name, sell_in, quality in request["items"]:
+            self.ingestor.add(self.inventory, name, int(sell_in), int(quality))
+        return {"count": len(self.items)}
+
+    def _remove(self, request):
+        item = self.inventory.pop(request["index"])
+        return {"removed": [item.name, item.sell_in, item.quality]}
+
+    def _set(self, request):
+        item = self.items[request["index"]]
+        if "sell_in" in request:
+            item.sell_in = int(request["sell_in"])
+        if "quality" in request:
+            item.quality = int(request["quality"])
+        return {"item": [item.name, item.sell_in, item.quality]}
+
+    def _stats(self, request):
+        return {
+            "day": self.day,
+            "count": len(self.items),
+            "categories": {
+                label: [count, quality]
+                for label, (count, quality) in self.inventory.report().items()
+            },
+        }
+
+    def _shutdown(self, request):
+        self.running = False
+        return {"day": self.day}
+
+
+def serve_pipe(daemon, stdin=None, stdout=None):
+    """Atiende peticiones línea a línea por una tubería"""
+    stdin = stdin or sys.stdin
+    stdout = stdout or sys.stdout
+    for line in stdin:
+        if not line.strip():
+            continue
+        stdout.write(daemon.handle_line(line) + "\n")
+        stdout.flush()
+        if not daemon.running:
+            break
+
+
+def serve_socket(daemon, path):
+    """Atiende peticiones en un socket Unix, una conexión a la vez"""
+    import os
+    import socketserver
+
+    class _Handler(socketserver.StreamRequestHandler):
+        def handle(self):
+            for raw in self.rfile:
+                line = raw.decode("utf-8")
+                if not line.strip():
+                    continue
+                self.wfile.write((daemon.handle_line(line) + "\n").encode("utf-8"))
+                self.wfile.flush()
+                if not daemon.running:
+                    break
+
+    _remove_stale_socket(path)
+    with socketserver.UnixStreamServer(path, _Handler) as server:
+        # Solo se borra el socket que este proceso llegó a crear
+        try:
+            while daemon.running:
+                server.handle_request()
+        finally:
+            os.unlink(path)
+
+
+def _remove_stale_socket(path):
+    """Borra un socket abandonado; falla si otro daemon sigue atendiéndolo"""
+    import errno
+    import os
+    import socket
+    import stat
+
+    try:
+        mode = os.stat(path).st_mode
+    except FileNotFoundError:
+        return
+    if not stat.S_ISSOCK(mode):
+        raise FileExistsError(errno.EEXIST, "existe y no es un socket", path)
+    probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        probe.connect(path)
+    except ConnectionRefusedError:
+        # Nadie escucha: quedó de un daemon que terminó sin borrarlo
+        os.unlink(path)
+        return
+    finally:
+        probe.close()
+    raise OSError(errno.EADDRINUSE, "otro daemon atiende en este socket", path)
+
+
+def load_inventory(path):
+    """Carga items desde un JSON con filas [name, sell_in, quality]"""
+    with open(path, encoding="utf-8") as handle:
+        return [
+            Item(intern_name(name), sell_in, quality)
+            for name, sell_in, quality in json.load(handle)
+        ]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Daemon del inventario Gilded Rose")
+    parser.add_argument("--inventory", help="JSON con el inventario inicial")
+    parser.add_argument("--socket", help="ruta del socket Unix (por defecto stdin/stdout)")
+    args = parser.parse_args(argv)
+
+    daemon = InventoryDaemon(load_inventory(args.inventory) if args.inventory else [])
+    if args.socket:
+        try:
+            serve_socket(daemon, args.socket)
+        except OSError as error:
+            raise SystemExit("No se puede atender en %s: %s" % (args.socket, error.strerror))
+    else:
+        serve_pipe(daemon)
+
+
+if __name__ == "__main__":
+    main()
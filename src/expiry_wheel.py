@@ -0,0 +1,223 @@
+"""
+Motor de inventario con sell_in relativo a un contador de días global.
+Cada item guarda su día absoluto de caducidad y `sell_in` se calcula como
+caducidad - hoy, así que decrementarlo no cuesta nada. La calidad se guarda
+como un tramo lineal (calidad base, día base, ritmo diario) que solo cambia
+en días concretos: la caducidad (el ritmo se duplica o los backstage pasan a
+0), las bandas de 10 y 5 días de los backstage y la saturación en 0 o 50.
+Esos días se agendan en cubos por día absoluto (una rueda de tiempos), de
+modo que update_quality() solo visita los items cuyo ritmo cambia ese día.
+Un item saturado (calidad 0 en un normal, 50 en Aged Brie) no se vuelve a
+visitar nunca.
+
+Las lecturas de sell_in y quality retornan exactamente los mismos valores
+que GildedRose: en cada cambio de tramo se aplica el updater real un día
+sobre una copia y el tramo nuevo parte de su resultado.
+
+Solo los updaters integrados (normal, conjurado, Aged Brie, backstage y
+Sulfuras) tienen forma cerrada; los items con otros updaters (registrados o
+de un archivo de reglas) se actualizan cada día con su updater, como en
+MultiStore. Asignar sell_in o quality a un item lo reprograma; cambiar su
+nombre o los updaters registrados requiere reclassify().
+"""
+
+from src.gilded_rose import (
+    AgedBrieUpdater, BackstagePassUpdater, ConjuredItemUpdater, Item,
+    NormalItemUpdater, SulfurasUpdater, UpdaterFactory,
+)
+
+
+_NORMAL = 0
+_BRIE = 1
+_BACKSTAGE = 2
+_SULFURAS = 3
+
+_KINDS = {
+    NormalItemUpdater: (_NORMAL, 1),
+    ConjuredItemUpdater: (_NORMAL, 2),
+    AgedBrieUpdater: (_BRIE, 1),
+    BackstagePassUpdater: (_BACKSTAGE, 1),
+    SulfurasUpdater: (_SULFURAS, 0),
+}
+
+
+class WheelItem:
+    """Item cuyo sell_in y quality se derivan del día actual del motor"""
+
+    __slots__ = ("name", "_wheel", "_kind", "_step", "_updater", "_expiry",
+                 "_base_quality", "_base_day", "_rate", "_version")
+
+    def __init__(self, wheel, name, sell_in, quality, kind, step, updater):
+        self.name = name
+        self._wheel = wheel
+        self._kind = kind
+        self._step = step
+        self._updater = updater
+        # Sulfuras no envejece: _expiry guarda su sell_in fijo
+        self._expiry = sell_in if kind == _SULFURAS else wheel.day + sell_in
+        self._base_quality = quality
+        self._base_day = wheel.day
+        self._rate = 0
+        self._version = 0
+
+    @property
+    def sell_in(self):
+        if self._kind == _SULFURAS:
+            return self._expiry
+        return self._expiry - self._wheel.day
+
+    @sell_in.setter
+    def sell_in(self, value):
+        quality = self.quality
+        self._expiry = value if self._kind == _SULFURAS else self._wheel.day + value
+        self._wheel._rebase(self, quality)
+
+    @property
+    def quality(self):
+        rate = self._rate
+        elapsed = self._wheel.day - self._base_day
+        if not rate or not elapsed:
+            return self._base_quality
+        value = self._base_quality + rate * elapsed
+        # Los límites son absorbentes: basta con aplicarlos al final del tramo
+        return max(0, value) if rate < 0 else min(50, value)
+
+    @quality.setter
+    def quality(self, value):
+        self._wheel._rebase(self, value)
+
+    def __repr__(self):
+        return "%s, %s, %s" % (self.name, self.sell_in, self.quality)
+
+
+class ExpiryWheel:
+    """Inventario con caducidades absolutas y cambios de ritmo agendados por día.
+
+    Sigue el protocolo de motores del fuzzer: ExpiryWheel(items) retorna un
+    objeto con update_quality() e items.
+    """
+
+    def __init__(self, items=()):
+        self.day = 0
+        self.items = []
+        # Contadores: cambios de tramo aplicados y actualizaciones diarias
+        # de items sin forma cerrada
+        self.rebased = 0
+        self.scanned = 0
+        self._buckets = {}
+        self._expiries = {}
+        self._scan = []
+        for item in items:
+            self.add(item)
+
+    def __len__(self):
+        return len(self.items)
+
+    def add(self, item):
+        """Añade un item (name, sell_in, quality) y retorna su versión del motor"""
+        updater = UpdaterFactory.get_updater(item)
+        kind = _KINDS.get(type(updater))
+        if kind is None:
+            added = Item(item.name, item.sell_in, item.quality)
+            self._scan.append((updater.update, added))
+        else:
+            added = WheelItem(self, item.name, item.sell_in, item.quality,
+                              kind[0], kind[1], updater)
+            self._rebase(added, item.quality)
+        self.items.append(added)
+        return added
+
+    def reclassify(self):
+        """Vuelve a resolver el updater de cada item (tras renombrar o registrar)"""
+        items = [Item(item.name, item.sell_in, item.quality) for item in self.items]
+        self.items = []
+        self._buckets = {}
+        self._expiries = {}
+        self._scan = []
+        for item in items:
+            self.add(item)
+
+    def update_quality(self):
+        """Avanza un día: solo se visitan los items con un cambio de tramo"""
+        today = self.day
+        for item, version in self._buckets.pop(today, ()):
+            if item._version == version:
+                self._advance_segment(item)
+        self._expiries.pop(today - 1, None)
+        self.day = today + 1
+        for update, item in self._scan:
+            update(item)
+        self.scanned += len(self._scan)
+
+    def newly_expired(self):
+        """Items que caducaron con el último update_quality() (sell_in == -1)"""
+        return [
+            item for item, version in self._expiries.get(self.day - 1, ())
+            if item._version == version and item._expiry == self.day - 1
+        ]
+
+    def _advance_segment(self, item):
+        # Un día real con el updater, sobre una copia, y un tramo nuevo desde
+        # su resultado: los bordes (caducidad, bandas) son exactos
+        scratch = Item(item.name, item.sell_in, item.quality)
+        item._updater.update(scratch)
+        self._rebase(item, scratch.quality, self.day + 1)
+
+    def _rebase(self, item, quality, day=None):
+        """Empieza un tramo en `day` (hoy por defecto) y agenda su próximo cambio"""
+        if day is None:
+            day = self.day
+        self.rebased += 1
+        item._version += 1
+        item._base_quality = quality
+        item._base_day = day
+        item._rate = 0
+        if item._kind == _SULFURAS:
+            return
+        if item._expiry >= day - 1:
+            self._expiries.setdefault(item._expiry, []).append((item, item._version))
+        sell_in = item._expiry - day
+        if item._kind == _NORMAL:
+            self._plan_linear(item, day, quality, -item._step, 0, sell_in)
+        elif item._kind == _BRIE:
+            self._plan_linear(item, day, quality, item._step, 50, sell_in)
+        else:
+            self._plan_backstage(item, day, quality, sell_in)
+
+    def _plan_linear(self, item, day, quality, rate, bound, sell_in):
+        # Antes de caducar el ritmo es `rate`; desde el día de caducidad, el
+        # doble y ya no cambia
+        if sell_in <= 0:
+            item._rate = 2 * rate
+            return
+        item._rate = rate
+        if quality * rate >= bound * rate:
+            # Saturado: no cambia más
+            item._rate = 0 if quality == bound else rate
+            return
+        change = item._expiry
+        if (quality + rate * (change - day) - bound) * rate >= 0:
+            # Llega al límite antes de caducar: no hace falta visitarlo
+            return
+        self._schedule(item, change)
+
+    def _plan_backstage(self, item, day, quality, sell_in):
+        if sell_in <= 0:
+            # El concierto es hoy: al avanzar el día la calidad pasa a 0
+            if quality:
+                self._schedule(item, day)
+            return
+        item._rate = 1 + (sell_in < 11) + (sell_in < 6)
+        if sell_in >= 11:
+            change = item._expiry - 10
+        elif sell_in >= 6:
+            change = item._expiry - 5
+        else:
+            change = item._expiry
+        if quality + item._rate * (change - day) >= 50:
+            # Saturado en 50 antes de la siguiente banda: solo queda el concierto
+            change = item._expiry
+        self._schedule(item, change)
+
+    def _schedule(self, item, day):
+        self._buckets.setdefault(day, []).append((item, item._version))
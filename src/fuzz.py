@@ -0,0 +1,191 @@
+"""
+Fuzzer diferencial para motores de actualización del inventario.
+Genera inventarios aleatorios (con valores límite de sell_in y quality), los
+simula un número aleatorio de días con el motor de referencia (GildedRose y
+sus ItemUpdater) y con un motor alternativo, y reporta la primera divergencia
+junto con los tiempos de cada motor.
+
+Un motor es cualquier callable que recibe una lista de Item y retorna un
+objeto con `update_quality()` y un atributo `items` cuyos elementos exponen
+`name`, `sell_in` y `quality`.
+
+Uso:
+    python -m src.fuzz --engine paquete.modulo:Motor [--runs 200] [--seed 0]
+"""
+
+import argparse
+import random
+import time
+
+from src.gilded_rose import GildedRose, Item
+
+
+SPECIAL_NAMES = [
+    "Aged Brie",
+    "Backstage passes to a TAFKAL80ETC concert",
+    "Sulfuras, Hand of Ragnaros",
+    "Conjured Mana Cake",
+]
+
+NORMAL_NAMES = [
+    "+5 Dexterity Vest",
+    "Elixir of the Mongoose",
+    "Conjured Dark Blade",
+    "Backstage passes to another concert",
+]
+
+# Valores donde cambian las reglas: bandas de backstage, expiración y límites
+EDGE_SELL_IN = [11, 10, 6, 5, 1, 0, -1]
+EDGE_QUALITY = [0, 1, 49, 50, 80]
+
+
+class Divergence:
+    """Primera diferencia encontrada entre la referencia y el candidato"""
+
+    def __init__(self, run, seed, day, index, initial, expected, actual):
+        self.run = run
+        self.seed = seed
+        self.day = day
+        self.index = index
+        self.initial = initial
+        self.expected = expected
+        self.actual = actual
+
+    def __repr__(self):
+        return "run %s (seed %s) dia %s item %s %r: esperado %r, obtenido %r" % (
+            self.run, self.seed, self.day, self.index,
+            self.initial, self.expected, self.actual,
+        )
+
+
+class FuzzResult:
+    """Resultado de una sesión: divergencia (si la hay) y tiempos"""
+
+    def __init__(self):
+        self.divergence = None
+        self.runs = 0
+        self.item_days = 0
+        self.reference_seconds = 0.0
+        self.candidate_seconds = 0.0
+
+    @property
+    def ok(self):
+        return self.divergence is None
+
+    @property
+    def speedup(self):
+        """Veces que el candidato es más rápido que la referencia"""
+        if not self.candidate_seconds:
+            return None
+        return self.reference_seconds / self.candidate_seconds
+
+    def summary(self):
+        lines = [
+            "Runs: %s  item-dias: %s" % (self.runs, self.item_days),
+            "Referencia: %.4f s  Candidato: %.4f s" % (
+                self.reference_seconds, self.candidate_seconds),
+        ]
+        if self.speedup is not None:
+            lines.append("Speedup: %.2fx" % self.speedup)
+        lines.append("OK" if self.ok else "DIVERGENCIA: %r" % (self.divergence,))
+        return "\n".join(lines)
+
+
+def generate_inventory(rng, size):
+    """Genera filas (name, sell_in, quality) con mezcla de valores límite"""
+    rows = []
+    for _ in range(size):
+        name = rng.choice(SPECIAL_NAMES if rng.random() < 0.6 else NORMAL_NAMES)
+        sell_in = rng.choice(EDGE_SELL_IN) if rng.random() < 0.5 else rng.randint(-10, 30)
+        quality = rng.choice(EDGE_QUALITY) if rng.random() < 0.5 else rng.randint(0, 50)
+        rows.append((name, sell_in, quality))
+    return rows
+
+
+def snapshot(engine):
+    """Estado comparable del inventario de un motor"""
+    return [(item.name, item.sell_in, item.quality) for item in engine.items]
+
+
+def run_differential(candidate, reference=GildedRose, runs=100, size=50,
+                     max_days=60, seed=0, time_budget=None):
+    """Compara candidato y referencia sobre inventarios aleatorios.
+    Se detiene en la primera divergencia o al agotar time_budget (segundos)."""
+    result = FuzzResult()
+    deadline = None if time_budget is None else time.perf_counter() + time_budget
+    timer = time.perf_counter
+
+    for run in range(runs):
+        if deadline is not None and timer() > deadline:
+            break
+        run_seed = seed * 1000003 + run
+        rng = random.Random(run_seed)
+        rows = generate_inventory(rng, rng.randint(1, size))
+        days = rng.randint(1, max_days)
+
+        expected_engine = reference([Item(*row) for row in rows])
+        actual_engine = candidate([Item(*row) for row in rows])
+
+        for day in range(1, days + 1):
+            start = timer()
+            expected_engine.update_quality()
+            middle = timer()
+            actual_engine.update_quality()
+            result.reference_seconds += middle - start
+            result.candidate_seconds += timer() - middle
+
+            expected = snapshot(expected_engine)
+            actual = snapshot(actual_engine)
+            if expected != actual:
+                index = _first_difference(expected, actual)
+                result.divergence = Divergence(
+                    run, run_seed, day, index,
+                    rows[index] if index < len(rows) else None,
+                    expected[index] if index < len(expected) else None,
+                    actual[index] if index < len(actual) else None,
+                )
+                result.runs = run + 1
+                return result
+
+        result.runs = run + 1
+        result.item_days += len(rows) * days
+
+    return result
+
+
+def _first_difference(expected, actual):
+    for index, (left, right) in enumerate(zip(expected, actual)):
+        if left != right:
+            return index
+    return min(len(expected), len(actual))
+
+
+def load_engine(spec):
+    """Importa un motor a partir de 'paquete.modulo:atributo'"""
+    import importlib
+
+    module_name, _, attribute = spec.partition(":")
+    return getattr(importlib.import_module(module_name), attribute)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Fuzzer diferencial de motores")
+    parser.add_argument("--engine", default="src.gilded_rose:GildedRose",
+                        help="motor candidato como modulo:atributo")
+    parser.add_argument("--runs", type=int, default=200)
+    parser.add_argument("--size", type=int, default=200)
+    parser.add_argument("--max-days", type=int, default=60)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--time-budget", type=float, default=None)
+    args = parser.parse_args(argv)
+
+    result = run_differential(
+        load_engine(args.engine), runs=args.runs, size=args.size,
+        max_days=args.max_days, seed=args.seed, time_budget=args.time_budget,
+    )
+    print(result.summary())
+    return 0 if result.ok else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
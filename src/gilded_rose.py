@@ -95,15 +95,46 @@ class UpdaterFactory:
         "Sulfuras, Hand of Ragnaros": SulfurasUpdater(),
     }
     
+    # Updaters por prefijo de nombre, del prefijo más largo al más corto
+    _prefix_updaters = [
+        ("Conjured", ConjuredItemUpdater()),
+    ]
+    
+    # Los updaters no tienen estado: se comparten en lugar de crear
+    # una instancia nueva por item y por día
+    _default_updater = NormalItemUpdater()
+    
     @classmethod
     def get_updater(cls, item):
         """Retorna el updater apropiado para el item"""
-        # Verificar si el item es conjurado
-        if item.name.startswith("Conjured"):
-            return ConjuredItemUpdater()
+        return cls.get_updater_for_name(item.name)
+    
+    @classmethod
+    def get_updater_for_name(cls, name):
+        """Retorna el updater apropiado para un nombre de item"""
+        # Verificar prefijos (p. ej. items conjurados)
+        for prefix, updater in cls._prefix_updaters:
+            if name.startswith(prefix):
+                return updater
         
         # Retornar el updater específico o el normal por defecto
-        return cls._updaters.get(item.name, NormalItemUpdater())
+        return cls._updaters.get(name, cls._default_updater)
+    
+    @classmethod
+    def register(cls, name, updater):
+        """Registra un updater para un nombre exacto"""
+        cls._updaters[name] = updater
+    
+    @classmethod
+    def register_prefix(cls, prefix, updater):
+        """Registra un updater para los nombres que empiezan por prefix"""
+        if not prefix:
+            raise ValueError("el prefijo no puede estar vacío")
+        cls._prefix_updaters = sorted(
+            [entry for entry in cls._prefix_updaters if entry[0] != prefix]
+            + [(prefix, updater)],
+            key=lambda entry: -len(entry[0]),
+        )
 
 
 class GildedRose(object):
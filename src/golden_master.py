@@ -0,0 +1,319 @@
+"""
+Golden master comprimido y por bloques de días.
+En vez de un único archivo de texto con el inventario completo de cada día,
+el golden master es un directorio con:
+
+- initial.json.gz: filas [name, sell_in, quality] del inventario inicial.
+  Los nombres se guardan solo aquí: no cambian de un día a otro.
+- chunk-NNNNN.bin.gz: para chunk_days días consecutivos, los sell_in y las
+  quality de todos los items empaquetados como enteros de 64 bits,
+  comprimidos con gzip.
+- index.json: número de días e items, tamaño de bloque y un hash por día.
+
+verify() vuelve a simular desde el inventario inicial y compara día a día
+solo los hashes, sin descomprimir ni formatear nada; se detiene en el primer
+día distinto y entonces sí lee ese día para mostrar la diferencia. El texto
+legible (formato de Item.__repr__, como texttest_fixture) se genera bajo
+demanda: read_day() para un día y render() para la salida completa.
+
+record() con jobs > 1 genera los bloques en paralelo: el proceso principal
+simula hasta el primer día de cada bloque y lo envía a un pool de procesos,
+que simula el bloque, lo empaqueta, lo comprime y calcula los hashes. El
+pool se crea con fork donde existe, así los procesos heredan los updaters
+registrados o las reglas instaladas. Sin fork (spawn, forkserver) los
+procesos importan UpdaterFactory de cero: record() comprueba que vean las
+mismas tablas y, si no, falla en lugar de escribir hashes distintos.
+
+Uso:
+    python -m src.golden_master verify DIRECTORIO
+    python -m src.golden_master show DIRECTORIO DIA
+    python -m src.golden_master cat DIRECTORIO
+"""
+
+import array
+import gzip
+import hashlib
+import json
+import os
+import sys
+
+from src.gilded_rose import GildedRose, Item, UpdaterFactory
+
+
+DEFAULT_CHUNK_DAYS = 32
+HEADER = "OMGHAI!\n"
+INDEX_FILE = "index.json"
+INITIAL_FILE = "initial.json.gz"
+FORMAT_VERSION = 1
+
+
+class GoldenMasterError(ValueError):
+    """Golden master inexistente, incompleto o de otra versión"""
+
+
+def render_day(day, items):
+    """Texto de un día tal como lo imprime texttest_fixture"""
+    lines = ["-------- day %s --------" % day, "name, sellIn, quality"]
+    lines.extend(map(repr, items))
+    lines.append("\n")
+    return "\n".join(lines)
+
+
+def pack_day(items):
+    """sell_in de todos los items seguidos de sus quality, en bytes"""
+    values = array.array("q", [item.sell_in for item in items])
+    values.extend([item.quality for item in items])
+    return values.tobytes()
+
+
+def day_hash(data):
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+def chunk_name(chunk):
+    return "chunk-%05d.bin.gz" % chunk
+
+
+def _rows(items):
+    return [[item.name, item.sell_in, item.quality] for item in items]
+
+
+def _write_chunk(directory, chunk, days, gilded_rose):
+    """Empaqueta y comprime un bloque avanzando la simulación; retorna sus hashes"""
+    items = gilded_rose.items
+    hashes = []
+    with gzip.open(os.path.join(directory, chunk_name(chunk)), "wb", compresslevel=6) as out:
+        for day in range(days):
+            data = pack_day(items)
+            out.write(data)
+            hashes.append(day_hash(data))
+            if day + 1 < days:
+                gilded_rose.update_quality()
+    return hashes
+
+
+def _write_chunk_from_rows(directory, chunk, days, rows):
+    # Punto de entrada de los procesos del pool
+    items = [Item(name, sell_in, quality) for name, sell_in, quality in rows]
+    return _write_chunk(directory, chunk, days, GildedRose(items))
+
+
+def _pool_context():
+    import multiprocessing
+
+    if "fork" in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context("fork")
+    return multiprocessing.get_context()
+
+
+def _factory_signature():
+    """Tablas de UpdaterFactory de este proceso, comparables entre procesos"""
+    def describe(updater):
+        return (type(updater).__module__, type(updater).__qualname__,
+                getattr(updater, "category", None))
+
+    return (
+        sorted((name, describe(updater)) for name, updater in UpdaterFactory._updaters.items()),
+        [(prefix, describe(updater)) for prefix, updater in UpdaterFactory._prefix_updaters],
+        describe(UpdaterFactory._default_updater),
+    )
+
+
+def record(directory, items, days, chunk_days=DEFAULT_CHUNK_DAYS, jobs=1):
+    """Genera el golden master de `days` días (0 .. days-1) a partir de items"""
+    if days < 1 or chunk_days < 1:
+        raise ValueError("days y chunk_days deben ser positivos")
+    os.makedirs(directory, exist_ok=True)
+    initial = _rows(items)
+    with gzip.open(os.path.join(directory, INITIAL_FILE), "wt", encoding="utf-8") as out:
+        json.dump(initial, out, separators=(",", ":"))
+
+    gilded_rose = GildedRose([Item(name, sell_in, quality) for name, sell_in, quality in initial])
+    counts = [min(chunk_days, days - first_day) for first_day in range(0, days, chunk_days)]
+    if jobs > 1 and len(counts) > 1:
+        from concurrent.futures import ProcessPoolExecutor
+
+        # El proceso principal solo avanza hasta el primer día de cada bloque
+        with ProcessPoolExecutor(max_workers=jobs, mp_context=_pool_context()) as pool:
+            if pool.submit(_factory_signature).result() != _factory_signature():
+                raise GoldenMasterError(
+                    "los procesos de jobs > 1 no ven los updaters registrados "
+                    "(sin fork no se heredan); usa jobs=1")
+            futures = []
+            for chunk, count in enumerate(counts):
+                futures.append(pool.submit(_write_chunk_from_rows, directory, chunk,
+                                           count, _rows(gilded_rose.items)))
+                if chunk + 1 < len(counts):
+                    for _ in range(count):
+                        gilded_rose.update_quality()
+            chunks = [future.result() for future in futures]
+    else:
+        chunks = []
+        for chunk, count in enumerate(counts):
+            chunks.append(_write_chunk(directory, chunk, count, gilded_rose))
+            gilded_rose.update_quality()
+
+    index = {
+        "version": FORMAT_VERSION,
+        "days": days,
+        "items": len(initial),
+        "chunk_days": chunk_days,
+        "byteorder": sys.byteorder,
+        "hashes": [digest for chunk in chunks for digest in chunk],
+    }
+    with open(os.path.join(directory, INDEX_FILE), "w", encoding="utf-8") as out:
+        json.dump(index, out, separators=(",", ":"))
+    return index
+
+
+def load_index(directory):
+    path = os.path.join(directory, INDEX_FILE)
+    try:
+        with open(path, encoding="utf-8") as handle:
+            index = json.load(handle)
+    except FileNotFoundError:
+        raise GoldenMasterError("no existe %s" % path)
+    if index.get("version") != FORMAT_VERSION:
+        raise GoldenMasterError("versión de golden master no soportada: %r"
+                                % (index.get("version"),))
+    return index
+
+
+def load_initial(directory):
+    """Items del inventario inicial guardado"""
+    with gzip.open(os.path.join(directory, INITIAL_FILE), "rt", encoding="utf-8") as handle:
+        return [Item(name, sell_in, quality) for name, sell_in, quality in json.load(handle)]
+
+
+def _unpack_day(data, names, byteorder):
+    values = array.array("q")
+    values.frombytes(data)
+    if byteorder != sys.byteorder:
+        values.byteswap()
+    count = len(names)
+    return [Item(name, values[index], values[count + index])
+            for index, name in enumerate(names)]
+
+
+def read_state(directory, day, index=None, names=None):
+    """Items de un día (descomprime solo su bloque)"""
+    index = index or load_index(directory)
+    if not 0 <= day < index["days"]:
+        raise GoldenMasterError("el día %s no está en el golden master (0..%s)"
+                                % (day, index["days"] - 1))
+    if names is None:
+        names = [item.name for item in load_initial(directory)]
+    size = 16 * index["items"]
+    chunk, position = divmod(day, index["chunk_days"])
+    with gzip.open(os.path.join(directory, chunk_name(chunk)), "rb") as handle:
+        handle.seek(position * size)
+        return _unpack_day(handle.read(size), names, index["byteorder"])
+
+
+def read_day(directory, day, index=None):
+    """Texto legible de un día en el formato de Item.__repr__"""
+    return render_day(day, read_state(directory, day, index))
+
+
+def render(directory, out):
+    """Escribe la salida completa de texttest_fixture en out"""
+    index = load_index(directory)
+    names = [item.name for item in load_initial(directory)]
+    size = 16 * index["items"]
+    days = index["days"]
+    chunk_days = index["chunk_days"]
+    out.write(HEADER)
+    for chunk, first_day in enumerate(range(0, days, chunk_days)):
+        with gzip.open(os.path.join(directory, chunk_name(chunk)), "rb") as handle:
+            for day in range(first_day, min(first_day + chunk_days, days)):
+                items = _unpack_day(handle.read(size), names, index["byteorder"])
+                out.write(render_day(day, items))
+
+
+class Mismatch:
+    """Primer día en que la simulación no coincide con el golden master"""
+
+    def __init__(self, day, expected, actual):
+        self.day = day
+        self.expected = expected
+        self.actual = actual
+
+    def diff(self):
+        """Líneas distintas del día, como (esperada, obtenida)"""
+        expected = self.expected.splitlines()
+        actual = self.actual.splitlines()
+        length = max(len(expected), len(actual))
+        expected += [None] * (length - len(expected))
+        actual += [None] * (length - len(actual))
+        return [(old, new) for old, new in zip(expected, actual) if old != new]
+
+    def __repr__(self):
+        return "dia %s: %s" % (self.day, self.diff())
+
+
+def verify(directory, engine=GildedRose):
+    """Simula con `engine` y compara día a día con el golden master.
+
+    `engine` sigue el protocolo del fuzzer: recibe una lista de Item y
+    retorna un objeto con update_quality() e items. Retorna None si todos
+    los días coinciden o el primer Mismatch.
+    """
+    index = load_index(directory)
+    hashes = index["hashes"]
+    swap = index["byteorder"] != sys.byteorder
+    simulation = engine(load_initial(directory))
+    for day, expected_hash in enumerate(hashes):
+        data = pack_day(simulation.items)
+        if swap:
+            values = array.array("q")
+            values.frombytes(data)
+            values.byteswap()
+            data = values.tobytes()
+        if day_hash(data) != expected_hash:
+            return Mismatch(day, read_day(directory, day, index),
+                            render_day(day, simulation.items))
+        if day + 1 < len(hashes):
+            simulation.update_quality()
+    return None
+
+
+def main(argv=None):
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Golden master del fixture")
+    commands = parser.add_subparsers(dest="command", required=True)
+    verify_parser = commands.add_parser("verify", help="compara con la simulación actual")
+    verify_parser.add_argument("directory")
+    verify_parser.add_argument("--engine", default=None,
+                               help="motor como modulo:atributo (por defecto GildedRose)")
+    show_parser = commands.add_parser("show", help="muestra un día")
+    show_parser.add_argument("directory")
+    show_parser.add_argument("day", type=int)
+    cat_parser = commands.add_parser("cat", help="reconstruye la salida completa")
+    cat_parser.add_argument("directory")
+    args = parser.parse_args(argv)
+
+    if args.command == "show":
+        sys.stdout.write(read_day(args.directory, args.day))
+        return 0
+    if args.command == "cat":
+        render(args.directory, sys.stdout)
+        return 0
+    engine = GildedRose
+    if args.engine:
+        from src.fuzz import load_engine
+
+        engine = load_engine(args.engine)
+    mismatch = verify(args.directory, engine)
+    if mismatch is None:
+        print("OK: %s dias" % load_index(args.directory)["days"])
+        return 0
+    print("Diferencia en el dia %s" % mismatch.day)
+    for expected, actual in mismatch.diff():
+        print("- %s" % expected)
+        print("+ %s" % actual)
+    return 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
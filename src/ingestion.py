@@ -0,0 +1,159 @@
+"""
+Ingesta de items con nombres internados y códigos de categoría.
+Al cargar un inventario, cada nombre se interna (todos los items con el
+mismo nombre comparten un único string) y se clasifica una sola vez en un
+código entero pequeño, con una caché LRU por nombre. La actualización
+diaria y los reportes trabajan con el código, sin volver a comparar nombres.
+
+Los códigos identifican a los updaters de UpdaterFactory en el momento de
+clasificar. Si se registran updaters nuevos (o se instala un archivo de
+reglas) hay que llamar a Ingestor.clear_cache() y volver a ingerir, igual
+que MultiStore.reclassify().
+"""
+
+import functools
+import sys
+
+from src.gilded_rose import Item, UpdaterFactory
+
+
+intern_name = sys.intern
+
+
+class CategoryTable:
+    """Asigna un código entero a cada updater distinto"""
+
+    def __init__(self):
+        self.updaters = []
+        self._codes = {}
+
+    def __len__(self):
+        return len(self.updaters)
+
+    def code_for(self, updater):
+        code = self._codes.get(id(updater))
+        if code is None:
+            code = len(self.updaters)
+            self._codes[id(updater)] = code
+            self.updaters.append(updater)
+        return code
+
+    def label(self, code):
+        """Nombre legible de una categoría"""
+        updater = self.updaters[code]
+        return getattr(updater, "category", type(updater).__name__)
+
+
+class CacheStats:
+    """Aciertos y fallos de la caché de clasificación"""
+
+    def __init__(self, info):
+        self.hits = info.hits
+        self.misses = info.misses
+        self.size = info.currsize
+        self.maxsize = info.maxsize
+
+    @property
+    def hit_rate(self):
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def __repr__(self):
+        return "CacheStats(hits=%s, misses=%s, size=%s, hit_rate=%.3f)" % (
+            self.hits, self.misses, self.size, self.hit_rate)
+
+
+class IngestedInventory:
+    """Items ingeridos con su código de categoría en una lista paralela"""
+
+    def __init__(self, table):
+        self.table = table
+        self.items = []
+        self.codes = []
+
+    def append(self, item, code):
+        self.items.append(item)
+        self.codes.append(code)
+
+    def pop(self, index):
+        """Quita el item en la posición index junto con su código"""
+        del self.codes[index]
+        return self.items.pop(index)
+
+    def __len__(self):
+        return len(self.items)
+
+    def update_quality(self):
+        """Actualiza cada item con el updater de su código"""
+        updates = [updater.update for updater in self.table.updaters]
+        for code, item in zip(self.codes, self.items):
+            updates[code](item)
+
+    def count_by_category(self):
+        """Número de items por código de categoría"""
+        counts = [0] * len(self.table)
+        for code in self.codes:
+            counts[code] += 1
+        return counts
+
+    def report(self):
+        """Resumen por categoría: {etiqueta: (items, calidad total)}"""
+        counts = [0] * len(self.table)
+        totals = [0] * len(self.table)
+        for code, item in zip(self.codes, self.items):
+            counts[code] += 1
+            totals[code] += item.quality
+        return {
+            self.table.label(code): (counts[code], totals[code])
+            for code in range(len(self.table)) if counts[code]
+        }
+
+
+class Ingestor:
+    """Interna nombres y los clasifica con una caché LRU"""
+
+    def __init__(self, maxsize=4096):
+        self.table = CategoryTable()
+        self.classify = functools.lru_cache(maxsize=maxsize)(self._resolve)
+
+    def _resolve(self, name):
+        return self.table.code_for(UpdaterFactory.get_updater_for_name(name))
+
+    def cache_info(self):
+        return CacheStats(self.classify.cache_info())
+
+    def clear_cache(self):
+        """Olvida las clasificaciones (tras cambiar los updaters registrados)"""
+        self.classify.cache_clear()
+
+    def ingest_rows(self, rows):
+        """Crea un inventario a partir de filas (name, sell_in, quality)"""
+        inventory = IngestedInventory(self.table)
+        classify = self.classify
+        for name, sell_in, quality in rows:
+            name = intern_name(name)
+            inventory.append(Item(name, sell_in, quality), classify(name))
+        return inventory
+
+    def add(self, inventory, name, sell_in, quality):
+        """Agrega una fila a un inventario ya ingerido y retorna el item"""
+        name = intern_name(name)
+        item = Item(name, sell_in, quality)
+        inventory.append(item, self.classify(name))
+        return item
+
+    def ingest_items(self, items):
+        """Ingiere items existentes, internando su nombre"""
+        inventory = IngestedInventory(self.table)
+        classify = self.classify
+        for item in items:
+            item.name = intern_name(item.name)
+            inventory.append(item, classify(item.name))
+        return inventory
+
+    def ingest_file(self, path):
+        """Carga un JSON con filas [name, sell_in, quality]"""
+        import json
+
+        with open(path, encoding="utf-8") as handle:
+            return self.ingest_rows(json.load(handle))
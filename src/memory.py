@@ -0,0 +1,362 @@
+"""
+Seguimiento de memoria por fase para simulaciones del inventario.
+MemoryTracker mide cada fase (load, update, render) con contadores baratos
+que se toman en todas las ocurrencias:
+
+- bytes netos y pico de memoria trazada por tracemalloc durante la fase,
+- bloques netos asignados (sys.getallocatedblocks),
+- pico de RSS del proceso (resource.getrusage) al terminar la fase.
+
+La atribución por módulo y por línea sale de instantáneas de tracemalloc,
+que son caras (O(asignaciones vivas): recorren todas las trazas): solo se
+toma una cuando el pico supera en `snapshot_growth` al de la última
+instantánea, y siempre al exceder el presupuesto. Muestran la memoria viva
+al terminar la fase que marcó el pico. Las instantáneas no se filtran traza
+a traza: los archivos ignorados se quitan de las filas ya agregadas. El
+resto del sobrecoste es el del propio trazado de tracemalloc, que hace
+varias veces más lenta una simulación con muchas asignaciones.
+
+Los bloques netos se cuentan tras un gc.collect() al entrar en la fase:
+así una recolección de basura de fases anteriores no los descuenta.
+
+Con `budget` (bytes de memoria trazada) la ejecución falla en cuanto una
+fase lo supera, con MemoryBudgetExceeded y un reporte de lo que ocupa la
+memoria en ese momento. El presupuesto se comprueba al terminar cada fase
+y, en el hilo principal, también durante la fase: un hilo vigía mira la
+memoria trazada cada `interval` segundos y, si se supera, interrumpe el
+hilo principal con una señal para que falle antes de que lo mate el
+sistema. Donde no hay SIGUSR1 solo se comprueba al terminar las fases o
+con check().
+"""
+
+import _thread
+import fnmatch
+import gc
+import os
+import signal
+import sys
+import threading
+import tracemalloc
+
+
+_UNITS = {"": 1, "B": 1, "K": 2 ** 10, "KB": 2 ** 10, "M": 2 ** 20, "MB": 2 ** 20,
+          "G": 2 ** 30, "GB": 2 ** 30}
+
+
+def parse_size(text):
+    """Convierte '512K', '200MB' o '1G' en bytes"""
+    value = text.strip().upper()
+    digits = value.rstrip("KMGB")
+    unit = value[len(digits):]
+    try:
+        return int(float(digits) * _UNITS[unit])
+    except (KeyError, ValueError):
+        raise ValueError("tamaño inválido: %r (ejemplos: 512K, 200MB, 1G)" % (text,))
+
+
+def format_size(size):
+    for unit, factor in (("GB", 2 ** 30), ("MB", 2 ** 20), ("KB", 2 ** 10)):
+        if abs(size) >= factor:
+            return "%.1f %s" % (size / factor, unit)
+    return "%d B" % size
+
+
+def peak_rss():
+    """Pico de RSS del proceso en bytes, o None si no se puede medir"""
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux informa kilobytes; macOS, bytes
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+class MemoryBudgetExceeded(MemoryError):
+    """Una fase superó el presupuesto de memoria"""
+
+    def __init__(self, phase, peak, budget, report):
+        super().__init__("la fase %r llegó a %s con un presupuesto de %s" % (
+            phase, format_size(peak), format_size(budget)))
+        self.phase = phase
+        self.peak = peak
+        self.budget = budget
+        self.report = report
+
+
+class PhaseMemory:
+    """Totales de todas las ocurrencias de una fase"""
+
+    def __init__(self, name):
+        self.name = name
+        self.calls = 0
+        self.net_bytes = 0
+        self.net_blocks = 0
+        self.peak_bytes = 0
+        self.peak_rss = None
+
+
+class _Phase:
+    """Context manager que mide una ocurrencia de una fase"""
+
+    def __init__(self, tracker, name):
+        self._tracker = tracker
+        self.name = name
+        self.start_bytes = 0
+        self.start_blocks = 0
+        self.peak = 0
+
+    def __enter__(self):
+        self._tracker._enter(self)
+        return self
+
+    def __exit__(self, exc_type, *exc_info):
+        self._tracker._exit(self, check=exc_type is None)
+        return False
+
+
+class MemoryTracker:
+    """Mide memoria trazada, bloques y RSS por fase, con presupuesto opcional"""
+
+    def __init__(self, budget=None, snapshot_growth=0.1, top=8, frames=1, interval=0.01):
+        self.budget = budget
+        self.snapshot_growth = snapshot_growth
+        self.top = top
+        self.frames = frames
+        self.interval = interval
+        self.phases = {}
+        self.peak_phase = None
+        self.peak_snapshot = None
+        self._snapshot_peak = 0
+        self._stack = []
+        self._exiting = False
+        self._started_tracing = False
+        self._stop = threading.Event()
+        self._thread = None
+        self._previous_handler = None
+
+    def start(self):
+        # Los filtros de las instantáneas compilan sus patrones la primera
+        # vez; se compilan antes de trazar para que no cuenten en el reporte
+        for pattern in self._ignored():
+            fnmatch.fnmatch(__file__, pattern)
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(self.frames)
+            self._started_tracing = True
+        if self.budget is not None and self.interval:
+            self._start_watchdog()
+        return self
+
+    def stop(self):
+        self._stop_watchdog()
+        if self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
+        return self
+
+    def _start_watchdog(self):
+        # Las señales solo se atienden en el hilo principal
+        if (not hasattr(signal, "SIGUSR1")
+                or threading.current_thread() is not threading.main_thread()):
+            return
+        self._previous_handler = signal.signal(signal.SIGUSR1, self._on_signal)
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._watch, name="memory-watchdog", daemon=True)
+        self._thread.start()
+
+    def _stop_watchdog(self):
+        if self._thread is None:
+            return
+        self._stop.set()
+        self._thread.join()
+        self._thread = None
+        signal.signal(signal.SIGUSR1, self._previous_handler)
+        self._previous_handler = None
+
+    def _watch(self):
+        while not self._stop.wait(self.interval):
+            if self._stack and tracemalloc.get_traced_memory()[1] > self.budget:
+                _thread.interrupt_main(signal.SIGUSR1)
+                return
+
+    def _on_signal(self, signum, frame):
+        # Si la fase ya está terminando, su propia comprobación falla
+        if self._stack and not self._exiting:
+            self.check(self._stack[-1].name)
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+        return False
+
+    def phase(self, name):
+        """Marca una fase de la simulación (load, update, render, ...)"""
+        return _Phase(self, name)
+
+    def _enter(self, phase):
+        gc.collect()
+        current, peak = tracemalloc.get_traced_memory()
+        if self._stack:
+            # El pico de la fase exterior no se pierde al reiniciarlo
+            parent = self._stack[-1]
+            parent.peak = max(parent.peak, peak)
+        tracemalloc.reset_peak()
+        phase.start_bytes = current
+        phase.start_blocks = sys.getallocatedblocks()
+        phase.peak = current
+        self._stack.append(phase)
+
+    def _exit(self, phase, check=True):
+        self._exiting = True
+        try:
+            self._close(phase, check)
+        finally:
+            self._exiting = False
+
+    def _close(self, phase, check):
+        self._stack.pop()
+        current, peak = tracemalloc.get_traced_memory()
+        peak = max(phase.peak, peak)
+        if self._stack:
+            parent = self._stack[-1]
+            parent.peak = max(parent.peak, peak)
+
+        stats = self.phases.get(phase.name)
+        if stats is None:
+            stats = self.phases[phase.name] = PhaseMemory(phase.name)
+        stats.calls += 1
+        stats.net_bytes += current - phase.start_bytes
+        stats.net_blocks += sys.getallocatedblocks() - phase.start_blocks
+        stats.peak_bytes = max(stats.peak_bytes, peak)
+        rss = peak_rss()
+        if rss is not None:
+            stats.peak_rss = max(stats.peak_rss or 0, rss)
+
+        exceeded = check and self.budget is not None and peak > self.budget
+        if exceeded or peak > self._snapshot_peak * (1 + self.snapshot_growth):
+            self._take_snapshot(phase.name, peak)
+        if exceeded:
+            raise MemoryBudgetExceeded(phase.name, peak, self.budget, self.report())
+
+    def _take_snapshot(self, phase, peak):
+        self.peak_phase = phase
+        self._snapshot_peak = peak
+        # Sin filter_traces: filtrar cada traza en Python costaría más que la
+        # instantánea; los archivos ignorados se quitan de las filas agregadas
+        self.peak_snapshot = tracemalloc.take_snapshot()
+
+    @staticmethod
+    def _ignored():
+        # El propio seguimiento y la maquinaria de import no son del inventario
+        return (tracemalloc.__file__, __file__, "<frozen importlib._bootstrap*>")
+
+    def check(self, phase="(sin fase)"):
+        """Comprueba el presupuesto dentro de una fase larga"""
+        current = tracemalloc.get_traced_memory()[1]
+        if self._stack:
+            current = max(current, self._stack[-1].peak)
+        if self.budget is not None and current > self.budget:
+            self._take_snapshot(phase, current)
+            raise MemoryBudgetExceeded(phase, current, self.budget, self.report())
+
+    def top_modules(self, limit=None):
+        """[(módulo, bytes, bloques), ...] vivos en la instantánea del pico"""
+        return self._statistics("filename", limit)
+
+    def top_lines(self, limit=None):
+        """[('módulo:línea', bytes, bloques), ...] vivos en la instantánea del pico"""
+        return self._statistics("lineno", limit)
+
+    def _statistics(self, key, limit):
+        if self.peak_snapshot is None:
+            return []
+        rows = []
+        limit = limit or self.top
+        ignored = self._ignored()
+        for stat in self.peak_snapshot.statistics(key):
+            if len(rows) >= limit:
+                break
+            frame = stat.traceback[0]
+            if any(fnmatch.fnmatch(frame.filename, pattern) for pattern in ignored):
+                continue
+            label = _module_label(frame.filename)
+            if key == "lineno":
+                label = "%s:%s" % (label, frame.lineno)
+            rows.append((label, stat.size, stat.count))
+        return rows
+
+    def summary(self):
+        lines = [
+            "Memoria por fase (tracemalloc):",
+            "%-12s %7s %12s %12s %12s %12s" % (
+                "Fase", "Veces", "Neto", "Bloques", "Pico", "RSS pico"),
+        ]
+        for stats in self.phases.values():
+            lines.append("%-12s %7d %12s %12d %12s %12s" % (
+                stats.name, stats.calls, format_size(stats.net_bytes), stats.net_blocks,
+                format_size(stats.peak_bytes),
+                format_size(stats.peak_rss) if stats.peak_rss is not None else "-"))
+        return "\n".join(lines)
+
+    def report(self):
+        """Resumen por fase y atribución por módulo y línea en el pico"""
+        lines = [self.summary()]
+        if self.budget is not None:
+            lines.append("Presupuesto: %s" % format_size(self.budget))
+        if self.peak_snapshot is not None:
+            lines.append("Memoria viva al terminar la fase del pico (%s), por módulo:"
+                         % self.peak_phase)
+            for label, size, count in self.top_modules():
+                lines.append("  %12s %10d bloques  %s" % (format_size(size), count, label))
+            lines.append("Por línea:")
+            for label, size, count in self.top_lines():
+                lines.append("  %12s %10d bloques  %s" % (format_size(size), count, label))
+        return "\n".join(lines)
+
+
+def _module_label(filename):
+    # Rutas relativas al directorio actual para el código del proyecto
+    relative = os.path.relpath(filename)
+    return filename if relative.startswith("..") else relative
+
+
+class MemoryRecorder:
+    """Recorder de los puntos de entrada: mide memoria y reporta al terminar"""
+
+    def __init__(self, budget=None, report=None):
+        self.report = report
+        self.tracker = MemoryTracker(budget=budget).start()
+
+    def phase(self, name):
+        return _RecorderPhase(self, self.tracker.phase(name))
+
+    def finish(self):
+        self.tracker.stop()
+        if self.report is not None:
+            self.report.write(self.tracker.report() + "\n")
+
+
+class _RecorderPhase:
+    """Convierte un presupuesto excedido en una salida con el reporte"""
+
+    def __init__(self, recorder, phase):
+        self._recorder = recorder
+        self._phase = phase
+
+    def __enter__(self):
+        self._phase.__enter__()
+        return self
+
+    def __exit__(self, exc_type, error, traceback):
+        try:
+            self._phase.__exit__(exc_type, error, traceback)
+        except MemoryBudgetExceeded as exceeded:
+            error = exceeded
+        # El vigía lanza la excepción dentro de la fase; la comprobación
+        # final, al salir
+        if isinstance(error, MemoryBudgetExceeded):
+            self._recorder.tracker.stop()
+            raise SystemExit("Presupuesto de memoria excedido: %s\n%s" % (error, error.report))
+        return False
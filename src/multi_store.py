@@ -0,0 +1,107 @@
+"""
+Contenedor de múltiples tiendas Gilded Rose.
+Todas las tiendas comparten una única lista de items y se actualizan en una
+sola pasada, en lugar de un GildedRose y un update_quality() por tienda.
+Cada tienda ocupa un bloque contiguo de la lista compartida y se consulta
+mediante una vista (StoreView) con sus propias estadísticas.
+"""
+
+from src.gilded_rose import UpdaterFactory
+
+
+class StoreView:
+    """Vista de una tienda sobre la lista compartida del MultiStore"""
+
+    def __init__(self, owner, name, start, end):
+        self._owner = owner
+        self.name = name
+        self.start = start
+        self.end = end
+
+    @property
+    def items(self):
+        return self._owner.items[self.start:self.end]
+
+    def __len__(self):
+        return self.end - self.start
+
+    def __iter__(self):
+        items = self._owner.items
+        for index in range(self.start, self.end):
+            yield items[index]
+
+    def __getitem__(self, index):
+        if not -len(self) <= index < len(self):
+            raise IndexError("item fuera de la tienda %r" % self.name)
+        return self._owner.items[self.start + index % len(self)]
+
+    def update_quality(self):
+        """Actualiza solo los items de esta tienda"""
+        self._owner._update_range(self.start, self.end)
+
+    def stats(self):
+        """Estadísticas de la tienda"""
+        count = expired = total_quality = 0
+        for item in self:
+            count += 1
+            total_quality += item.quality
+            if item.sell_in < 0:
+                expired += 1
+        return {
+            "count": count,
+            "expired": expired,
+            "total_quality": total_quality,
+            "average_quality": total_quality / count if count else 0.0,
+        }
+
+
+class MultiStore:
+    """Inventario de muchas tiendas con una lista de items compartida.
+
+    El updater de cada item se resuelve una sola vez al añadir la tienda. Si
+    se cambia el nombre de un item o se registran updaters nuevos en
+    UpdaterFactory, hay que llamar a reclassify()."""
+
+    def __init__(self):
+        self.items = []
+        self._updates = []
+        self._stores = {}
+
+    def add_store(self, name, items):
+        """Añade una tienda con sus items y retorna su vista"""
+        if name in self._stores:
+            raise ValueError("la tienda %r ya existe" % name)
+        start = len(self.items)
+        for item in items:
+            self.items.append(item)
+            self._updates.append(UpdaterFactory.get_updater(item).update)
+        view = StoreView(self, name, start, len(self.items))
+        self._stores[name] = view
+        return view
+
+    def store(self, name):
+        """Retorna la vista de una tienda"""
+        return self._stores[name]
+
+    @property
+    def stores(self):
+        return list(self._stores.values())
+
+    def update_quality(self):
+        """Actualiza todas las tiendas en una sola pasada"""
+        for update, item in zip(self._updates, self.items):
+            update(item)
+
+    def stats(self):
+        """Estadísticas de todas las tiendas, por nombre"""
+        return {name: view.stats() for name, view in self._stores.items()}
+
+    def reclassify(self):
+        """Vuelve a resolver el updater de cada item"""
+        self._updates = [UpdaterFactory.get_updater(item).update for item in self.items]
+
+    def _update_range(self, start, end):
+        updates = self._updates
+        items = self.items
+        for index in range(start, end):
+            updates[index](items[index])
@@ -0,0 +1,284 @@
+"""
+Log de operaciones (write-ahead) para replicar un inventario.
+LoggedGildedRose registra cada tick y cada mutación en un archivo
+append-only, una línea JSON compacta por operación, antes de aplicarla.
+Una Replica lee el mismo archivo y reproduce las operaciones en orden, de
+forma determinista, hasta alcanzar el mismo estado que el primario.
+
+Registros (cada uno salvo la instantánea avanza el número de secuencia, lsn):
+
+    ["S", lsn, day, [[name, sell_in, quality], ...]]   instantánea
+    ["T"]                                            tick (un día)
+    ["A", name, sell_in, quality]                    alta al final
+    ["R", index]                                     baja por índice
+    ["U", index, sell_in, quality]                   cambio de valores
+
+Escritura:
+
+- Los registros se acumulan en memoria y se escriben en lotes de
+  batch_size (o al llamar a flush()). La réplica solo ve lo ya escrito.
+- fsync="always" escribe y sincroniza cada registro; "batch" sincroniza una
+  vez por lote; "never" deja la sincronización al sistema operativo.
+- compact() reemplaza el log por una única instantánea del estado actual
+  (escritura en un temporal y os.replace). Las réplicas detectan el archivo
+  nuevo y continúan desde la instantánea sin perder operaciones.
+
+Las mutaciones deben hacerse con add(), remove() y set(): un cambio directo
+sobre un Item no queda en el log. Primario y réplica deben usar los mismos
+updaters (o el mismo archivo de reglas) para que los ticks coincidan.
+"""
+
+import json
+import os
+
+from src.gilded_rose import GildedRose, Item
+from src.ingestion import intern_name
+
+
+FSYNC_POLICIES = ("always", "batch", "never")
+
+_SEPARATORS = (",", ":")
+
+
+class OplogError(ValueError):
+    """Registro del log inválido"""
+
+
+def _encode(record):
+    return (json.dumps(record, separators=_SEPARATORS) + "\n").encode("utf-8")
+
+
+def _snapshot_record(lsn, day, items):
+    return ["S", lsn, day, [[item.name, item.sell_in, item.quality] for item in items]]
+
+
+class OperationLog:
+    """Archivo append-only con escritura por lotes y política de fsync"""
+
+    def __init__(self, path, fsync="batch", batch_size=64, lsn=0):
+        if fsync not in FSYNC_POLICIES:
+            raise ValueError("política de fsync desconocida: %r" % (fsync,))
+        if batch_size < 1:
+            raise ValueError("batch_size debe ser positivo")
+        self.path = path
+        self.fsync = fsync
+        self.batch_size = 1 if fsync == "always" else batch_size
+        self.lsn = lsn
+        self.flushed_lsn = lsn
+        self.batches = 0
+        self.fsyncs = 0
+        self.bytes_written = 0
+        self._buffer = []
+        self._handle = open(path, "ab")
+
+    def append(self, record):
+        """Encola un registro de operación y retorna su lsn"""
+        self._buffer.append(_encode(record))
+        self.lsn += 1
+        if len(self._buffer) >= self.batch_size:
+            self.flush()
+        return self.lsn
+
+    def flush(self):
+        """Escribe el lote pendiente (y lo sincroniza según la política)"""
+        if not self._buffer:
+            return
+        data = b"".join(self._buffer)
+        self._buffer.clear()
+        self._handle.write(data)
+        self._handle.flush()
+        self.bytes_written += len(data)
+        self.flushed_lsn = self.lsn
+        self.batches += 1
+        if self.fsync != "never":
+            os.fsync(self._handle.fileno())
+            self.fsyncs += 1
+
+    def rewrite(self, record):
+        """Reemplaza el log completo por un único registro (instantánea)"""
+        self.flush()
+        temporary = self.path + ".tmp"
+        data = _encode(record)
+        with open(temporary, "wb") as handle:
+            handle.write(data)
+            handle.flush()
+            if self.fsync != "never":
+                os.fsync(handle.fileno())
+        self._handle.close()
+        os.replace(temporary, self.path)
+        self._handle = open(self.path, "ab")
+        self.bytes_written += len(data)
+
+    def size(self):
+        """Tamaño actual del archivo en bytes"""
+        return os.path.getsize(self.path)
+
+    def close(self):
+        self.flush()
+        self._handle.close()
+
+
+class LoggedGildedRose(GildedRose):
+    """GildedRose que registra ticks y mutaciones en un OperationLog"""
+
+    def __init__(self, items, log, day=0):
+        super().__init__(list(items))
+        self.log = log
+        self.day = day
+        if log.lsn == 0:
+            if log.size():
+                # Sin la instantánea, las réplicas seguirían el estado anterior
+                raise OplogError("%s ya tiene registros: usa LoggedGildedRose.recover() "
+                                 "para continuarlo" % (log.path,))
+            log.rewrite(_snapshot_record(0, day, self.items))
+
+    @classmethod
+    def recover(cls, path, **options):
+        """Reconstruye el primario desde su log y sigue escribiendo en él"""
+        replica = Replica(path)
+        try:
+            replica.poll()
+        finally:
+            replica.close()
+        # Una última línea incompleta (escritura interrumpida) se descarta. Si
+        # solo había la instantánea inicial, se vuelve a escribir completa
+        with open(path, "ab") as handle:
+            handle.truncate(replica.offset if replica.lsn else 0)
+        log = OperationLog(path, lsn=replica.lsn, **options)
+        return cls(replica.items, log, day=replica.day)
+
+    @property
+    def lsn(self):
+        return self.log.lsn
+
+    def update_quality(self):
+        self.log.append(["T"])
+        super().update_quality()
+        self.day += 1
+
+    def add(self, name, sell_in, quality):
+        """Agrega un item al final del inventario"""
+        item = Item(intern_name(name), int(sell_in), int(quality))
+        self.log.append(["A", item.name, item.sell_in, item.quality])
+        self.items.append(item)
+        return item
+
+    def remove(self, index):
+        """Quita el item en la posición index"""
+        item = self.items[index]
+        self.log.append(["R", index])
+        del self.items[index]
+        return item
+
+    def set(self, index, sell_in=None, quality=None):
+        """Cambia sell_in y/o quality del item en la posición index"""
+        item = self.items[index]
+        sell_in = item.sell_in if sell_in is None else int(sell_in)
+        quality = item.quality if quality is None else int(quality)
+        self.log.append(["U", index, sell_in, quality])
+        item.sell_in = sell_in
+        item.quality = quality
+        return item
+
+    def flush(self):
+        self.log.flush()
+
+    def compact(self):
+        """Reemplaza el log por una instantánea del estado actual"""
+        self.log.rewrite(_snapshot_record(self.log.lsn, self.day, self.items))
+
+    def close(self):
+        self.log.close()
+
+
+class Replica:
+    """Reproduce un log de operaciones a medida que el primario lo escribe"""
+
+    def __init__(self, path):
+        self.path = path
+        self.gilded_rose = GildedRose([])
+        self.day = 0
+        self.lsn = 0
+        self.offset = 0
+        self.applied = 0
+        self._skip = 0
+        self._pending = b""
+        self._handle = open(path, "rb")
+
+    @property
+    def items(self):
+        return self.gilded_rose.items
+
+    def poll(self):
+        """Aplica los registros completos escritos desde la última lectura"""
+        self._follow_rotation()
+        buffer = self._pending + self._handle.read()
+        if b"\n" not in buffer:
+            self._pending = buffer
+            return 0
+        lines = buffer.split(b"\n")
+        self._pending = lines.pop()
+        applied = 0
+        for index, line in enumerate(lines):
+            try:
+                record = json.loads(line)
+                applied += self._apply(record)
+            except (ValueError, TypeError, IndexError, KeyError) as error:
+                # Las líneas desde la inválida se conservan: un nuevo poll()
+                # vuelve a fallar en ella en lugar de saltarse registros
+                self._pending = b"\n".join(lines[index:] + [self._pending])
+                self.applied += applied
+                raise OplogError("registro inválido en el byte %s: %s" % (self.offset, error))
+            self.offset += len(line) + 1
+        self.applied += applied
+        return applied
+
+    def _follow_rotation(self):
+        # compact() reemplaza el archivo: se sigue leyendo desde el nuevo
+        try:
+            current = os.stat(self.path).st_ino
+        except FileNotFoundError:
+            return
+        if current != os.fstat(self._handle.fileno()).st_ino:
+            self._handle.close()
+            self._handle = open(self.path, "rb")
+            self._pending = b""
+            self.offset = 0
+
+    def _apply(self, record):
+        kind = record[0]
+        if kind == "S":
+            lsn = record[1]
+            if lsn >= self.lsn:
+                self.gilded_rose.items = [
+                    Item(intern_name(name), sell_in, quality)
+                    for name, sell_in, quality in record[3]
+                ]
+                self.day = record[2]
+                self.lsn = lsn
+                self._skip = 0
+            else:
+                self._skip = self.lsn - lsn
+            return 0
+        if self._skip:
+            self._skip -= 1
+            return 0
+        items = self.gilded_rose.items
+        if kind == "T":
+            self.gilded_rose.update_quality()
+            self.day += 1
+        elif kind == "A":
+            items.append(Item(intern_name(record[1]), record[2], record[3]))
+        elif kind == "R":
+            del items[record[1]]
+        elif kind == "U":
+            item = items[record[1]]
+            item.sell_in = record[2]
+            item.quality = record[3]
+        else:
+            raise OplogError("tipo de registro desconocido: %r" % (kind,))
+        self.lsn += 1
+        return 1
+
+    def close(self):
+        self._handle.close()
@@ -0,0 +1,209 @@
+"""
+Planificador de liquidación basado en curvas de valor a N días.
+Para cada item se deriva su curva futura de (sell_in, quality) aplicando su
+ItemUpdater sobre una copia, una sola vez. La pérdida de valor de un item
+en los próximos `horizon` días se lee de la curva, y los items se ordenan en
+un heap de máximos para consultar los k que más valor van a perder.
+
+Tras cada update_quality() basta con llamar a advance(): las curvas ya
+contienen el futuro, así que solo se recalculan los items cuya pérdida
+cambia ese día. Cada item está agendado en un cubo por día con la próxima
+fecha en la que su pérdida cambia, y el heap usa borrado perezoso por
+versión.
+
+Los items modificados fuera de update_quality() deben pasar por refresh().
+Sin refresh(), el cambio solo se detecta cuando el item se vuelve a visitar:
+en su próximo día agendado o si top() lo saca del heap antes de completar
+los k resultados. Hasta entonces el ranking usa la curva anterior.
+"""
+
+import heapq
+
+from src.gilded_rose import Item, UpdaterFactory
+
+
+# Días que se simulan de una vez al extender una curva
+CURVE_CHUNK = 32
+
+
+class ValueCurve:
+    """Estados futuros de un item según su updater: índice 0 = hoy"""
+
+    def __init__(self, item):
+        self.updater = UpdaterFactory.get_updater(item)
+        self._scratch = Item(item.name, item.sell_in, item.quality)
+        self.sell_in = [item.sell_in]
+        self.quality = [item.quality]
+
+    def extend(self, until):
+        """Simula hasta tener al menos until + 1 estados"""
+        scratch = self._scratch
+        update = self.updater.update
+        while len(self.quality) <= until:
+            for _ in range(CURVE_CHUNK):
+                update(scratch)
+                self.sell_in.append(scratch.sell_in)
+                self.quality.append(scratch.quality)
+
+    def quality_at(self, day):
+        if day >= len(self.quality):
+            self.extend(day)
+        return self.quality[day]
+
+    def sell_in_at(self, day):
+        if day >= len(self.sell_in):
+            self.extend(day)
+        return self.sell_in[day]
+
+    def drop(self, days):
+        """Descarta los primeros días ya pasados de la curva"""
+        del self.sell_in[:days]
+        del self.quality[:days]
+
+
+class _Entry:
+    """Estado del planificador para un item"""
+
+    __slots__ = ("item", "curve", "start", "seq", "version", "loss")
+
+    def __init__(self, item, start, seq):
+        self.item = item
+        self.curve = ValueCurve(item)
+        self.start = start
+        self.seq = seq
+        self.version = 0
+        self.loss = None
+
+
+class SellOffPlanner:
+    """Ranking incremental de items por valor que perderán en `horizon` días.
+
+    Uso:
+        planner = SellOffPlanner(items, horizon=7)
+        gilded_rose.update_quality()
+        planner.advance()
+        planner.top(10)   # [(item, perdida), ...] de mayor a menor pérdida
+    """
+
+    def __init__(self, items=(), horizon=7, lookahead=None):
+        if horizon < 1:
+            raise ValueError("horizon debe ser al menos 1")
+        self.horizon = horizon
+        # Días que se buscan hacia delante el próximo cambio de pérdida; un
+        # item sin cambios se revisa al agotarlos. Las curvas se derivan de
+        # updaters arbitrarios, así que no se asume que se estabilicen.
+        self.lookahead = lookahead or max(CURVE_CHUNK, 4 * horizon)
+        self.day = 0
+        self.recomputed = 0
+        self._entries = {}
+        self._heap = []
+        self._buckets = {}
+        self._seq = 0
+        self._version = 0
+        for item in items:
+            self.add(item)
+
+    def __len__(self):
+        return len(self._entries)
+
+    def add(self, item):
+        """Empieza a planificar un item"""
+        entry = _Entry(item, self.day, self._seq)
+        self._seq += 1
+        self._entries[id(item)] = entry
+        self._rescore(entry)
+
+    def remove(self, item):
+        """Deja de planificar un item (vendido o retirado)"""
+        self._entries.pop(id(item))
+
+    def refresh(self, item):
+        """Recalcula la curva de un item modificado fuera de update_quality"""
+        self.remove(item)
+        self.add(item)
+
+    def advance(self, days=1):
+        """Avanza el plan tras `days` llamadas a update_quality()"""
+        for _ in range(days):
+            self.day += 1
+            for entry_id, version in self._buckets.pop(self.day, ()):
+                entry = self._entries.get(entry_id)
+                if entry is None or entry.version != version:
+                    continue
+                if self._matches_curve(entry):
+                    self._rescore(entry)
+                else:
+                    self.refresh(entry.item)
+
+    def loss(self, item):
+        """Pérdida de calidad prevista del item en los próximos horizon días"""
+        return self._entries[id(item)].loss
+
+    def top(self, k):
+        """Los k items que más valor perderán, de mayor a menor pérdida"""
+        result = []
+        kept = []
+        # refresh() puede compactar y reemplazar self._heap: no se guarda
+        # una referencia local a la lista
+        while self._heap and len(result) < k:
+            record = heapq.heappop(self._heap)
+            entry = self._entries.get(record[2])
+            if entry is None or entry.version != record[3]:
+                continue
+            if not self._matches_curve(entry):
+                self.refresh(entry.item)
+                continue
+            result.append((entry.item, entry.loss))
+            kept.append(record)
+        for record in kept:
+            heapq.heappush(self._heap, record)
+        return result
+
+    def _offset(self, entry):
+        return self.day - entry.start
+
+    def _loss_at(self, entry, offset):
+        curve = entry.curve
+        return curve.quality_at(offset) - curve.quality_at(offset + self.horizon)
+
+    def _matches_curve(self, entry):
+        offset = self._offset(entry)
+        curve = entry.curve
+        return (entry.item.quality == curve.quality_at(offset)
+                and entry.item.sell_in == curve.sell_in_at(offset))
+
+    def _rescore(self, entry):
+        """Calcula la pérdida actual, la publica en el heap y agenda el
+        próximo día en que cambie"""
+        self.recomputed += 1
+        # Versión global: un registro viejo nunca coincide con una entrada
+        # nueva del mismo item
+        self._version += 1
+        entry.version = self._version
+        offset = self._offset(entry)
+        if offset >= CURVE_CHUNK:
+            # Las curvas no crecen sin límite en ejecuciones largas
+            entry.curve.drop(offset)
+            entry.start += offset
+            offset = 0
+        entry.loss = self._loss_at(entry, offset)
+        heapq.heappush(self._heap, (-entry.loss, entry.seq, id(entry.item), entry.version))
+
+        next_offset = offset + 1
+        limit = offset + self.lookahead
+        while next_offset < limit and self._loss_at(entry, next_offset) == entry.loss:
+            next_offset += 1
+        # Si la pérdida no cambia en lookahead días se revisa entonces
+        day = entry.start + min(next_offset, limit)
+        self._buckets.setdefault(day, []).append((id(entry.item), entry.version))
+        self._compact_heap()
+
+    def _compact_heap(self):
+        # El borrado perezoso deja registros obsoletos; se reconstruye el
+        # heap cuando superan a los vigentes
+        if len(self._heap) > 2 * len(self._entries) + 64:
+            self._heap = [
+                record for record in self._heap
+                if record[2] in self._entries and self._entries[record[2]].version == record[3]
+            ]
+            heapq.heapify(self._heap)
@@ -0,0 +1,213 @@
+"""
+Perfilador por muestreo para simulaciones del inventario.
+Un hilo en segundo plano toma la pila del hilo perfilado a intervalos fijos
+(sys._current_frames), por lo que el código medido no se instrumenta y el
+sobrecoste es bajo. Las muestras se agrupan por fase (load, update, render)
+y se exportan como pilas colapsadas (flamegraph.pl, speedscope) o como JSON
+de speedscope.
+
+Como todo muestreador basado en el GIL, las muestras tienden a caer en los
+puntos donde el hilo perfilado lo libera (E/S). Con fases muy cortas e
+intercaladas conviene fijarse en el tiempo de pared por fase, que se mide
+exactamente; con entradas grandes el reparto de muestras es fiable.
+"""
+
+import os
+import sys
+import threading
+import time
+
+
+class _Phase:
+    """Context manager que marca la fase activa del perfilador"""
+
+    def __init__(self, profiler, name):
+        self._profiler = profiler
+        self._name = name
+
+    def __enter__(self):
+        self._previous = self._profiler.current_phase
+        self._profiler.current_phase = self._name
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        elapsed = time.perf_counter() - self._start
+        wall = self._profiler.phase_seconds
+        wall[self._name] = wall.get(self._name, 0.0) + elapsed
+        self._profiler.current_phase = self._previous
+        return False
+
+
+class SamplingProfiler:
+    """Muestrea la pila de un hilo cada `interval` segundos"""
+
+    def __init__(self, interval=0.001, thread_id=None):
+        self.interval = interval
+        self.thread_id = thread_id
+        self.current_phase = None
+        self.phase_seconds = {}
+        self.samples = {}
+        self.sample_count = 0
+        self._stop = threading.Event()
+        self._thread = None
+        self._own_files = {os.path.abspath(__file__), threading.__file__}
+
+    def phase(self, name):
+        """Marca una fase de la simulación (load, update, render, ...)"""
+        return _Phase(self, name)
+
+    def start(self):
+        if self.thread_id is None:
+            self.thread_id = threading.get_ident()
+        # Con el intervalo por defecto (5 ms) el hilo perfilado solo cede el
+        # GIL en la E/S y las muestras se concentrarían en los print
+        self._switch_interval = sys.getswitchinterval()
+        sys.setswitchinterval(min(self._switch_interval, self.interval / 10))
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="sampling-profiler", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+            sys.setswitchinterval(self._switch_interval)
+        return self
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+        return False
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            if frame is not None:
+                self._record(frame)
+
+    def _record(self, frame):
+        stack = []
+        while frame is not None:
+            code = frame.f_code
+            if os.path.abspath(code.co_filename) not in self._own_files:
+                stack.append((code.co_name, code.co_filename, code.co_firstlineno))
+            frame = frame.f_back
+        stack.reverse()
+        key = (self.current_phase or "(sin fase)", tuple(stack))
+        self.samples[key] = self.samples.get(key, 0) + 1
+        self.sample_count += 1
+
+    def collapsed(self):
+        """Pilas colapsadas: 'fase;marco;marco N' por línea"""
+        lines = []
+        for (phase, stack), count in sorted(self.samples.items()):
+            frames = [phase] + ["%s (%s:%s)" % (name, os.path.basename(filename), line)
+                                for name, filename, line in stack]
+            lines.append("%s %s" % (";".join(frames), count))
+        return "\n".join(lines) + "\n"
+
+    def speedscope(self):
+        """Perfil en formato de archivo de speedscope (un perfil por fase)"""
+        frames = []
+        frame_index = {}
+        profiles = {}
+        for (phase, stack), count in sorted(self.samples.items()):
+            indexes = []
+            for name, filename, line in stack:
+                key = (name, filename, line)
+                if key not in frame_index:
+                    frame_index[key] = len(frames)
+                    frames.append({"name": name, "file": filename, "line": line})
+                indexes.append(frame_index[key])
+            profile = profiles.setdefault(phase, {
+                "type": "sampled",
+                "name": phase,
+                "unit": "seconds",
+                "startValue": 0,
+                "endValue": 0,
+                "samples": [],
+                "weights": [],
+            })
+            profile["samples"].append(indexes)
+            profile["weights"].append(count * self.interval)
+            profile["endValue"] += count * self.interval
+        return {
+            "$schema": "https://www.speedscope.app/file-format-schema.json",
+            "shared": {"frames": frames},
+            "profiles": list(profiles.values()),
+            "name": "gilded-rose",
+            "exporter": "src.profiling",
+        }
+
+    def phase_summary(self):
+        """Filas (fase, segundos, muestras) en orden de tiempo"""
+        counts = {}
+        for (phase, _), count in self.samples.items():
+            counts[phase] = counts.get(phase, 0) + count
+        phases = set(self.phase_seconds) | set(counts)
+        return sorted(
+            ((phase, self.phase_seconds.get(phase, 0.0), counts.get(phase, 0)) for phase in phases),
+            key=lambda row: -row[1],
+        )
+
+    def top_functions(self, limit=10):
+        """Funciones con más muestras propias (parte superior de la pila)"""
+        self_counts = {}
+        for (_, stack), count in self.samples.items():
+            if stack:
+                self_counts[stack[-1]] = self_counts.get(stack[-1], 0) + count
+        ranked = sorted(self_counts.items(), key=lambda row: -row[1])
+        return ranked[:limit]
+
+    def summary(self):
+        total = self.sample_count or 1
+        lines = [
+            "Perfil: %s muestras cada %.1f ms" % (self.sample_count, self.interval * 1000),
+            "%-12s %12s %10s %8s" % ("Fase", "Tiempo (s)", "Muestras", "%"),
+        ]
+        for phase, seconds, count in self.phase_summary():
+            lines.append("%-12s %12.4f %10d %7.1f%%" % (phase, seconds, count, 100.0 * count / total))
+        lines.append("Funciones con más muestras propias:")
+        for (name, filename, line), count in self.top_functions():
+            lines.append("  %6d  %s (%s:%s)" % (count, name, os.path.basename(filename), line))
+        return "\n".join(lines)
+
+    def write(self, path, fmt=None):
+        """Exporta el perfil en 'collapsed' o 'speedscope'"""
+        if fmt is None:
+            fmt = "speedscope" if path.endswith(".json") else "collapsed"
+        with open(path, "w", encoding="utf-8") as handle:
+            if fmt == "collapsed":
+                handle.write(self.collapsed())
+            elif fmt == "speedscope":
+                import json
+
+                json.dump(self.speedscope(), handle)
+            else:
+                raise ValueError("formato de perfil desconocido: %r" % fmt)
+
+
+class ProfileRecorder:
+    """Recorder de los puntos de entrada: perfila y exporta al terminar"""
+
+    def __init__(self, path, fmt=None, interval=0.001, report=None):
+        if fmt not in (None, "collapsed", "speedscope"):
+            raise SystemExit("--profile-format debe ser 'collapsed' o 'speedscope'")
+        self.path = path
+        self.fmt = fmt
+        self.report = report
+        self.profiler = SamplingProfiler(interval).start()
+
+    def phase(self, name):
+        return self.profiler.phase(name)
+
+    def finish(self):
+        self.profiler.stop()
+        self.profiler.write(self.path, self.fmt)
+        if self.report is not None:
+            self.report.write(self.profiler.summary() + "\n")
@@ -0,0 +1,295 @@
+"""
+Reglas de degradación declarativas cargadas desde un archivo JSON o TOML.
+Cada categoría describe cómo se actualiza un tipo de item y se compila, al
+cargar el archivo, en un ItemUpdater con un `update()` generado a medida
+(sin bucles sobre la configuración ni llamadas a los helpers de clamp), de
+modo que rinde igual o mejor que los updaters escritos a mano.
+
+Formato (JSON; en TOML se usa [[categories]] con los mismos campos):
+
+    {
+      "categories": [
+        {
+          "name": "backstage",
+          "match": {"exact": "Backstage passes to a TAFKAL80ETC concert"},
+          "delta": 1,
+          "bands": [{"sell_in_below": 11, "delta": 1},
+                    {"sell_in_below": 6, "delta": 1}],
+          "expired_quality": 0
+        }
+      ]
+    }
+
+Campos de cada categoría:
+
+- name: identificador único
+- match: {"exact": nombre}, {"prefix": prefijo} o {"default": true}
+- delta: cambio de calidad diario antes de decrementar sell_in (defecto 0)
+- bands: deltas adicionales cuando sell_in < sell_in_below (antes de decrementar)
+- expired_delta: cambio adicional cuando sell_in < 0 tras decrementar
+- expired_quality: calidad fija cuando sell_in < 0 (excluye expired_delta)
+- ages: si es false, sell_in no cambia (defecto true)
+- min_quality / max_quality: límites de los cambios (defecto 0 y 50)
+
+Como en los updaters escritos a mano, cada cambio se limita por separado:
+un delta positivo nunca supera max_quality y uno negativo nunca baja de
+min_quality.
+"""
+
+import os
+
+from src.gilded_rose import ItemUpdater, UpdaterFactory
+
+
+_CATEGORY_FIELDS = {
+    "name", "match", "delta", "bands", "expired_delta", "expired_quality",
+    "ages", "min_quality", "max_quality",
+}
+_MATCH_KINDS = ("exact", "prefix", "default")
+
+
+class RulesError(ValueError):
+    """Archivo de reglas inválido"""
+
+
+class RuleUpdater(ItemUpdater):
+    """Updater compilado a partir de una categoría del archivo de reglas"""
+
+    def __init__(self, category, source, update):
+        self.category = category
+        self.source = source
+        self.update = update
+
+    def __repr__(self):
+        return "RuleUpdater(%r)" % self.category
+
+
+class CompiledRule:
+    """Categoría validada: su criterio de match y su updater compilado"""
+
+    def __init__(self, name, kind, pattern, updater):
+        self.name = name
+        self.kind = kind
+        self.pattern = pattern
+        self.updater = updater
+
+
+def _int_field(category, key, default=None):
+    value = category.get(key, default)
+    if isinstance(value, bool) or not isinstance(value, int):
+        raise RulesError("%s.%s debe ser un entero" % (category.get("name"), key))
+    return value
+
+
+def _quality_change(lines, delta, low, high, indent):
+    """Líneas que aplican un delta con el mismo clamp que ItemUpdater"""
+    if delta > 0:
+        lines.append("%sq = q + %d if q + %d < %d else %d" % (indent, delta, delta, high, high))
+    elif delta < 0:
+        lines.append("%sq = q - %d if q - %d > %d else %d" % (indent, -delta, -delta, low, low))
+
+
+def compile_category(category):
+    """Valida una categoría y genera su updater"""
+    if not isinstance(category, dict):
+        raise RulesError("cada categoría debe ser un objeto")
+    name = category.get("name")
+    if not isinstance(name, str) or not name:
+        raise RulesError("toda categoría necesita un 'name'")
+    unknown = set(category) - _CATEGORY_FIELDS
+    if unknown:
+        raise RulesError("%s: campos desconocidos %s" % (name, sorted(unknown)))
+
+    match = category.get("match")
+    if not isinstance(match, dict) or len(match) != 1 or next(iter(match)) not in _MATCH_KINDS:
+        raise RulesError("%s.match debe tener una de las claves %s" % (name, _MATCH_KINDS))
+    kind, pattern = next(iter(match.items()))
+    if kind == "default":
+        if pattern is not True:
+            raise RulesError("%s.match.default debe ser true" % name)
+        pattern = None
+    elif not isinstance(pattern, str) or not pattern:
+        raise RulesError("%s.match.%s debe ser un texto no vacío" % (name, kind))
+
+    delta = _int_field(category, "delta", 0)
+    low = _int_field(category, "min_quality", 0)
+    high = _int_field(category, "max_quality", 50)
+    if low > high:
+        raise RulesError("%s: min_quality mayor que max_quality" % name)
+    ages = category.get("ages", True)
+    if not isinstance(ages, bool):
+        raise RulesError("%s.ages debe ser booleano" % name)
+    if "expired_delta" in category and "expired_quality" in category:
+        raise RulesError("%s: expired_delta y expired_quality son excluyentes" % name)
+    expired_delta = _int_field(category, "expired_delta", 0)
+    expired_quality = category.get("expired_quality")
+    if expired_quality is not None:
+        expired_quality = _int_field(category, "expired_quality")
+
+    bands = category.get("bands", [])
+    if not isinstance(bands, list):
+        raise RulesError("%s.bands debe ser una lista" % name)
+    compiled_bands = []
+    for band in bands:
+        if not isinstance(band, dict) or set(band) != {"sell_in_below", "delta"}:
+            raise RulesError("%s.bands: cada banda necesita sell_in_below y delta" % name)
+        compiled_bands.append((
+            _int_field(dict(band, name=name), "sell_in_below"),
+            _int_field(dict(band, name=name), "delta"),
+        ))
+
+    # Mismo orden que ItemUpdater.update: calidad, sell_in, calidad tras caducar
+    lines = ["def update(item):", "    q = item.quality", "    s = item.sell_in"]
+    _quality_change(lines, delta, low, high, "    ")
+    for below, band_delta in compiled_bands:
+        if band_delta:
+            lines.append("    if s < %d:" % below)
+            _quality_change(lines, band_delta, low, high, "        ")
+    if ages:
+        lines.append("    s -= 1")
+        lines.append("    item.sell_in = s")
+    if expired_quality is not None:
+        lines.append("    if s < 0:")
+        lines.append("        q = %d" % expired_quality)
+    elif expired_delta:
+        lines.append("    if s < 0:")
+        _quality_change(lines, expired_delta, low, high, "        ")
+    lines.append("    item.quality = q")
+    source = "\n".join(lines) + "\n"
+
+    namespace = {}
+    exec(compile(source, "<rules:%s>" % name, "exec"), namespace)
+    return CompiledRule(name, kind, pattern, RuleUpdater(name, source, namespace["update"]))
+
+
+class RuleSet:
+    """Conjunto de reglas compiladas combinado con los updaters de
+    UpdaterFactory. La búsqueda sigue la misma precedencia que la factory:
+    prefijos (del más largo al más corto), nombres exactos y por defecto;
+    las reglas del archivo sustituyen a los updaters con el mismo criterio."""
+
+    def __init__(self, rules):
+        self.rules = list(rules)
+        self.updaters = dict(UpdaterFactory._updaters)
+        prefix_updaters = dict(UpdaterFactory._prefix_updaters)
+        self.default_updater = UpdaterFactory._default_updater
+        names = set()
+        patterns = set()
+        for rule in self.rules:
+            if rule.name in names:
+                raise RulesError("categoría duplicada: %r" % rule.name)
+            if (rule.kind, rule.pattern) in patterns:
+                raise RulesError("criterio de match duplicado en %r" % rule.name)
+            names.add(rule.name)
+            patterns.add((rule.kind, rule.pattern))
+            if rule.kind == "exact":
+                self.updaters[rule.pattern] = rule.updater
+            elif rule.kind == "prefix":
+                prefix_updaters[rule.pattern] = rule.updater
+            else:
+                self.default_updater = rule.updater
+        self.prefix_updaters = sorted(prefix_updaters.items(), key=lambda entry: -len(entry[0]))
+
+    def get_updater(self, item):
+        """Retorna el updater apropiado para el item"""
+        name = item.name
+        for prefix, updater in self.prefix_updaters:
+            if name.startswith(prefix):
+                return updater
+        return self.updaters.get(name, self.default_updater)
+
+
+def parse_rules(data):
+    """Valida y compila el contenido ya decodificado de un archivo de reglas"""
+    if not isinstance(data, dict) or not isinstance(data.get("categories"), list):
+        raise RulesError("el archivo de reglas necesita una lista 'categories'")
+    return RuleSet(compile_category(category) for category in data["categories"])
+
+
+def load_rules(path):
+    """Carga, valida y compila un archivo de reglas .json o .toml"""
+    with open(path, "rb") as handle:
+        raw = handle.read()
+    if path.endswith(".toml"):
+        try:
+            import tomllib
+        except ImportError:
+            raise RulesError("leer TOML requiere Python 3.11 o superior")
+        try:
+            data = tomllib.loads(raw.decode("utf-8"))
+        except tomllib.TOMLDecodeError as error:
+            raise RulesError("%s: %s" % (path, error))
+    else:
+        import json
+
+        try:
+            data = json.loads(raw)
+        except ValueError as error:
+            raise RulesError("%s: %s" % (path, error))
+    return parse_rules(data)
+
+
+class RulesFile:
+    """Archivo de reglas instalado en UpdaterFactory, con recarga en caliente.
+
+    Llamar a reload_if_changed() entre ticks: si el archivo cambió, se
+    compila de nuevo y se sustituyen las reglas instaladas. Si el archivo
+    nuevo es inválido se mantienen las reglas anteriores y se lanza
+    RulesError. Los motores que cachean updaters (MultiStore) deben llamar
+    a reclassify() tras una recarga."""
+
+    def __init__(self, path):
+        self.path = path
+        self.rule_set = None
+        self._stamp = None
+        self._saved = None
+
+    def _current_stamp(self):
+        stat = os.stat(self.path)
+        return (stat.st_mtime_ns, stat.st_size)
+
+    def install(self):
+        """Carga el archivo y sustituye las tablas de UpdaterFactory"""
+        # El sello se guarda antes de compilar: un archivo inválido se
+        # reporta una sola vez y no en cada tick
+        self._stamp = self._current_stamp()
+        previous = self.rule_set
+        # Las reglas se combinan con los updaters originales, no con las
+        # de la carga anterior
+        self.uninstall()
+        try:
+            rule_set = load_rules(self.path)
+        except RulesError:
+            if previous is not None:
+                self._apply(previous)
+            raise
+        self._apply(rule_set)
+        return rule_set
+
+    def _apply(self, rule_set):
+        self._saved = (
+            UpdaterFactory._updaters,
+            UpdaterFactory._prefix_updaters,
+            UpdaterFactory._default_updater,
+        )
+        UpdaterFactory._updaters = rule_set.updaters
+        UpdaterFactory._prefix_updaters = rule_set.prefix_updaters
+        UpdaterFactory._default_updater = rule_set.default_updater
+        self.rule_set = rule_set
+
+    def uninstall(self):
+        """Restaura los updaters que había antes de install()"""
+        if self._saved is None:
+            return
+        (UpdaterFactory._updaters,
+         UpdaterFactory._prefix_updaters,
+         UpdaterFactory._default_updater) = self._saved
+        self._saved = None
+        self.rule_set = None
+
+    def reload_if_changed(self):
+        """Recarga las reglas si el archivo cambió; retorna True si recargó"""
+        if self._current_stamp() == self._stamp:
+            return False
+        self.install()
+        return True
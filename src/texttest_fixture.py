@@ -1,9 +1,47 @@
-from __future__ import print_function
-from src.gilded_rose import *
+import sys
+
+from src.cli import pop_option, recorder_from_argv
+from src.gilded_rose import GildedRose, Item
+
+
+def main(argv=None):
+    # --profile RUTA activa el perfil por muestreo de la simulación
+    # --memory / --memory-budget TAMAÑO miden la memoria por fase
+    # --golden-master DIR [--jobs N] guarda la salida comprimida por bloques
+    argv = list(sys.argv[1:] if argv is None else argv)
+    recorder = recorder_from_argv(argv)
+    golden_master = pop_option(argv, "--golden-master")
+    jobs = int(pop_option(argv, "--jobs") or 1)
+
+    with recorder.phase("load"):
+        items = load_items()
+    days = 2
+    if len(argv) > 0:
+        days = int(argv[0]) + 1
+    if golden_master is not None:
+        from src.golden_master import record
+
+        with recorder.phase("golden-master"):
+            record(golden_master, items, days, jobs=jobs)
+        recorder.finish()
+        return
 
-def main():
     print("OMGHAI!")
-    items = [
+    for day in range(days):
+        with recorder.phase("render"):
+            print("-------- day %s --------" % day)
+            print("name, sellIn, quality")
+            for item in items:
+                print(item)
+            print("")
+        with recorder.phase("update"):
+            GildedRose(items).update_quality()
+
+    recorder.finish()
+
+
+def load_items():
+    return [
         Item(name="+5 Dexterity Vest", sell_in=10, quality=20),
         Item(name="Aged Brie", sell_in=2, quality=0),
         Item(name="Elixir of the Mongoose", sell_in=5, quality=7),
@@ -14,17 +52,6 @@ def main():
         Item(name="Backstage passes to a TAFKAL80ETC concert", sell_in=5, quality=49),
         Item(name="Conjured Mana Cake", sell_in=3, quality=6),
     ]
-    days = 2
-    import sys
-    if len(sys.argv) > 1:
-        days = int(sys.argv[1]) + 1
-    for day in range(days):
-        print("-------- day %s --------" % day)
-        print("name, sellIn, quality")
-        for item in items:
-            print(item)
-        print("")
-        GildedRose(items).update_quality()
 
 
 if __name__ == "__main__":
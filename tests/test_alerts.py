@@ -0,0 +1,151 @@
+# -*- coding: utf-8 -*-
+"""
+Tests para las alertas por umbral con cubos de días de cruce
+"""
+import random
+
+import pytest
+from src.alerts import AlertMonitor, Threshold
+from src.fuzz import generate_inventory
+from src.gilded_rose import GildedRose, Item, UpdaterFactory
+
+
+BACKSTAGE = "Backstage passes to a TAFKAL80ETC concert"
+
+ALERTS = [
+    Threshold("backstage_5_dias", "sell_in", at_most=5, prefix="Backstage passes"),
+    Threshold("calidad_0_en_3_dias", "quality", at_most=0, within=3),
+    Threshold("calidad_maxima", "quality", at_least=50),
+    Threshold("caducado", "sell_in", at_most=-1),
+]
+
+
+def future_state(item, days):
+    """Estado del item dentro de `days` días, simulado sobre una copia"""
+    copy = Item(item.name, item.sell_in, item.quality)
+    updater = UpdaterFactory.get_updater(copy)
+    for _ in range(days):
+        updater.update(copy)
+    return copy
+
+
+def holding(items, alerts):
+    """Pares (alerta, item) que se cumplen hoy, revisando todos los items"""
+    result = set()
+    for alert in alerts:
+        for item in items:
+            if not alert.applies_to(item):
+                continue
+            value = getattr(future_state(item, alert.within), alert.field)
+            if ((alert.at_most is None or value <= alert.at_most)
+                    and (alert.at_least is None or value >= alert.at_least)):
+                result.add((alert.name, id(item)))
+    return result
+
+
+def pairs(triggered):
+    return {(alert.name, id(item)) for alert, item in triggered}
+
+
+@pytest.mark.alerts
+class TestAlertMonitor:
+    """Tests del monitor de alertas"""
+
+    def test_matches_full_scan(self):
+        """Cada tick dispara exactamente los cruces que detecta un escaneo completo"""
+        items = [Item(*row) for row in generate_inventory(random.Random(5), 150)]
+        monitor = AlertMonitor(items, ALERTS, lookahead=8)
+        gilded_rose = GildedRose(items)
+        previous = holding(items, ALERTS)
+
+        for _ in range(40):
+            gilded_rose.update_quality()
+            current = holding(items, ALERTS)
+            assert pairs(monitor.tick()) == current - previous
+            previous = current
+
+    def test_backstage_within_five_days(self):
+        """Un pase a 8 días del concierto alerta al quedar a 5"""
+        item = Item(BACKSTAGE, 8, 20)
+        monitor = AlertMonitor([item], ALERTS[:1])
+        gilded_rose = GildedRose([item])
+
+        days = []
+        for day in range(1, 10):
+            gilded_rose.update_quality()
+            if monitor.tick():
+                days.append(day)
+
+        assert days == [3]
+        assert item.sell_in == -1
+
+    def test_quality_zero_within_three_days(self):
+        """La alerta a futuro se dispara 3 días antes de llegar a 0"""
+        item = Item("+5 Dexterity Vest", 10, 4)
+        monitor = AlertMonitor([item], ALERTS[1:2])
+
+        GildedRose([item]).update_quality()
+
+        assert [(alert.name, found) for alert, found in monitor.tick()] == [
+            ("calidad_0_en_3_dias", item)
+        ]
+        assert item.quality == 3
+
+    def test_add_reports_alerts_already_holding(self):
+        """add() y add_alert() retornan lo que ya se cumple hoy"""
+        monitor = AlertMonitor([], ALERTS[2:3])
+        brie = Item("Aged Brie", 5, 50)
+        vest = Item("+5 Dexterity Vest", -2, 10)
+
+        assert monitor.add(brie) == [ALERTS[2]]
+        assert monitor.add(vest) == []
+        assert monitor.add_alert(ALERTS[3]) == [vest]
+
+    def test_tick_only_visits_todays_bucket(self):
+        """Items estables no se revisan en cada tick"""
+        items = [Item("Sulfuras, Hand of Ragnaros", 0, 80) for _ in range(500)]
+        items.append(Item("+5 Dexterity Vest", 1, 10))
+        monitor = AlertMonitor(items, ALERTS[3:], lookahead=64)
+        gilded_rose = GildedRose(items)
+
+        gilded_rose.update_quality()
+        monitor.tick()
+        gilded_rose.update_quality()
+        triggered = monitor.tick()
+
+        assert [item.name for _, item in triggered] == ["+5 Dexterity Vest"]
+        assert monitor.processed == 1
+
+    def test_refresh_after_external_change(self):
+        """refresh() reagenda un item modificado fuera de update_quality"""
+        item = Item("+5 Dexterity Vest", 10, 40)
+        monitor = AlertMonitor([item], ALERTS[1:2])
+        item.quality = 4
+
+        assert monitor.refresh(item) == []
+        GildedRose([item]).update_quality()
+        assert pairs(monitor.tick()) == {("calidad_0_en_3_dias", id(item))}
+
+    def test_unrefreshed_change_is_detected_at_next_visit(self):
+        """Sin refresh(), el cambio se detecta en la próxima visita agendada
+        del item y las alertas que ya se cumplen se disparan entonces"""
+        item = Item("+5 Dexterity Vest", 20, 10)
+        monitor = AlertMonitor([item], ALERTS[3:], lookahead=4)
+        gilded_rose = GildedRose([item])
+        item.sell_in = 1
+
+        fired = []
+        for day in range(1, 6):
+            gilded_rose.update_quality()
+            fired += [day for _ in monitor.tick()]
+
+        assert fired == [4]
+
+    def test_invalid_thresholds(self):
+        """Campos desconocidos, límites ausentes o duplicados se rechazan"""
+        with pytest.raises(ValueError):
+            Threshold("x", "price", at_most=1)
+        with pytest.raises(ValueError):
+            Threshold("x", "quality")
+        with pytest.raises(ValueError):
+            AlertMonitor(alerts=[ALERTS[0], ALERTS[0]])
@@ -0,0 +1,125 @@
+# -*- coding: utf-8 -*-
+"""
+Tests para el inventario con mutaciones concurrentes
+"""
+import random
+import threading
+
+import pytest
+from src.concurrent_inventory import ConcurrentInventory
+from src.fuzz import run_differential
+from src.gilded_rose import Item
+
+
+# Ticks del test de estrés
+TICKS = 50
+
+@pytest.mark.concurrency
+class TestConcurrentInventory:
+    """Tests del modelo de cola de mutaciones"""
+
+    def test_mutations_apply_before_next_tick(self):
+        """Las mutaciones encoladas se aplican al inicio del siguiente tick"""
+        vest = Item("+5 Dexterity Vest", 10, 20)
+        brie = Item("Aged Brie", 2, 0)
+        inventory = ConcurrentInventory([vest])
+
+        inventory.add(brie)
+        inventory.set(vest, quality=30)
+        assert inventory.pending == 2
+        assert len(inventory) == 1
+
+        inventory.update_quality()
+
+        assert inventory.pending == 0
+        assert vest.quality == 29
+        assert brie.quality == 1
+        assert inventory.epoch == 1
+
+    def test_operations_keep_arrival_order(self):
+        """Alta y baja en el mismo lote se aplican en orden"""
+        item = Item("Normal", 5, 10)
+        inventory = ConcurrentInventory()
+
+        inventory.add(item)
+        inventory.remove(item)
+        inventory.remove(item)
+        inventory.update_quality()
+
+        assert inventory.items == []
+        assert inventory.ignored == 1
+        assert item.quality == 10
+
+    def test_snapshot_is_cached_per_epoch(self):
+        """snapshot() es consistente y solo se reconstruye tras cambios"""
+        inventory = ConcurrentInventory([Item("Normal", 5, 10)])
+        first = inventory.snapshot()
+
+        assert inventory.snapshot() is first
+        inventory.update_quality()
+        assert inventory.snapshot() == (1, [("Normal", 4, 9)])
+
+    @pytest.mark.edge_case
+    def test_pending_queue_is_bounded(self):
+        """Sin ticks, la cola no supera max_pending"""
+        inventory = ConcurrentInventory(max_pending=10)
+        for index in range(100):
+            inventory.add(Item("Normal %s" % index, 5, 10))
+
+        assert inventory.pending < 10
+        assert len(inventory) + inventory.pending == 100
+
+    def test_set_rejects_unknown_fields(self):
+        """Solo sell_in y quality son modificables"""
+        with pytest.raises(ValueError):
+            ConcurrentInventory().set(Item("Normal", 5, 10), name="Otro")
+
+    @pytest.mark.fuzz
+    def test_matches_reference_under_fuzzing(self):
+        """Sin concurrencia se comporta como GildedRose"""
+        result = run_differential(ConcurrentInventory, runs=100, time_budget=2.0)
+
+        assert result.ok, result.divergence
+
+    @pytest.mark.parametrize("writers", [1, 4, 8])
+    def test_stress_no_skipped_or_double_updates(self, writers):
+        """Con escritores concurrentes cada item se actualiza una vez por tick"""
+        inventory = ConcurrentInventory(max_pending=1000)
+        stop = threading.Event()
+        errors = []
+
+        def writer(seed):
+            rng = random.Random(seed)
+            mine = []
+            while not stop.is_set():
+                if mine and (len(mine) > 200 or rng.random() < 0.4):
+                    inventory.remove(mine.pop(rng.randrange(len(mine))))
+                else:
+                    item = Item("Stress %s" % seed, 10 ** 6, 50)
+                    mine.append(item)
+                    inventory.add(item)
+
+        def ticker():
+            previous = {}
+            for _ in range(TICKS):
+                inventory.update_quality()
+                epoch, _ = inventory.snapshot()
+                # Se guardan las referencias para que ningún id se reutilice
+                current = {id(item): (item, item.sell_in) for item in inventory.items}
+                for key, (item, sell_in) in current.items():
+                    # Los items del tick anterior avanzan exactamente un día
+                    if key in previous and sell_in != previous[key][1] - 1:
+                        errors.append((epoch, item.name, previous[key][1], sell_in))
+                previous = current
+            stop.set()
+
+        threads = [threading.Thread(target=writer, args=(seed,)) for seed in range(writers)]
+        for thread in threads:
+            thread.start()
+        ticker()
+        for thread in threads:
+            thread.join()
+
+        assert errors == []
+        assert inventory.epoch == TICKS
+        assert inventory.applied > 0
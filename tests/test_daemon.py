@@ -0,0 +1,173 @@
+# -*- coding: utf-8 -*-
+"""
+Tests para el modo daemon del inventario
+"""
+import io
+import json
+import os
+import socket
+import tempfile
+import threading
+import time
+
+import pytest
+from src.daemon import InventoryDaemon, serve_pipe, serve_socket
+from src.gilded_rose import Item, GildedRose
+
+
+@pytest.fixture
+def socket_path():
+    # Ruta corta: los sockets Unix limitan la longitud de la ruta
+    directory = tempfile.mkdtemp(prefix="gr-")
+    yield os.path.join(directory, "d.sock")
+    if os.path.exists(os.path.join(directory, "d.sock")):
+        os.unlink(os.path.join(directory, "d.sock"))
+    os.rmdir(directory)
+
+
+def send(path, request):
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+        client.connect(path)
+        client.sendall((json.dumps(request) + "\n").encode("utf-8"))
+        client.shutdown(socket.SHUT_WR)
+        return json.loads(client.makefile().readline())
+
+
+def start_daemon(path):
+    thread = threading.Thread(target=serve_socket, args=(InventoryDaemon(), path), daemon=True)
+    thread.start()
+    # Espera a que el socket acepte conexiones (puede existir uno abandonado)
+    deadline = time.monotonic() + 5
+    while time.monotonic() < deadline:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as probe:
+            if probe.connect_ex(path) == 0:
+                break
+        time.sleep(0.01)
+    return thread
+
+
+@pytest.mark.daemon
+class TestInventoryDaemon:
+    """Tests del daemon que mantiene el inventario en memoria"""
+
+    def test_tick_matches_gilded_rose(self):
+        """Los ticks del daemon producen el mismo estado que GildedRose"""
+        rows = [
+            ("+5 Dexterity Vest", 10, 20),
+            ("Aged Brie", 2, 0),
+            ("Sulfuras, Hand of Ragnaros", 0, 80),
+            ("Backstage passes to a TAFKAL80ETC concert", 11, 40),
+            ("Conjured Mana Cake", 3, 6),
+        ]
+        daemon = InventoryDaemon([Item(*row) for row in rows])
+        expected = [Item(*row) for row in rows]
+        gr = GildedRose(expected)
+
+        response = daemon.handle({"op": "tick", "days": 15})
+        for _ in range(15):
+            gr.update_quality()
+
+        assert response == {"ok": True, "day": 15}
+        assert [repr(item) for item in daemon.items] == [repr(item) for item in expected]
+
+    def test_add_query_set_remove(self):
+        """Las mutaciones se reflejan en las consultas"""
+        daemon = InventoryDaemon()
+        daemon.handle({"op": "add", "items": [["Aged Brie", 2, 0], ["Elixir", 5, 7]]})
+        daemon.handle({"op": "set", "index": 1, "quality": 9})
+
+        assert daemon.handle({"op": "query", "name": "Elixir"})["items"] == [
+            [1, "Elixir", 5, 9]
+        ]
+
+        removed = daemon.handle({"op": "remove", "index": 0})
+        assert removed["removed"] == ["Aged Brie", 2, 0]
+        assert daemon.handle({"op": "stats"}) == {
+            "ok": True, "day": 0, "count": 1, "categories": {"NormalItemUpdater": [1, 9]},
+        }
+
+    def test_query_and_stats_by_category_code(self):
+        """Las consultas por categoría y stats usan los códigos de la ingesta"""
+        daemon = InventoryDaemon([Item("Aged Brie", 2, 0), Item("Elixir", 5, 7)])
+        daemon.handle({"op": "add", "items": [["Aged Brie", 4, 10]]})
+        daemon.handle({"op": "tick"})
+
+        assert daemon.inventory.codes == [0, 1, 0]
+        assert daemon.handle({"op": "query", "category": "AgedBrieUpdater"})["items"] == [
+            [0, "Aged Brie", 1, 1], [2, "Aged Brie", 3, 11],
+        ]
+        assert daemon.handle({"op": "query", "category": "Desconocida"})["items"] == []
+        assert daemon.handle({"op": "stats"})["categories"] == {
+            "AgedBrieUpdater": [2, 12], "NormalItemUpdater": [1, 6],
+        }
+
+    def test_batch_returns_one_response_per_command(self):
+        """Un lote se aplica en orden y retorna una respuesta por comando"""
+        daemon = InventoryDaemon([Item("Normal", 5, 10)])
+        responses = daemon.handle([
+            {"op": "tick"},
+            {"op": "tick", "days": 2},
+            {"op": "query"},
+        ])
+
+        assert [r["ok"] for r in responses] == [True, True, True]
+        assert responses[2]["items"] == [[0, "Normal", 2, 7]]
+
+    @pytest.mark.parametrize("request_", [
+        {"op": "explode"},
+        {"op": "remove", "index": 3},
+        {"op": "tick", "days": -1},
+        ["not a command"],
+    ])
+    def test_errors_do_not_stop_the_daemon(self, request_):
+        """Los comandos inválidos retornan un error sin tumbar el daemon"""
+        daemon = InventoryDaemon()
+        response = daemon.handle(request_)
+        if isinstance(response, list):
+            response = response[0]
+
+        assert response["ok"] is False
+        assert daemon.running
+
+    def test_serve_pipe_until_shutdown(self):
+        """El modo tubería responde línea a línea y se detiene con shutdown"""
+        requests = "\n".join([
+            json.dumps({"op": "add", "items": [["Aged Brie", 1, 0]]}),
+            "{not json",
+            json.dumps({"op": "tick", "days": 3}),
+            json.dumps({"op": "shutdown"}),
+            json.dumps({"op": "stats"}),
+        ])
+        stdout = io.StringIO()
+        serve_pipe(InventoryDaemon(), io.StringIO(requests), stdout)
+
+        responses = [json.loads(line) for line in stdout.getvalue().splitlines()]
+        assert len(responses) == 4
+        assert responses[1]["ok"] is False
+        assert responses[2] == {"ok": True, "day": 3}
+
+    def test_second_daemon_keeps_the_running_socket(self, socket_path):
+        """Un segundo daemon en el mismo socket falla sin borrar el del primero"""
+        thread = start_daemon(socket_path)
+
+        with pytest.raises(OSError):
+            serve_socket(InventoryDaemon(), socket_path)
+
+        assert os.path.exists(socket_path)
+        assert send(socket_path, {"op": "stats"})["ok"] is True
+        assert send(socket_path, {"op": "shutdown"}) == {"ok": True, "day": 0}
+        thread.join(5)
+        assert not thread.is_alive()
+        assert not os.path.exists(socket_path)
+
+    def test_stale_socket_is_replaced(self, socket_path):
+        """Un socket que nadie atiende se borra y se vuelve a crear"""
+        stale = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        stale.bind(socket_path)
+        stale.close()
+
+        thread = start_daemon(socket_path)
+
+        assert send(socket_path, {"op": "shutdown"}) == {"ok": True, "day": 0}
+        thread.join(5)
+        assert not thread.is_alive()
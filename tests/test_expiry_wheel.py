@@ -0,0 +1,130 @@
+# -*- coding: utf-8 -*-
+"""
+Tests para el motor con caducidades absolutas y cubos por día
+"""
+import random
+
+import pytest
+from src.expiry_wheel import ExpiryWheel
+from src.fuzz import generate_inventory, run_differential
+from src.gilded_rose import GildedRose, Item, ItemUpdater, UpdaterFactory
+
+
+BACKSTAGE = "Backstage passes to a TAFKAL80ETC concert"
+
+
+def state(items):
+    return [(item.name, item.sell_in, item.quality) for item in items]
+
+
+@pytest.mark.expiry_wheel
+class TestExpiryWheel:
+    """Tests del ExpiryWheel"""
+
+    def test_fuzz_equivalence(self):
+        """Sigue al motor de referencia en inventarios aleatorios"""
+        result = run_differential(ExpiryWheel, runs=300, size=40, max_days=80)
+        assert result.ok, result.divergence
+
+    def test_reads_match_every_day(self):
+        """sell_in y quality coinciden con GildedRose día a día"""
+        rows = generate_inventory(random.Random(3), 200)
+        reference = [Item(*row) for row in rows]
+        gilded_rose = GildedRose(reference)
+        wheel = ExpiryWheel(Item(*row) for row in rows)
+
+        for _ in range(30):
+            gilded_rose.update_quality()
+            wheel.update_quality()
+            assert state(wheel.items) == state(reference)
+
+    def test_newly_expired(self):
+        """newly_expired() retorna los items que acaban de pasar a sell_in -1"""
+        wheel = ExpiryWheel([
+            Item("+5 Dexterity Vest", 2, 20),
+            Item("Aged Brie", 1, 0),
+            Item("Sulfuras, Hand of Ragnaros", -1, 80),
+        ])
+        vest, brie, _ = wheel.items
+
+        wheel.update_quality()
+        assert wheel.newly_expired() == []
+        wheel.update_quality()
+        assert wheel.newly_expired() == [brie]
+        wheel.update_quality()
+        assert wheel.newly_expired() == [vest]
+        assert (vest.sell_in, vest.quality) == (-1, 16)
+        wheel.update_quality()
+        assert wheel.newly_expired() == []
+
+    def test_saturated_items_are_not_visited(self):
+        """Los items sin cambios de ritmo no se visitan al avanzar los días"""
+        wheel = ExpiryWheel(
+            [Item("+5 Dexterity Vest", 5, 0) for _ in range(100)]
+            + [Item("Aged Brie", 3, 50) for _ in range(100)]
+            + [Item("Sulfuras, Hand of Ragnaros", 0, 80) for _ in range(100)]
+        )
+        rebased = wheel.rebased
+
+        for _ in range(20):
+            wheel.update_quality()
+
+        assert wheel.rebased == rebased
+        assert wheel.scanned == 0
+        assert {item.quality for item in wheel.items} == {0, 50, 80}
+
+    def test_visits_only_rate_changes(self):
+        """Un backstage se visita en las bandas de 10 y 5 días y en el concierto"""
+        wheel = ExpiryWheel([Item(BACKSTAGE, 15, 1)])
+        rebased = wheel.rebased
+
+        for _ in range(20):
+            wheel.update_quality()
+
+        assert wheel.rebased - rebased == 3
+        assert state(wheel.items) == [(BACKSTAGE, -5, 0)]
+
+    def test_assignment_reschedules(self):
+        """Asignar sell_in o quality reprograma el item"""
+        items = [Item("+5 Dexterity Vest", 10, 20), Item(BACKSTAGE, 20, 10)]
+        reference = [Item(*row) for row in state(items)]
+        wheel = ExpiryWheel(items)
+
+        for day in range(25):
+            if day == 3:
+                for engine_items in (wheel.items, reference):
+                    engine_items[0].sell_in = 1
+                    engine_items[1].quality = 45
+            wheel.update_quality()
+            GildedRose(reference).update_quality()
+            assert state(wheel.items) == state(reference)
+
+    def test_custom_updaters_are_scanned(self):
+        """Los items con updaters no integrados se actualizan cada día"""
+        class DoubleUpdater(ItemUpdater):
+            def _update_quality_before_sell_in(self, item):
+                self._decrease_quality(item, 2)
+
+        UpdaterFactory.register("Mystical Staff", DoubleUpdater())
+        try:
+            wheel = ExpiryWheel([Item("Mystical Staff", 3, 10), Item("Aged Brie", 3, 10)])
+            for _ in range(4):
+                wheel.update_quality()
+        finally:
+            del UpdaterFactory._updaters["Mystical Staff"]
+
+        assert state(wheel.items) == [("Mystical Staff", -1, 2), ("Aged Brie", -1, 15)]
+        assert wheel.scanned == 4
+
+    def test_reclassify_picks_up_new_updaters(self):
+        """reclassify() vuelve a resolver los updaters conservando el estado"""
+        wheel = ExpiryWheel([Item("Mystical Staff", 5, 10)])
+        wheel.update_quality()
+        UpdaterFactory.register("Mystical Staff", UpdaterFactory.get_updater_for_name("Aged Brie"))
+        try:
+            wheel.reclassify()
+            wheel.update_quality()
+        finally:
+            del UpdaterFactory._updaters["Mystical Staff"]
+
+        assert state(wheel.items) == [("Mystical Staff", 3, 10)]
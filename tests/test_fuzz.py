@@ -0,0 +1,77 @@
+# -*- coding: utf-8 -*-
+"""
+Tests para el fuzzer diferencial de motores
+"""
+import random
+
+import pytest
+from src.fuzz import (
+    EDGE_QUALITY,
+    EDGE_SELL_IN,
+    generate_inventory,
+    run_differential,
+)
+from src.gilded_rose import GildedRose
+
+
+# Presupuesto de tiempo (segundos) de cada sesión de fuzzing en la suite
+FUZZ_TIME_BUDGET = 2.0
+
+
+class BrokenBackstageEngine(GildedRose):
+    """Motor con un error deliberado en la banda de 11 días de backstage"""
+
+    def update_quality(self):
+        early = [
+            item for item in self.items
+            if item.name.startswith("Backstage passes to a TAFKAL80ETC")
+            and item.sell_in == 11 and item.quality < 50
+        ]
+        super().update_quality()
+        for item in early:
+            item.quality = min(50, item.quality + 1)
+
+
+@pytest.mark.fuzz
+class TestFuzzer:
+    """Tests del harness diferencial"""
+
+    def test_reference_agrees_with_itself(self):
+        """La referencia contra sí misma no produce divergencias"""
+        result = run_differential(GildedRose, runs=30, time_budget=FUZZ_TIME_BUDGET)
+
+        assert result.ok
+        assert result.runs > 0
+        assert result.item_days > 0
+        assert result.reference_seconds > 0
+        assert result.candidate_seconds > 0
+
+    def test_reports_first_divergence(self):
+        """Un motor defectuoso se detecta con el día y el item de la divergencia"""
+        result = run_differential(BrokenBackstageEngine, runs=200, seed=1)
+
+        assert not result.ok
+        divergence = result.divergence
+        assert divergence.initial[0] == "Backstage passes to a TAFKAL80ETC concert"
+        assert divergence.expected[0] == divergence.actual[0]
+        assert divergence.expected[2] != divergence.actual[2]
+
+    def test_generated_inventories_cover_edge_values(self):
+        """Los inventarios generados incluyen los valores límite"""
+        rows = generate_inventory(random.Random(0), 2000)
+        sell_ins = {row[1] for row in rows}
+        qualities = {row[2] for row in rows}
+
+        assert set(EDGE_SELL_IN) <= sell_ins
+        assert set(EDGE_QUALITY) <= qualities
+
+    def test_generation_is_deterministic_per_seed(self):
+        """La misma semilla genera el mismo inventario"""
+        assert generate_inventory(random.Random(7), 50) == generate_inventory(random.Random(7), 50)
+
+    def test_time_budget_bounds_the_session(self):
+        """La sesión respeta el presupuesto de tiempo"""
+        result = run_differential(GildedRose, runs=10 ** 6, size=200, time_budget=0.2)
+
+        assert result.ok
+        assert result.runs < 10 ** 6
@@ -0,0 +1,135 @@
+# -*- coding: utf-8 -*-
+"""
+Tests para el golden master comprimido con índice de hashes por día
+"""
+import io
+import multiprocessing
+import random
+from contextlib import redirect_stdout
+
+import pytest
+from src import golden_master
+from src.fuzz import generate_inventory
+from src.gilded_rose import AgedBrieUpdater, GildedRose, Item, UpdaterFactory
+from src.golden_master import GoldenMasterError, read_day, record, render, verify
+from src.texttest_fixture import load_items, main as texttest_main
+
+
+class LateBrokenEngine(GildedRose):
+    """Motor que se equivoca a partir del día 40"""
+
+    def __init__(self, items):
+        super().__init__(items)
+        self.day = 0
+
+    def update_quality(self):
+        super().update_quality()
+        self.day += 1
+        if self.day == 40:
+            self.items[-1].quality += 1
+
+
+def texttest_output(days):
+    out = io.StringIO()
+    with redirect_stdout(out):
+        texttest_main([str(days)])
+    return out.getvalue()
+
+
+@pytest.mark.golden_master
+class TestGoldenMaster:
+    """Tests de generación, lectura y comparación del golden master"""
+
+    def test_render_matches_texttest_output(self, tmp_path):
+        """La salida reconstruida es idéntica a la del fixture"""
+        record(str(tmp_path), load_items(), 31, chunk_days=8)
+        out = io.StringIO()
+        render(str(tmp_path), out)
+
+        assert out.getvalue() == texttest_output(30)
+
+    def test_fixture_option_records_golden_master(self, tmp_path):
+        """texttest_fixture --golden-master escribe el directorio sin imprimir"""
+        out = io.StringIO()
+        with redirect_stdout(out):
+            texttest_main(["20", "--golden-master", str(tmp_path)])
+        rendered = io.StringIO()
+        render(str(tmp_path), rendered)
+
+        assert out.getvalue() == ""
+        assert rendered.getvalue() == texttest_output(20)
+
+    def test_read_day_returns_item_repr_format(self, tmp_path):
+        """Un día se lee en el formato de Item.__repr__"""
+        items = [Item("Aged Brie", 2, 0), Item("Sulfuras, Hand of Ragnaros", 0, 80)]
+        record(str(tmp_path), items, 10, chunk_days=4)
+
+        assert read_day(str(tmp_path), 5) == (
+            "-------- day 5 --------\n"
+            "name, sellIn, quality\n"
+            "Aged Brie, -3, 8\n"
+            "Sulfuras, Hand of Ragnaros, 0, 80\n"
+            "\n"
+        )
+        with pytest.raises(GoldenMasterError):
+            read_day(str(tmp_path), 10)
+
+    def test_verify_passes_for_reference(self, tmp_path):
+        """La simulación actual coincide con el golden master recién generado"""
+        items = [Item(*row) for row in generate_inventory(random.Random(1), 50)]
+        record(str(tmp_path), items, 60, chunk_days=16)
+
+        assert verify(str(tmp_path)) is None
+
+    def test_verify_stops_at_first_mismatch(self, tmp_path, monkeypatch):
+        """La comparación se detiene en el primer día distinto"""
+        record(str(tmp_path), load_items(), 100, chunk_days=16)
+        reads = []
+        original = golden_master.read_day
+        monkeypatch.setattr(golden_master, "read_day",
+                            lambda *args: reads.append(args[1]) or original(*args))
+
+        mismatch = verify(str(tmp_path), LateBrokenEngine)
+
+        assert mismatch.day == 40
+        assert reads == [40]
+        assert mismatch.diff() == [("Conjured Mana Cake, -37, 0", "Conjured Mana Cake, -37, 1")]
+
+    def test_parallel_record_is_identical(self, tmp_path):
+        """Generar los bloques en paralelo produce el mismo índice"""
+        items = [Item(*row) for row in generate_inventory(random.Random(2), 40)]
+        sequential = record(str(tmp_path / "seq"), items, 50, chunk_days=10)
+        parallel = record(str(tmp_path / "par"), items, 50, chunk_days=10, jobs=2)
+
+        assert parallel == sequential
+        assert read_day(str(tmp_path / "par"), 33) == read_day(str(tmp_path / "seq"), 33)
+
+    def test_parallel_record_keeps_registered_updaters(self, tmp_path):
+        """Con fork los procesos del pool usan los updaters registrados"""
+        items = [Item("Mystical Staff", 5, 10), Item("Elixir of the Mongoose", 5, 7)]
+        UpdaterFactory.register("Mystical Staff", AgedBrieUpdater())
+        try:
+            sequential = record(str(tmp_path / "seq"), items, 30, chunk_days=10)
+            parallel = record(str(tmp_path / "par"), items, 30, chunk_days=10, jobs=2)
+        finally:
+            del UpdaterFactory._updaters["Mystical Staff"]
+
+        assert parallel == sequential
+        assert "Mystical Staff, -24, 50" in read_day(str(tmp_path / "par"), 29)
+
+    def test_parallel_record_refuses_lost_updaters(self, tmp_path, monkeypatch):
+        """Sin fork, jobs > 1 falla si los procesos no verían los updaters"""
+        monkeypatch.setattr(golden_master, "_pool_context",
+                            lambda: multiprocessing.get_context("spawn"))
+        items = [Item("Mystical Staff", 5, 10)]
+        UpdaterFactory.register("Mystical Staff", AgedBrieUpdater())
+        try:
+            with pytest.raises(GoldenMasterError, match="jobs=1"):
+                record(str(tmp_path / "par"), items, 30, chunk_days=10, jobs=2)
+        finally:
+            del UpdaterFactory._updaters["Mystical Staff"]
+
+    def test_missing_golden_master(self, tmp_path):
+        """Un directorio sin índice se informa con GoldenMasterError"""
+        with pytest.raises(GoldenMasterError):
+            verify(str(tmp_path))
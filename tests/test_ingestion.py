@@ -0,0 +1,104 @@
+# -*- coding: utf-8 -*-
+"""
+Tests para la ingesta con nombres internados y códigos de categoría
+"""
+import json
+
+import pytest
+from src.fuzz import run_differential
+from src.gilded_rose import UpdaterFactory, AgedBrieUpdater
+from src.ingestion import Ingestor
+
+
+BACKSTAGE = "Backstage passes to a TAFKAL80ETC concert"
+
+
+def ingested_engine(items):
+    """Motor para el fuzzer: inventario ingerido con códigos"""
+    return Ingestor().ingest_items(items)
+
+
+@pytest.mark.ingestion
+class TestIngestor:
+    """Tests del Ingestor y del inventario por códigos"""
+
+    def test_names_are_interned(self):
+        """Los items con el mismo nombre comparten un único string"""
+        rows = [("".join(["Backstage passes ", "to a TAFKAL80ETC concert"]), 10, 20)
+                for _ in range(3)]
+        inventory = Ingestor().ingest_rows(rows)
+
+        first = inventory.items[0].name
+        assert first == BACKSTAGE
+        assert all(item.name is first for item in inventory.items)
+
+    def test_each_distinct_name_is_classified_once(self):
+        """La caché LRU clasifica cada nombre distinto una sola vez"""
+        ingestor = Ingestor()
+        rows = [("Aged Brie", 5, 10), ("Normal", 5, 10)] * 50
+        ingestor.ingest_rows(rows)
+
+        stats = ingestor.cache_info()
+        assert stats.misses == 2
+        assert stats.hits == 98
+        assert stats.hit_rate == pytest.approx(0.98)
+
+    def test_codes_are_shared_by_category(self):
+        """Nombres distintos de una misma categoría comparten código"""
+        inventory = Ingestor().ingest_rows([
+            ("Conjured Mana Cake", 3, 6),
+            ("Conjured Dark Blade", 3, 6),
+            ("+5 Dexterity Vest", 3, 6),
+            ("Elixir of the Mongoose", 3, 6),
+            ("Aged Brie", 3, 6),
+        ])
+
+        assert inventory.codes[0] == inventory.codes[1]
+        assert inventory.codes[2] == inventory.codes[3]
+        assert len(set(inventory.codes)) == 3
+
+    def test_report_uses_category_codes(self):
+        """El reporte agrupa por categoría"""
+        inventory = Ingestor().ingest_rows([
+            ("Aged Brie", 3, 10), ("Aged Brie", 3, 5), ("Normal", 3, 7),
+        ])
+
+        assert inventory.report() == {
+            "AgedBrieUpdater": (2, 15),
+            "NormalItemUpdater": (1, 7),
+        }
+        assert sorted(inventory.count_by_category()) == [1, 2]
+
+    def test_clear_cache_after_registering_updaters(self):
+        """clear_cache permite reclasificar tras registrar un updater"""
+        ingestor = Ingestor()
+        before = ingestor.ingest_rows([("Mystical Staff", 5, 10)])
+        UpdaterFactory.register("Mystical Staff", AgedBrieUpdater())
+        try:
+            ingestor.clear_cache()
+            after = ingestor.ingest_rows([("Mystical Staff", 5, 10)])
+        finally:
+            del UpdaterFactory._updaters["Mystical Staff"]
+
+        assert before.codes != after.codes
+        after.update_quality()
+        assert after.items[0].quality == 11
+
+    def test_ingest_file(self, tmp_path):
+        """Se pueden ingerir filas desde un archivo JSON"""
+        path = tmp_path / "inventory.json"
+        path.write_text(json.dumps([["Aged Brie", 2, 0], [BACKSTAGE, 5, 49]]))
+
+        inventory = Ingestor().ingest_file(str(path))
+        inventory.update_quality()
+
+        assert [repr(item) for item in inventory.items] == [
+            "Aged Brie, 1, 1", BACKSTAGE + ", 4, 50",
+        ]
+
+    @pytest.mark.fuzz
+    def test_matches_reference_under_fuzzing(self):
+        """La actualización por códigos no diverge de la referencia"""
+        result = run_differential(ingested_engine, runs=100, time_budget=2.0)
+
+        assert result.ok, result.divergence
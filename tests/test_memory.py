@@ -0,0 +1,162 @@
+# -*- coding: utf-8 -*-
+"""
+Tests para el seguimiento de memoria por fase y la opción --memory
+"""
+import io
+import time
+import tracemalloc
+from contextlib import redirect_stderr, redirect_stdout
+
+import pytest
+from src import texttest_fixture
+from src.cli import MultiRecorder, recorder_from_argv
+from src.gilded_rose import GildedRose, Item
+from src.memory import MemoryBudgetExceeded, MemoryTracker, parse_size
+
+
+def run_fixture(argv):
+    out = io.StringIO()
+    err = io.StringIO()
+    with redirect_stdout(out), redirect_stderr(err):
+        texttest_fixture.main(argv)
+    return out.getvalue(), err.getvalue()
+
+
+@pytest.mark.memory
+class TestMemoryTracker:
+    """Tests del MemoryTracker"""
+
+    def test_phases_are_measured_separately(self):
+        """Cada fase acumula llamadas, bytes y bloques netos"""
+        with MemoryTracker() as tracker:
+            with tracker.phase("load"):
+                items = [Item("Aged Brie", 5, 1) for _ in range(5000)]
+            for _ in range(3):
+                with tracker.phase("update"):
+                    GildedRose(items).update_quality()
+
+        load = tracker.phases["load"]
+        update = tracker.phases["update"]
+        assert load.calls == 1 and update.calls == 3
+        assert load.net_bytes > 5000 * 48
+        assert load.net_blocks >= 5000
+        assert abs(update.net_bytes) < load.net_bytes / 10
+        assert load.peak_rss is None or load.peak_rss > 0
+        assert not tracemalloc.is_tracing()
+
+    def test_attribution_by_module_and_line(self):
+        """El pico se atribuye al módulo y la línea que asignaron"""
+        with MemoryTracker() as tracker:
+            with tracker.phase("load"):
+                items = [Item("Elixir", 5, 7) for _ in range(5000)]
+
+        module, size, count = tracker.top_modules(1)[0]
+        assert module.endswith("test_memory.py")
+        assert count >= 5000
+        assert any("test_memory.py:" in label for label, _, _ in tracker.top_lines())
+        assert len(items) == 5000
+
+    def test_budget_fails_fast_with_report(self):
+        """Superar el presupuesto interrumpe en la fase que lo supera"""
+        tracker = MemoryTracker(budget=parse_size("100K")).start()
+        try:
+            with pytest.raises(MemoryBudgetExceeded) as raised:
+                with tracker.phase("load"):
+                    items = [Item("Aged Brie", 5, 1) for _ in range(5000)]
+                with tracker.phase("update"):
+                    GildedRose(items).update_quality()
+        finally:
+            tracker.stop()
+
+        error = raised.value
+        assert error.phase == "load"
+        assert error.peak > error.budget == 100 * 1024
+        assert "Presupuesto: 100.0 KB" in error.report
+        assert "test_memory.py" in error.report
+        assert "update" not in tracker.phases
+
+    def test_budget_is_enforced_during_the_phase(self):
+        """Una fase que no termina de crecer falla sin llegar a su final"""
+        data = []
+        with MemoryTracker(budget=parse_size("1M"), interval=0.001) as tracker:
+            with pytest.raises(MemoryBudgetExceeded) as raised:
+                with tracker.phase("load"):
+                    for index in range(20000):
+                        data.append(bytes(1000))
+                        if index % 100 == 0:
+                            time.sleep(0.001)
+
+        assert raised.value.phase == "load"
+        assert len(data) < 20000
+        assert "test_memory.py" in raised.value.report
+
+    def test_nested_phases_keep_outer_peak(self):
+        """Una fase interna no borra el pico de la externa"""
+        with MemoryTracker() as tracker:
+            with tracker.phase("outer"):
+                temporary = [Item("X", 1, 1) for _ in range(5000)]
+                del temporary
+                with tracker.phase("inner"):
+                    pass
+
+        assert tracker.phases["outer"].peak_bytes > tracker.phases["inner"].peak_bytes
+
+    @pytest.mark.parametrize("text, expected", [
+        ("1000", 1000), ("512K", 512 * 1024), ("2MB", 2 * 2 ** 20), ("1.5g", 3 * 2 ** 29),
+    ])
+    def test_parse_size(self, text, expected):
+        """Los tamaños aceptan sufijos K, M y G"""
+        assert parse_size(text) == expected
+
+    def test_parse_size_rejects_garbage(self):
+        with pytest.raises(ValueError):
+            parse_size("mucho")
+
+
+@pytest.mark.memory
+class TestMemoryOption:
+    """Tests de --memory y --memory-budget en los puntos de entrada"""
+
+    def test_memory_report_keeps_stdout(self):
+        """--memory reporta por stderr sin cambiar la salida del fixture"""
+        plain, _ = run_fixture(["5"])
+        out, err = run_fixture(["5", "--memory"])
+
+        assert out == plain
+        for phase in ("load", "update", "render"):
+            assert phase in err
+        assert "RSS pico" in err
+
+    def test_memory_budget_exits_with_report(self):
+        """--memory-budget demasiado bajo termina con el reporte"""
+        with pytest.raises(SystemExit) as raised:
+            run_fixture(["5", "--memory-budget", "1K"])
+
+        message = str(raised.value.code)
+        assert message.startswith("Presupuesto de memoria excedido: la fase 'load'")
+        assert "src/texttest_fixture.py" in message
+        assert not tracemalloc.is_tracing()
+
+    def test_profile_is_written_when_budget_is_exceeded(self, tmp_path):
+        """Con --profile y --memory-budget el perfil se escribe aunque se exceda"""
+        path = tmp_path / "perfil.txt"
+        with pytest.raises(SystemExit):
+            run_fixture(["--profile", str(path), "5", "--memory-budget", "1K"])
+
+        assert path.exists()
+        assert not tracemalloc.is_tracing()
+
+    def test_invalid_budget(self):
+        with pytest.raises(SystemExit):
+            recorder_from_argv(["--memory-budget", "muchos"])
+
+    def test_profile_and_memory_combine(self, tmp_path):
+        """--profile y --memory se pueden pedir juntos"""
+        argv = ["--profile", str(tmp_path / "perfil.txt"), "--memory", "3"]
+        recorder = recorder_from_argv(argv)
+        try:
+            assert isinstance(recorder, MultiRecorder)
+            assert argv == ["3"]
+        finally:
+            with redirect_stderr(io.StringIO()):
+                recorder.finish()
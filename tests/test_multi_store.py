@@ -0,0 +1,111 @@
+# -*- coding: utf-8 -*-
+"""
+Tests para el contenedor de múltiples tiendas
+"""
+import pytest
+from src.fuzz import run_differential
+from src.gilded_rose import Item, GildedRose, UpdaterFactory, AgedBrieUpdater
+from src.multi_store import MultiStore
+
+
+def _rows():
+    return [
+        ("+5 Dexterity Vest", 10, 20),
+        ("Aged Brie", 2, 0),
+        ("Sulfuras, Hand of Ragnaros", 0, 80),
+        ("Backstage passes to a TAFKAL80ETC concert", 11, 40),
+        ("Conjured Mana Cake", 1, 6),
+    ]
+
+
+def split_stores_engine(items):
+    """Motor para el fuzzer: reparte los items en tiendas de 3"""
+    multi_store = MultiStore()
+    for start in range(0, len(items), 3):
+        multi_store.add_store("store-%s" % start, items[start:start + 3])
+    return multi_store
+
+
+@pytest.mark.integration
+class TestMultiStore:
+    """Tests del MultiStore y sus vistas por tienda"""
+
+    def test_single_pass_matches_separate_instances(self):
+        """Una pasada del MultiStore equivale a un GildedRose por tienda"""
+        multi_store = MultiStore()
+        separate = []
+        for name in ("norte", "sur", "este"):
+            multi_store.add_store(name, [Item(*row) for row in _rows()])
+            separate.append(GildedRose([Item(*row) for row in _rows()]))
+
+        for _ in range(20):
+            multi_store.update_quality()
+            for gr in separate:
+                gr.update_quality()
+
+        for view, gr in zip(multi_store.stores, separate):
+            assert [repr(i) for i in view] == [repr(i) for i in gr.items]
+
+    def test_store_view_only_updates_its_items(self):
+        """update_quality de una vista no toca otras tiendas"""
+        multi_store = MultiStore()
+        norte = multi_store.add_store("norte", [Item("Normal", 5, 10)])
+        sur = multi_store.add_store("sur", [Item("Normal", 5, 10)])
+
+        norte.update_quality()
+
+        assert norte[0].quality == 9
+        assert sur[0].quality == 10
+        assert multi_store.store("sur") is sur
+
+    def test_per_store_stats(self):
+        """Cada tienda expone sus propias estadísticas"""
+        multi_store = MultiStore()
+        multi_store.add_store("norte", [Item("Normal", -1, 10), Item("Aged Brie", 3, 20)])
+        multi_store.add_store("vacia", [])
+
+        stats = multi_store.stats()
+
+        assert stats["norte"] == {
+            "count": 2, "expired": 1, "total_quality": 30, "average_quality": 15.0,
+        }
+        assert stats["vacia"]["count"] == 0
+
+    def test_duplicate_store_name_is_rejected(self):
+        """No se pueden registrar dos tiendas con el mismo nombre"""
+        multi_store = MultiStore()
+        multi_store.add_store("norte", [])
+
+        with pytest.raises(ValueError):
+            multi_store.add_store("norte", [])
+
+    @pytest.mark.edge_case
+    def test_view_index_bounds(self):
+        """Las vistas no exponen items de otras tiendas"""
+        multi_store = MultiStore()
+        norte = multi_store.add_store("norte", [Item("A", 1, 1)])
+        multi_store.add_store("sur", [Item("B", 1, 1)])
+
+        assert norte[-1].name == "A"
+        with pytest.raises(IndexError):
+            norte[1]
+
+    def test_reclassify_picks_up_new_updaters(self):
+        """reclassify aplica updaters registrados después de añadir la tienda"""
+        multi_store = MultiStore()
+        view = multi_store.add_store("norte", [Item("Mystical Staff", 5, 10)])
+        UpdaterFactory._updaters["Mystical Staff"] = AgedBrieUpdater()
+        try:
+            multi_store.reclassify()
+            multi_store.update_quality()
+        finally:
+            del UpdaterFactory._updaters["Mystical Staff"]
+
+        assert view[0].quality == 11
+
+    @pytest.mark.fuzz
+    def test_matches_reference_under_fuzzing(self):
+        """El MultiStore no diverge de la referencia"""
+        result = run_differential(split_stores_engine, runs=100, time_budget=2.0)
+
+        assert result.ok, result.divergence
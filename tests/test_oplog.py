@@ -0,0 +1,177 @@
+# -*- coding: utf-8 -*-
+"""
+Tests para el log de operaciones y la réplica que lo reproduce
+"""
+import random
+
+import pytest
+from src import oplog
+from src.fuzz import generate_inventory
+from src.gilded_rose import Item
+from src.oplog import LoggedGildedRose, OperationLog, OplogError, Replica
+
+
+def rows(items):
+    return [(item.name, item.sell_in, item.quality) for item in items]
+
+
+def random_operations(primary, rng, days):
+    """Mezcla de ticks y mutaciones sobre el primario"""
+    for _ in range(days):
+        for _ in range(rng.randint(0, 4)):
+            choice = rng.random()
+            if choice < 0.4 or not primary.items:
+                name, sell_in, quality = generate_inventory(rng, 1)[0]
+                primary.add(name, sell_in, quality)
+            elif choice < 0.7:
+                primary.remove(rng.randrange(len(primary.items)))
+            else:
+                primary.set(rng.randrange(len(primary.items)),
+                            quality=rng.randint(0, 50))
+        primary.update_quality()
+
+
+@pytest.fixture
+def log_path(tmp_path):
+    return str(tmp_path / "inventory.oplog")
+
+
+@pytest.mark.oplog
+class TestOperationLog:
+    """Tests del primario con log y de la réplica"""
+
+    def test_replica_reaches_primary_state(self, log_path):
+        """La réplica reproduce ticks y mutaciones de forma determinista"""
+        rng = random.Random(7)
+        items = [Item(*row) for row in generate_inventory(rng, 30)]
+        primary = LoggedGildedRose(items, OperationLog(log_path, fsync="never"))
+        replica = Replica(log_path)
+
+        for _ in range(5):
+            random_operations(primary, rng, days=10)
+            primary.flush()
+            replica.poll()
+            assert rows(replica.items) == rows(primary.items)
+
+        assert replica.lsn == primary.lsn
+        assert replica.day == primary.day == 50
+
+    def test_batching_hides_records_until_flush(self, log_path):
+        """La réplica solo ve los lotes ya escritos"""
+        primary = LoggedGildedRose([], OperationLog(log_path, fsync="never", batch_size=4))
+        replica = Replica(log_path)
+
+        for _ in range(3):
+            primary.add("Aged Brie", 2, 0)
+        assert replica.poll() == 0
+
+        primary.update_quality()
+        assert replica.poll() == 4
+        assert rows(replica.items) == [("Aged Brie", 1, 1)] * 3
+
+    @pytest.mark.parametrize("policy, expected", [("always", 6), ("batch", 2), ("never", 0)])
+    def test_fsync_policies(self, log_path, monkeypatch, policy, expected):
+        """Cada política sincroniza por registro, por lote o nunca"""
+        calls = []
+        monkeypatch.setattr(oplog.os, "fsync", calls.append)
+        log = OperationLog(log_path, fsync=policy, batch_size=3)
+        for _ in range(6):
+            log.append(["T"])
+
+        assert len(calls) == log.fsyncs == expected
+
+    def test_unknown_fsync_policy(self, log_path):
+        """Una política desconocida se rechaza"""
+        with pytest.raises(ValueError):
+            OperationLog(log_path, fsync="sometimes")
+
+    def test_compaction_keeps_replicas_in_sync(self, log_path):
+        """Tras compactar, el log es una instantánea y las réplicas siguen"""
+        rng = random.Random(11)
+        primary = LoggedGildedRose(
+            [Item(*row) for row in generate_inventory(rng, 20)],
+            OperationLog(log_path, fsync="never"),
+        )
+        follower = Replica(log_path)
+        random_operations(primary, rng, days=20)
+        primary.flush()
+        follower.poll()
+        size_before = primary.log.size()
+
+        random_operations(primary, rng, days=5)
+        primary.compact()
+        random_operations(primary, rng, days=5)
+        primary.flush()
+        follower.poll()
+        late = Replica(log_path)
+        late.poll()
+
+        assert primary.log.size() < size_before
+        assert rows(follower.items) == rows(late.items) == rows(primary.items)
+        assert follower.lsn == late.lsn == primary.lsn
+
+    def test_recover_discards_torn_tail_and_continues(self, log_path):
+        """recover() ignora una línea incompleta y sigue escribiendo"""
+        primary = LoggedGildedRose([Item("Aged Brie", 2, 0)], OperationLog(log_path))
+        primary.update_quality()
+        primary.close()
+        with open(log_path, "ab") as handle:
+            handle.write(b'["A","Elix')
+
+        recovered = LoggedGildedRose.recover(log_path, fsync="never")
+        recovered.update_quality()
+        recovered.flush()
+        replica = Replica(log_path)
+        replica.poll()
+
+        assert rows(recovered.items) == [("Aged Brie", 0, 2)]
+        assert rows(replica.items) == rows(recovered.items)
+        assert replica.day == recovered.day == 2
+
+    def test_corrupt_record_raises(self, log_path):
+        """Un registro ilegible se informa con su posición"""
+        with open(log_path, "wb") as handle:
+            handle.write(b'["S",0,0,[]]\n["X"]\n')
+
+        with pytest.raises(OplogError, match="byte 13"):
+            Replica(log_path).poll()
+
+    def test_corrupt_record_is_not_skipped_on_retry(self, log_path):
+        """Tras un registro ilegible, un nuevo poll() no salta los siguientes"""
+        with open(log_path, "wb") as handle:
+            handle.write(b'["S",0,0,[["Aged Brie",2,0]]]\n["X"]\n["T"]\n')
+        replica = Replica(log_path)
+
+        for _ in range(2):
+            with pytest.raises(OplogError, match="byte 30"):
+                replica.poll()
+        assert replica.lsn == 0 and replica.offset == 30
+        assert rows(replica.items) == [("Aged Brie", 2, 0)]
+
+    def test_existing_log_requires_recover(self, log_path):
+        """Abrir un log con registros desde lsn 0 se rechaza: hay que usar recover()"""
+        primary = LoggedGildedRose([Item("Aged Brie", 2, 0)], OperationLog(log_path))
+        primary.update_quality()
+        primary.close()
+
+        log = OperationLog(log_path)
+        with pytest.raises(OplogError, match="recover"):
+            LoggedGildedRose([Item("Elixir of the Mongoose", 5, 7)], log)
+        log.close()
+
+        recovered = LoggedGildedRose.recover(log_path)
+        assert rows(recovered.items) == [("Aged Brie", 1, 1)]
+        recovered.close()
+
+    def test_recover_log_with_only_the_snapshot(self, log_path):
+        """Un log sin operaciones tras la instantánea inicial se recupera"""
+        LoggedGildedRose([Item("Aged Brie", 2, 0)], OperationLog(log_path), day=3).close()
+
+        recovered = LoggedGildedRose.recover(log_path, fsync="never")
+        recovered.update_quality()
+        recovered.close()
+        replica = Replica(log_path)
+        replica.poll()
+
+        assert rows(replica.items) == rows(recovered.items) == [("Aged Brie", 1, 1)]
+        assert replica.day == recovered.day == 4
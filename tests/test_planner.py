@@ -0,0 +1,157 @@
+# -*- coding: utf-8 -*-
+"""
+Tests para el planificador de liquidación
+"""
+import random
+
+import pytest
+from src.fuzz import generate_inventory
+from src.gilded_rose import Item, GildedRose
+from src.planner import SellOffPlanner, ValueCurve
+
+
+def brute_force_losses(items, horizon):
+    """Pérdida de cada item simulando una copia horizon días"""
+    losses = []
+    for item in items:
+        copy = Item(item.name, item.sell_in, item.quality)
+        gr = GildedRose([copy])
+        for _ in range(horizon):
+            gr.update_quality()
+        losses.append(item.quality - copy.quality)
+    return losses
+
+
+@pytest.mark.planner
+class TestValueCurve:
+    """Tests de las curvas de valor"""
+
+    def test_curve_follows_the_updater(self):
+        """La curva reproduce los estados de update_quality día a día"""
+        item = Item("Backstage passes to a TAFKAL80ETC concert", 12, 30)
+        curve = ValueCurve(item)
+        gr = GildedRose([item])
+
+        for day in range(1, 20):
+            gr.update_quality()
+            assert (curve.sell_in_at(day), curve.quality_at(day)) == (item.sell_in, item.quality)
+
+
+@pytest.mark.planner
+class TestSellOffPlanner:
+    """Tests del ranking incremental de liquidación"""
+
+    @pytest.mark.parametrize("horizon", [1, 3, 7])
+    def test_top_k_matches_brute_force_every_day(self, horizon):
+        """El ranking incremental coincide con recalcular desde cero"""
+        items = [Item(*row) for row in generate_inventory(random.Random(3), 200)]
+        planner = SellOffPlanner(items, horizon=horizon)
+        gr = GildedRose(items)
+
+        for _ in range(40):
+            expected = brute_force_losses(items, horizon)
+            top = planner.top(15)
+
+            assert [loss for _, loss in top] == sorted(expected, reverse=True)[:15]
+            for item, loss in top:
+                assert expected[items.index(item)] == loss
+
+            gr.update_quality()
+            planner.advance()
+
+    def test_sells_expiring_items_first(self):
+        """Las entradas a punto de perder su valor encabezan la lista"""
+        concert = Item("Backstage passes to a TAFKAL80ETC concert", 2, 40)
+        brie = Item("Aged Brie", 10, 10)
+        vest = Item("+5 Dexterity Vest", 10, 20)
+        planner = SellOffPlanner([brie, vest, concert], horizon=3)
+
+        ranking = planner.top(3)
+
+        assert [item for item, _ in ranking] == [concert, vest, brie]
+        assert planner.loss(brie) < 0
+
+    def test_only_changed_items_are_recomputed(self):
+        """advance() no recalcula items cuya pérdida no cambia"""
+        items = [Item("+5 Dexterity Vest", 30, 50) for _ in range(100)]
+        planner = SellOffPlanner(items, horizon=5)
+        initial = planner.recomputed
+        gr = GildedRose(items)
+
+        for _ in range(10):
+            gr.update_quality()
+            planner.advance()
+
+        assert planner.recomputed == initial
+
+    def test_add_and_remove(self):
+        """Los items añadidos y retirados se reflejan en el ranking"""
+        vest = Item("+5 Dexterity Vest", 10, 20)
+        cake = Item("Conjured Mana Cake", 1, 20)
+        planner = SellOffPlanner([vest], horizon=2)
+
+        planner.add(cake)
+        assert planner.top(1)[0][0] is cake
+
+        planner.remove(cake)
+        assert planner.top(5) == [(vest, 2)]
+        assert len(planner) == 1
+
+    @pytest.mark.edge_case
+    def test_external_mutation_is_detected(self):
+        """Un item modificado que top() saca del heap se recalcula"""
+        vest = Item("+5 Dexterity Vest", 10, 20)
+        elixir = Item("Elixir of the Mongoose", 10, 20)
+        planner = SellOffPlanner([vest, elixir], horizon=3)
+
+        vest.quality = 1
+
+        assert planner.top(2) == [(elixir, 3), (vest, 1)]
+
+    @pytest.mark.edge_case
+    def test_refresh_moves_item_up(self):
+        """refresh() sube en el ranking un item que ahora perderá más"""
+        cake = Item("Conjured Mana Cake", 10, 2)
+        vest = Item("+5 Dexterity Vest", 10, 20)
+        planner = SellOffPlanner([cake, vest], horizon=3)
+
+        cake.quality = 40
+        planner.refresh(cake)
+
+        assert planner.top(1) == [(cake, 6)]
+
+    @pytest.mark.edge_case
+    def test_unrefreshed_change_is_detected_at_next_visit(self):
+        """Sin refresh(), el cambio se detecta en la próxima visita agendada"""
+        cake = Item("Conjured Mana Cake", 10, 2)
+        vest = Item("+5 Dexterity Vest", 10, 20)
+        planner = SellOffPlanner([cake, vest], horizon=3)
+
+        cake.quality = 40
+        assert planner.top(1) == [(vest, 3)]
+
+        GildedRose([cake, vest]).update_quality()
+        planner.advance()
+
+        assert planner.top(1) == [(cake, 6)]
+
+    @pytest.mark.edge_case
+    def test_top_survives_heap_compaction_during_refresh(self):
+        """Si refresh() compacta el heap dentro de top(), no se pierden items"""
+        cake = Item("Conjured Mana Cake", 10, 40)
+        vest = Item("+5 Dexterity Vest", 10, 20)
+        sulfuras = Item("Sulfuras, Hand of Ragnaros", 0, 80)
+        planner = SellOffPlanner([cake, vest, sulfuras], horizon=3)
+        while len(planner._heap) < 70:
+            planner.refresh(sulfuras)
+        planner.remove(sulfuras)
+        vest.quality = 19
+
+        assert planner.top(3) == [(cake, 6), (vest, 3)]
+        assert planner.top(3) == [(cake, 6), (vest, 3)]
+        assert len(planner._heap) == 2
+
+    def test_invalid_horizon(self):
+        """El horizonte debe ser positivo"""
+        with pytest.raises(ValueError):
+            SellOffPlanner(horizon=0)
@@ -0,0 +1,104 @@
+# -*- coding: utf-8 -*-
+"""
+Tests para el perfilador por muestreo y la opción --profile
+"""
+import json
+
+import pytest
+import main as main_module
+from src import texttest_fixture
+from src.cli import NullRecorder, pop_option, recorder_from_argv
+from src.gilded_rose import Item, GildedRose
+from src.profiling import SamplingProfiler
+
+
+def _busy_update(profiler, size=20000, days=10):
+    items = [Item("Aged Brie", 5, 1) for _ in range(size)]
+    gr = GildedRose(items)
+    with profiler.phase("update"):
+        for _ in range(days):
+            gr.update_quality()
+
+
+@pytest.mark.profiling
+class TestSamplingProfiler:
+    """Tests del perfilador por muestreo"""
+
+    def test_samples_are_grouped_by_phase(self):
+        """Las muestras de una fase con carga se atribuyen a esa fase"""
+        with SamplingProfiler(interval=0.0005) as profiler:
+            _busy_update(profiler)
+
+        phases = {phase: count for phase, _, count in profiler.phase_summary()}
+        assert profiler.sample_count > 0
+        assert phases["update"] > 0
+        assert profiler.phase_seconds["update"] > 0
+
+    def test_collapsed_stacks_format(self):
+        """Cada línea es 'fase;marcos... N'"""
+        with SamplingProfiler(interval=0.0005) as profiler:
+            _busy_update(profiler)
+
+        lines = profiler.collapsed().splitlines()
+        assert lines
+        for line in lines:
+            stack, count = line.rsplit(" ", 1)
+            assert stack.startswith(("update;", "(sin fase)"))
+            assert int(count) > 0
+        assert any("update_quality (gilded_rose.py" in line for line in lines)
+
+    def test_speedscope_export(self, tmp_path):
+        """El JSON de speedscope referencia marcos compartidos válidos"""
+        with SamplingProfiler(interval=0.0005) as profiler:
+            _busy_update(profiler)
+        path = tmp_path / "profile.json"
+        profiler.write(str(path))
+
+        data = json.loads(path.read_text())
+        frames = data["shared"]["frames"]
+        profile = next(p for p in data["profiles"] if p["name"] == "update")
+        assert profile["type"] == "sampled"
+        assert len(profile["samples"]) == len(profile["weights"])
+        assert all(0 <= index < len(frames) for sample in profile["samples"] for index in sample)
+
+    def test_unknown_format_is_rejected(self, tmp_path):
+        """Un formato desconocido produce un error claro"""
+        with pytest.raises(ValueError):
+            SamplingProfiler().write(str(tmp_path / "p.txt"), "pprof")
+
+
+@pytest.mark.profiling
+class TestProfileOption:
+    """Tests de --profile en los puntos de entrada"""
+
+    @pytest.mark.parametrize("argv,expected,rest", [
+        (["--profile", "p.txt", "5"], "p.txt", ["5"]),
+        (["5", "--profile=p.json"], "p.json", ["5"]),
+        (["5"], None, ["5"]),
+    ])
+    def test_pop_option(self, argv, expected, rest):
+        """pop_option acepta '--opcion valor' y '--opcion=valor'"""
+        assert pop_option(argv, "--profile") == expected
+        assert argv == rest
+
+    def test_without_profile_uses_null_recorder(self):
+        """Sin --profile no se carga el perfilador"""
+        assert isinstance(recorder_from_argv(["3"]), NullRecorder)
+
+    @pytest.mark.parametrize("entry_point,argv", [
+        (main_module.main, []),
+        (texttest_fixture.main, ["10"]),
+    ])
+    def test_profile_keeps_stdout_and_writes_file(self, capsys, tmp_path, entry_point, argv):
+        """--profile no cambia la salida y exporta el perfil y el resumen"""
+        entry_point(list(argv))
+        plain = capsys.readouterr().out
+
+        path = tmp_path / "profile.collapsed"
+        entry_point(list(argv) + ["--profile", str(path)])
+        captured = capsys.readouterr()
+
+        assert captured.out == plain
+        assert path.exists()
+        for phase in ("load", "update", "render"):
+            assert phase in captured.err
@@ -0,0 +1,149 @@
+# -*- coding: utf-8 -*-
+"""
+Tests para las reglas de degradación cargadas desde archivo
+"""
+import json
+import os
+
+import pytest
+from src.fuzz import run_differential
+from src.gilded_rose import Item, GildedRose, UpdaterFactory
+from src.rules import RulesError, RulesFile, load_rules, parse_rules
+
+
+RULES_DIR = os.path.join(os.path.dirname(__file__), os.pardir, "rules")
+BUILTIN_RULES = os.path.join(RULES_DIR, "builtin.json")
+EXAMPLE_RULES = os.path.join(RULES_DIR, "example.toml")
+
+
+class RulesEngine(GildedRose):
+    """Motor para el fuzzer: usa solo las reglas compiladas de builtin.json"""
+
+    rule_set = load_rules(BUILTIN_RULES)
+
+    def update_quality(self):
+        for item in self.items:
+            self.rule_set.get_updater(item).update(item)
+
+
+@pytest.fixture
+def rules_file(tmp_path):
+    """Escribe un archivo de reglas temporal y retorna su RulesFile"""
+    path = tmp_path / "rules.json"
+    writes = []
+
+    def _write(categories):
+        path.write_text(json.dumps({"categories": categories}))
+        # Fuerza un sello distinto aunque el sistema de archivos sea lento
+        stamp = os.stat(path).st_mtime_ns + len(writes) * 10 ** 9
+        os.utime(path, ns=(stamp, stamp))
+        writes.append(stamp)
+        return RulesFile(str(path))
+
+    return _write
+
+
+@pytest.mark.rules
+class TestRulesCompilation:
+    """Tests de validación y compilación de reglas"""
+
+    def test_builtin_rules_match_hand_written_updaters(self):
+        """Las reglas de builtin.json reproducen a los updaters escritos a mano"""
+        result = run_differential(RulesEngine, runs=150, time_budget=2.0)
+
+        assert result.ok, result.divergence
+
+    def test_every_builtin_category_is_compiled(self):
+        """Ningún item de prueba cae en un updater escrito a mano"""
+        for name in ("Normal", "Aged Brie", "Conjured X", "Sulfuras, Hand of Ragnaros",
+                     "Backstage passes to a TAFKAL80ETC concert"):
+            assert type(RulesEngine.rule_set.get_updater(Item(name, 1, 1))).__name__ == "RuleUpdater"
+
+    @pytest.mark.parametrize("name,sell_in,quality,days,expected", [
+        ("Conjured Elixir of Haste", 2, 30, 4, 30 - 3 - 3 - 6 - 6),
+        ("Conjured Mana Cake", 2, 30, 4, 30 - 2 - 2 - 4 - 4),
+        ("Vintage Wine", 5, 90, 20, 100),
+        ("Backstage passes to the Midsummer Festival", 20, 10, 1, 12),
+        ("Backstage passes to the Midsummer Festival", 7, 10, 1, 14),
+        ("Backstage passes to the Midsummer Festival", 0, 10, 1, 0),
+    ])
+    def test_example_categories(self, name, sell_in, quality, days, expected):
+        """Las categorías de example.toml se comportan según su definición"""
+        rule_set = load_rules(EXAMPLE_RULES)
+        item = Item(name, sell_in, quality)
+        for _ in range(days):
+            rule_set.get_updater(item).update(item)
+
+        assert item.quality == expected
+
+    @pytest.mark.parametrize("categories", [
+        [{"match": {"exact": "A"}}],
+        [{"name": "a", "match": {"regex": "A"}}],
+        [{"name": "a", "match": {"prefix": ""}}],
+        [{"name": "a", "match": {"exact": "A"}, "delta": "1"}],
+        [{"name": "a", "match": {"exact": "A"}, "speed": 2}],
+        [{"name": "a", "match": {"exact": "A"}, "min_quality": 10, "max_quality": 5}],
+        [{"name": "a", "match": {"exact": "A"}, "expired_delta": 1, "expired_quality": 0}],
+        [{"name": "a", "match": {"exact": "A"}, "bands": [{"sell_in_below": 5}]}],
+        [{"name": "a", "match": {"exact": "A"}}, {"name": "a", "match": {"exact": "B"}}],
+        [{"name": "a", "match": {"exact": "A"}}, {"name": "b", "match": {"exact": "A"}}],
+    ])
+    def test_invalid_rules_are_rejected(self, categories):
+        """Las reglas inválidas se rechazan al cargar"""
+        with pytest.raises(RulesError):
+            parse_rules({"categories": categories})
+
+
+@pytest.mark.rules
+class TestRulesFile:
+    """Tests de instalación y recarga en caliente"""
+
+    def test_install_and_uninstall(self, rules_file):
+        """install() cambia el comportamiento de GildedRose y uninstall() lo restaura"""
+        rules = rules_file([{"name": "staff", "match": {"exact": "Staff"}, "delta": 2}])
+        original = UpdaterFactory._updaters
+        item = Item("Staff", 5, 10)
+
+        rules.install()
+        try:
+            GildedRose([item]).update_quality()
+        finally:
+            rules.uninstall()
+
+        assert item.quality == 12
+        assert UpdaterFactory._updaters is original
+        assert "Staff" not in UpdaterFactory._updaters
+
+    def test_hot_reload_between_ticks(self, rules_file):
+        """Un cambio en el archivo se aplica en el siguiente tick"""
+        rules = rules_file([{"name": "staff", "match": {"exact": "Staff"}, "delta": 2}])
+        item = Item("Staff", 5, 10)
+        gr = GildedRose([item])
+        rules.install()
+        try:
+            assert rules.reload_if_changed() is False
+            gr.update_quality()
+
+            rules_file([{"name": "staff", "match": {"exact": "Staff"}, "delta": 5}])
+            assert rules.reload_if_changed() is True
+            gr.update_quality()
+        finally:
+            rules.uninstall()
+
+        assert item.quality == 10 + 2 + 5
+
+    def test_invalid_reload_keeps_previous_rules(self, rules_file):
+        """Una recarga inválida se reporta una vez y conserva las reglas"""
+        rules = rules_file([{"name": "staff", "match": {"exact": "Staff"}, "delta": 2}])
+        rules.install()
+        try:
+            rules_file([{"name": "staff", "match": {"exact": "Staff"}, "delta": "x"}])
+            with pytest.raises(RulesError):
+                rules.reload_if_changed()
+            assert rules.reload_if_changed() is False
+
+            item = Item("Staff", 5, 10)
+            GildedRose([item]).update_quality()
+            assert item.quality == 12
+        finally:
+            rules.uninstall()
@@ -0,0 +1,72 @@
+# -*- coding: utf-8 -*-
+"""
+Tests de arranque: presupuesto de tiempo de import de los puntos de entrada
+"""
+import subprocess
+import sys
+
+import pytest
+
+
+# Presupuesto de import acumulado (microsegundos) de cada punto de entrada.
+# Holgado para no fallar en máquinas lentas, pero muy por debajo de lo que
+# costaría arrastrar un motor opcional (numpy, multiprocessing, ...).
+IMPORT_BUDGET_US = 50000
+
+# Módulos que los puntos de entrada solo pueden cargar bajo demanda
+LAZY_MODULES = [
+    "numpy",
+    "multiprocessing",
+    "concurrent.futures",
+    "threading",
+    "json",
+    "gzip",
+    "hashlib",
+    "tracemalloc",
+    "cProfile",
+    "socket",
+]
+
+ENTRY_POINTS = ["main", "src.texttest_fixture", "src.gilded_rose"]
+
+
+def _import_times(module):
+    """Importa el módulo en un proceso nuevo con -X importtime"""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import %s" % module],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        self_us, cumulative_us, name = [
+            part.strip() for part in line.split(":", 1)[1].split("|")
+        ]
+        # La primera línea es la cabecera ("self [us] | cumulative | ...")
+        if self_us.isdigit():
+            times[name] = int(cumulative_us)
+    return times
+
+
+@pytest.mark.startup
+class TestStartup:
+    """Tests para mantener ligero el arranque de los CLI"""
+
+    @pytest.mark.parametrize("module", ENTRY_POINTS)
+    def test_import_time_within_budget(self, module):
+        """El import acumulado del punto de entrada cabe en el presupuesto"""
+        times = _import_times(module)
+
+        assert module in times
+        assert times[module] <= IMPORT_BUDGET_US
+
+    @pytest.mark.parametrize("module", ENTRY_POINTS)
+    def test_optional_modules_are_not_imported_eagerly(self, module):
+        """Los motores opcionales no se cargan al importar el punto de entrada"""
+        times = _import_times(module)
+
+        for lazy in LAZY_MODULES:
+            assert lazy not in times, "%s importa %s al arrancar" % (module, lazy)